@@ -0,0 +1,151 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from Github import Github_Fetcher
+
+CACHE_PATH = os.getenv(
+    "GITHUB_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "github_cache.sqlite3")
+)
+# Entries younger than this are served without revalidation
+FRESH_SECONDS = int(os.getenv("GITHUB_CACHE_FRESH_SECONDS", 3600))
+# Entries older than this are always refetched
+TTL_SECONDS = int(os.getenv("GITHUB_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", 10000))
+
+
+class GithubCache:
+    """
+    Persistent cache of processed GitHub profiles keyed by username.
+
+    Each entry stores the [contribution_result, repo_result] pair together
+    with the user's change marker (updatedAt, latest pushedAt, repo count).
+    Stale entries are revalidated with a tiny marker query and only refetched
+    when the marker moved. Entries expire after TTL_SECONDS and the least
+    recently used ones are evicted beyond MAX_ENTRIES.
+    """
+
+    def __init__(self, path=CACHE_PATH, fresh_seconds=FRESH_SECONDS, ttl_seconds=TTL_SECONDS, max_entries=MAX_ENTRIES):
+        self.fresh_seconds = fresh_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                username TEXT PRIMARY KEY,
+                marker TEXT,
+                data TEXT NOT NULL,
+                validated_at REAL NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS profiles_accessed ON profiles (accessed_at)")
+        self.conn.commit()
+
+    def _rows(self, usernames):
+        placeholders = ",".join("?" * len(usernames))
+        cursor = self.conn.execute(
+            f"SELECT username, marker, data, validated_at, fetched_at FROM profiles WHERE username IN ({placeholders})",
+            list(usernames),
+        )
+        return {row[0]: row[1:] for row in cursor}
+
+    def lookup(self, usernames, pool=None):
+        """
+        Cached data for the given users ({username: [contributions, repos]}).
+        Users missing from the result must be fetched and stored with put().
+        """
+        usernames = [u.lower() for u in dict.fromkeys(usernames) if u]
+        if not usernames:
+            return {}
+        now = time.time()
+        with self.lock:
+            rows = self._rows(usernames)
+
+        found, to_revalidate = {}, {}
+        for username in usernames:
+            row = rows.get(username)
+            if row is None or now - row[3] > self.ttl_seconds:
+                continue
+            if now - row[2] <= self.fresh_seconds:
+                found[username] = json.loads(row[1])
+            else:
+                to_revalidate[username] = row
+
+        if to_revalidate:
+            markers = Github_Fetcher.fetch_markers(list(to_revalidate), pool)
+            for username, row in to_revalidate.items():
+                if markers.get(username) and markers[username] == row[0]:
+                    found[username] = json.loads(row[1])
+
+        with self.lock:
+            self.conn.executemany(
+                "UPDATE profiles SET accessed_at = ? WHERE username = ?",
+                [(now, username) for username in found],
+            )
+            self.conn.executemany(
+                "UPDATE profiles SET validated_at = ? WHERE username = ?",
+                [(now, username) for username in found if username in to_revalidate],
+            )
+            self.conn.commit()
+            self.stats["hits"] += len(found)
+            self.stats["revalidated"] += len([u for u in found if u in to_revalidate])
+            self.stats["misses"] += len(usernames) - len(found)
+        return found
+
+    def put(self, username, data, marker):
+        """Store a freshly fetched profile; error results are never cached."""
+        if not username or any(isinstance(part, dict) and "error" in part for part in data):
+            return
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO profiles (username, marker, data, validated_at, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (username.lower(), marker, json.dumps(data), now, now, now),
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        expired = self.conn.execute(
+            "DELETE FROM profiles WHERE fetched_at < ?", (time.time() - self.ttl_seconds,)
+        ).rowcount
+        overflow = self.conn.execute(
+            "DELETE FROM profiles WHERE username IN "
+            "(SELECT username FROM profiles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.stats["evictions"] += expired + overflow
+
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GithubCache()
+        return _cache
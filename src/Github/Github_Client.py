@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from Github import Github_Scraper, Token_Pool
+from Monitoring import metrics, tracing
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# "local" runs Github_Scraper in-process, "remote" calls the scraper service.
+# Defaults to local whenever GitHub tokens are configured.
+GITHUB_SCRAPER_MODE = (
+    os.getenv("GITHUB_SCRAPER_MODE") or ("local" if Token_Pool.tokens_from_env() else "remote")
+).lower()
+GITHUB_SCRAPER_URL = os.getenv(
+    "GITHUB_SCRAPER_URL", "http://ec2-16-170-253-54.eu-north-1.compute.amazonaws.com:8000/github/scrape"
+)
+GITHUB_SCRAPER_BATCH_URL = os.getenv("GITHUB_SCRAPER_BATCH_URL", GITHUB_SCRAPER_URL + "_batch")
+REMOTE_TIMEOUT = int(os.getenv("GITHUB_SCRAPER_TIMEOUT", 60))
+
+# Requests arriving within BATCH_WINDOW seconds are scraped together
+BATCH_SIZE = int(os.getenv("GITHUB_SCRAPE_BATCH_SIZE", 25))
+BATCH_WINDOW = float(os.getenv("GITHUB_SCRAPE_BATCH_WINDOW", 0.05))
+BATCH_WORKERS = int(os.getenv("GITHUB_SCRAPE_WORKERS", 4))
+
+
+def _remote_session():
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=BATCH_WORKERS * 2, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+session = _remote_session()
+
+
+def scrape_local(applicants):
+    return Github_Scraper.scrape_github_profiles(applicants)
+
+
+# Cleared the first time the scraper answers 404 on the batch endpoint (older deployments)
+_batch_endpoint = True
+
+
+def _scrape_remote_one(applicant_id, url):
+    response = session.post(
+        GITHUB_SCRAPER_URL, json={"applicant_id": applicant_id, "github_url": url},
+        headers=tracing.inject({}), timeout=REMOTE_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def scrape_remote(applicants):
+    """
+    One POST for the whole batch. A single applicant, or a scraper without
+    the batch endpoint, uses the original per-applicant endpoint.
+    """
+    global _batch_endpoint
+    if len(applicants) > 1 and _batch_endpoint:
+        payload = {"applicants": [{"applicant_id": applicant_id, "github_url": url} for applicant_id, url in applicants]}
+        response = session.post(GITHUB_SCRAPER_BATCH_URL, json=payload, headers=tracing.inject({}), timeout=REMOTE_TIMEOUT)
+        if response.status_code != 404:
+            response.raise_for_status()
+            return response.json()["results"]
+        logger.warning("⚠️ %s not found, falling back to per-applicant scraping", GITHUB_SCRAPER_BATCH_URL)
+        _batch_endpoint = False
+
+    return [_scrape_remote_one(applicant_id, url) for applicant_id, url in applicants]
+
+
+class GithubBatcher:
+    """
+    Coalesces single-applicant scrape requests from many threads into
+    batches: a batch is sent when BATCH_SIZE requests are queued or
+    BATCH_WINDOW seconds after the first one, on a small worker pool.
+    """
+
+    def __init__(self, backend, batch_size=BATCH_SIZE, window=BATCH_WINDOW, workers=BATCH_WORKERS):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.window = window
+        self.pending = []
+        self.timer = None
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="github-batch")
+
+    def submit(self, applicant_id, url):
+        future = Future()
+        with self.lock:
+            # The submitter's span becomes the parent of the batch's span
+            self.pending.append((applicant_id, url, future, tracing.current_context()))
+            if len(self.pending) >= self.batch_size:
+                self._flush_locked()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.window, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        return future
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            self.executor.submit(self._run, batch)
+
+    def _run(self, batch):
+        try:
+            with tracing.span("github_batch", parent=batch[0][3], size=len(batch)), metrics.timed("github"):
+                results = self.backend([(applicant_id, url) for applicant_id, url, _, _ in batch])
+            for (_, _, future, _), result in zip(batch, results):
+                future.set_result(result)
+            error = RuntimeError(f"GitHub backend returned {len(results)} results for {len(batch)} applicants")
+        # BaseException too: a SystemExit from the backend must not leave submitters waiting
+        except BaseException as e:
+            error = e
+        for _, _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+_batcher = GithubBatcher(scrape_local if GITHUB_SCRAPER_MODE == "local" else scrape_remote)
+metrics.QUEUE_DEPTH.labels("github_batch").set_function(lambda: len(_batcher.pending))
+
+
+def submit(applicant_id, github_url):
+    """Queue a scrape; returns a Future resolving to the {"id", "source", "data"} result."""
+    return _batcher.submit(str(applicant_id), github_url)
+
+
+def scrape(applicant_id, github_url, timeout=None):
+    return submit(applicant_id, github_url).result(timeout=timeout)
+
+
+async def scrape_async(applicant_id, github_url):
+    return await asyncio.wrap_future(submit(applicant_id, github_url))
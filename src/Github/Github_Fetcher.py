@@ -0,0 +1,452 @@
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from Github import Token_Pool
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+REQUEST_TIMEOUT = int(os.getenv("GITHUB_REQUEST_TIMEOUT", 30))
+MAX_RETRIES = 3
+
+# Repositories page sizing
+MIN_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+DEFAULT_PAGE_SIZE = int(os.getenv("GITHUB_PAGE_SIZE", 50))
+# Stop paging after this many repositories per user
+MAX_REPOS = int(os.getenv("GITHUB_MAX_REPOS", 300))
+# Pages slower than this are treated as "too heavy" and shrink the next one
+SLOW_PAGE_SECONDS = 10
+
+README_BATCH_SIZE = 20
+# README text is only loaded for the top repositories of each user, and only
+# if the blob is small enough; the text is truncated before analysis
+README_TOP_REPOS = int(os.getenv("GITHUB_README_TOP_REPOS", 5))
+README_MAX_BYTES = int(os.getenv("GITHUB_README_MAX_BYTES", 100_000))
+README_MAX_CHARS = int(os.getenv("GITHUB_README_MAX_CHARS", 8000))
+# Users per aliased profile query, and the first repositories page for each of them
+PROFILE_BATCH_SIZE = int(os.getenv("GITHUB_PROFILE_BATCH_SIZE", 5))
+PROFILE_PAGE_SIZE = int(os.getenv("GITHUB_PROFILE_PAGE_SIZE", 30))
+# Users per change-marker (cache revalidation) query
+MARKER_BATCH_SIZE = 50
+# Below this many points left across all tokens, pages are kept small
+LOW_BUDGET_POINTS = 200
+FETCH_WORKERS = int(os.getenv("GITHUB_FETCH_WORKERS", 8))
+
+REPO_FIELDS = """
+    name
+    nameWithOwner
+    description
+    url
+    stargazerCount
+    forkCount
+    watchers {
+        totalCount
+    }
+    languages(first: 10) {
+        nodes {
+            name
+        }
+        totalCount
+    }
+    createdAt
+    updatedAt
+    pushedAt
+    isFork
+    readme: object(expression: "HEAD:README.md") {
+        ... on Blob {
+            byteSize
+        }
+    }
+    repositoryTopics(first: 10) {
+        nodes {
+            topic {
+                name
+            }
+        }
+    }
+    openIssues: issues(states: OPEN) {
+        totalCount
+    }
+    closedIssues: issues(states: CLOSED) {
+        totalCount
+    }
+    openPullRequests: pullRequests(states: OPEN) {
+        totalCount
+    }
+    mergedPullRequests: pullRequests(states: MERGED) {
+        totalCount
+    }
+"""
+
+REPOS_PAGE_QUERY = """
+query($username: String!, $first: Int!, $after: String) {
+    rateLimit {
+        cost
+        remaining
+        resetAt
+    }
+    user(login: $username) {
+        repositories(first: $first, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+            totalCount
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {%s}
+        }
+    }
+}
+""" % REPO_FIELDS
+
+# Contributions and the first repositories page in one document, for any
+# number of users aliased as u0, u1, ...
+PROFILE_FRAGMENT = """
+fragment ProfileFields on User {
+    login
+    ...MarkerFields
+    contributionsCollection {
+        contributionCalendar {
+            totalContributions
+        }
+    }
+    repositories(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
+        totalCount
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {%s}
+    }
+}
+""" % REPO_FIELDS
+
+MARKER_FRAGMENT = """
+fragment MarkerFields on User {
+    updatedAt
+    latest: repositories(first: 1, orderBy: {field: PUSHED_AT, direction: DESC}) {
+        totalCount
+        nodes {
+            pushedAt
+        }
+    }
+}
+"""
+
+_RETRYABLE_MESSAGES = re.compile(r"timeout|timed out|something went wrong|MAX_NODE_LIMIT|loading", re.IGNORECASE)
+
+
+class GraphQLError(Exception):
+    def __init__(self, message, retryable=False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class PagePlanner:
+    """
+    Sizes each repositories page: grows while pages are cheap and fast,
+    halves after a timeout/node-limit error, and shrinks when the remaining
+    rate budget is low so one user cannot drain it.
+    """
+
+    def __init__(self, size=DEFAULT_PAGE_SIZE):
+        self.size = max(MIN_PAGE_SIZE, min(MAX_PAGE_SIZE, size))
+
+    def next_size(self, pool):
+        size = self.size
+        if pool.remaining() < LOW_BUDGET_POINTS:
+            size = min(size, MIN_PAGE_SIZE * 2)
+        return size
+
+    def on_success(self, elapsed):
+        if elapsed > SLOW_PAGE_SECONDS:
+            self.size = max(MIN_PAGE_SIZE, self.size // 2)
+        elif elapsed < SLOW_PAGE_SECONDS / 4:
+            self.size = min(MAX_PAGE_SIZE, int(self.size * 1.5))
+
+    def on_failure(self):
+        self.size = max(MIN_PAGE_SIZE, self.size // 2)
+
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_WORKERS * 2))
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_WORKERS * 2))
+
+
+def graphql(query, variables, pool=None):
+    """
+    POST a GraphQL document with a token from the pool; returns the `data`
+    object or raises GraphQLError. A rate-limited token is parked until its
+    reset and the request is retried on another one (or after the reset).
+    """
+    pool = pool or Token_Pool.get_pool()
+
+    for _ in range(2 * len(pool) + 1):
+        token = pool.acquire()
+        headers = {
+            "Authorization": f"bearer {token}",
+            "Content-Type": "application/json",
+        }
+        try:
+            response = session.post(
+                GRAPHQL_URL, json={"query": query, "variables": variables}, headers=headers, timeout=REQUEST_TIMEOUT
+            )
+        except requests.Timeout as e:
+            pool.release(token)
+            raise GraphQLError(f"Request timed out: {e}", retryable=True)
+        except requests.RequestException as e:
+            pool.release(token)
+            raise GraphQLError(f"Failed to fetch data: {e}", retryable=True)
+
+        if response.status_code in (403, 429) and (
+            response.headers.get("X-RateLimit-Remaining") == "0" or "rate limit" in response.text.lower()
+        ):
+            pool.release(token, headers=response.headers)
+            reset = response.headers.get("X-RateLimit-Reset")
+            retry_after = response.headers.get("Retry-After")
+            pool.exhaust(token, float(reset) if reset else (time.time() + float(retry_after) if retry_after else None))
+            continue
+        if response.status_code in (502, 503, 504):
+            pool.release(token, headers=response.headers)
+            raise GraphQLError(f"GitHub returned {response.status_code}", retryable=True)
+        if not response.ok:
+            pool.release(token, headers=response.headers)
+            raise GraphQLError(f"GitHub returned {response.status_code}: {response.text[:200]}")
+
+        payload = response.json()
+        data = payload.get("data") or {}
+        pool.release(token, headers=response.headers, rate_limit=data.get("rateLimit"))
+
+        errors = payload.get("errors") or []
+        if any(error.get("type") == "RATE_LIMITED" for error in errors):
+            pool.exhaust(token)
+            continue
+        if errors and not any(v for k, v in data.items() if k != "rateLimit"):
+            message = errors[0].get("message", "Unknown GraphQL error")
+            raise GraphQLError(message, retryable=bool(_RETRYABLE_MESSAGES.search(message)))
+        return data
+
+    raise GraphQLError("Rate limited on every GitHub token", retryable=True)
+
+
+def fetch_repositories(username, pool=None, max_repos=MAX_REPOS, after=None, repositories=None):
+    """
+    All repositories of a user (up to max_repos), paged with cursors.
+    Heavy fields (README blobs) are not part of the page query. Pass `after`
+    and the repositories already fetched to continue from a profile query.
+    """
+    pool = pool or Token_Pool.get_pool()
+    planner = PagePlanner()
+    repositories, cursor = list(repositories or []), after
+
+    while len(repositories) < max_repos:
+        attempts = 0
+        while True:
+            size = min(planner.next_size(pool), max_repos - len(repositories))
+            start = time.perf_counter()
+            try:
+                data = graphql(REPOS_PAGE_QUERY, {"username": username, "first": size, "after": cursor}, pool)
+                planner.on_success(time.perf_counter() - start)
+                break
+            except GraphQLError as e:
+                attempts += 1
+                if not e.retryable or attempts >= MAX_RETRIES:
+                    raise
+                planner.on_failure()
+
+        if not data.get("user"):
+            raise GraphQLError(f"User {username} not found")
+
+        page = data["user"]["repositories"]
+        repositories.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    return repositories
+
+
+def readme_size(repo):
+    """README byteSize from the page query (None when the repository has no README.md)."""
+    blob = repo.get("readme") or {}
+    return blob.get("byteSize")
+
+
+def select_readme_repos(repositories, limit=README_TOP_REPOS):
+    """
+    The repositories whose README text is worth loading: the user's own
+    (non-fork) repositories with a README under README_MAX_BYTES, best first
+    by stars and then by last push.
+    """
+    by_owner = {}
+    for repo in repositories:
+        size = readme_size(repo)
+        if repo.get("isFork") or not size or size > README_MAX_BYTES or not repo.get("nameWithOwner"):
+            continue
+        by_owner.setdefault(repo["nameWithOwner"].split("/", 1)[0].lower(), []).append(repo)
+
+    selected = []
+    for repos in by_owner.values():
+        repos.sort(key=lambda repo: (repo.get("stargazerCount") or 0, repo.get("pushedAt") or ""), reverse=True)
+        selected.extend(repos[:limit])
+    return selected
+
+
+def fetch_readmes(repositories, pool=None, batch_size=README_BATCH_SIZE, max_chars=README_MAX_CHARS):
+    """
+    README text for the given repositories ({nameWithOwner: text}), fetched
+    lazily in separate aliased queries so the page queries stay light. Each
+    text is truncated to max_chars. Use select_readme_repos to pick which
+    repositories are worth it.
+    """
+    readmes = {}
+    names = [repo["nameWithOwner"] for repo in repositories if repo.get("nameWithOwner")]
+
+    for offset in range(0, len(names), batch_size):
+        batch = names[offset:offset + batch_size]
+        declarations, selections, variables = [], [], {}
+        for i, full_name in enumerate(batch):
+            owner, name = full_name.split("/", 1)
+            declarations.append(f"$o{i}: String!, $n{i}: String!")
+            selections.append(
+                f'r{i}: repository(owner: $o{i}, name: $n{i}) {{ '
+                f'object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }} }}'
+            )
+            variables[f"o{i}"], variables[f"n{i}"] = owner, name
+
+        query = (
+            f"query({', '.join(declarations)}) {{ rateLimit {{ cost remaining resetAt }} "
+            f"{' '.join(selections)} }}"
+        )
+        try:
+            data = graphql(query, variables, pool)
+        except GraphQLError as e:
+            logger.warning(f"⚠️ README batch failed: {e}")
+            continue
+
+        for i, full_name in enumerate(batch):
+            repo = data.get(f"r{i}") or {}
+            blob = repo.get("object") or {}
+            if blob.get("text") is not None:
+                readmes[full_name] = blob["text"][:max_chars]
+
+    return readmes
+
+
+def build_profiles_query(count):
+    """Aliased document fetching `count` users (logins passed as $l0, $l1, ...)."""
+    declarations = ", ".join(f"$l{i}: String!" for i in range(count))
+    selections = " ".join(f"u{i}: user(login: $l{i}) {{ ...ProfileFields }}" for i in range(count))
+    return (
+        f"query($first: Int!, {declarations}) {{ rateLimit {{ cost remaining resetAt }} {selections} }}"
+        + PROFILE_FRAGMENT + MARKER_FRAGMENT
+    )
+
+
+def profile_marker(user):
+    """
+    Change marker for a user: profile updatedAt, latest pushedAt and the repo
+    count. If none of them moved, a cached profile is still valid.
+    """
+    latest = user.get("latest") or {}
+    nodes = latest.get("nodes") or [{}]
+    return f"{user.get('updatedAt')}|{nodes[0].get('pushedAt')}|{latest.get('totalCount')}"
+
+
+def fetch_markers(usernames, pool=None, batch_size=MARKER_BATCH_SIZE):
+    """Change markers for many users with a tiny aliased query ({username: marker or None})."""
+    markers = {}
+    for offset in range(0, len(usernames), batch_size):
+        batch = usernames[offset:offset + batch_size]
+        declarations = ", ".join(f"$l{i}: String!" for i in range(len(batch)))
+        selections = " ".join(f"u{i}: user(login: $l{i}) {{ ...MarkerFields }}" for i in range(len(batch)))
+        query = (
+            f"query({declarations}) {{ rateLimit {{ cost remaining resetAt }} {selections} }}"
+            + MARKER_FRAGMENT
+        )
+        try:
+            data = graphql(query, {f"l{i}": username for i, username in enumerate(batch)}, pool)
+        except GraphQLError as e:
+            logger.warning(f"⚠️ Marker query failed: {e}")
+            data = {}
+        for i, username in enumerate(batch):
+            user = data.get(f"u{i}")
+            markers[username] = profile_marker(user) if user else None
+    return markers
+
+
+def fetch_profiles(usernames, pool=None, page_size=PROFILE_PAGE_SIZE):
+    """
+    Contributions and repositories for a batch of users in one aliased query.
+    Users with more repositories than the first page are continued with
+    fetch_repositories. A batch that times out is split in half and retried.
+
+    Returns:
+        dict: {username: {"total_contributions", "repositories"} or {"error"}}
+    """
+    if not usernames:
+        return {}
+
+    variables = {"first": page_size}
+    variables.update({f"l{i}": username for i, username in enumerate(usernames)})
+    try:
+        data = graphql(build_profiles_query(len(usernames)), variables, pool)
+    except GraphQLError as e:
+        if e.retryable and len(usernames) > 1:
+            middle = len(usernames) // 2
+            profiles = fetch_profiles(usernames[:middle], pool, page_size)
+            profiles.update(fetch_profiles(usernames[middle:], pool, page_size))
+            return profiles
+        return {username: {"error": str(e)} for username in usernames}
+
+    profiles = {}
+    for i, username in enumerate(usernames):
+        user = data.get(f"u{i}")
+        if not user:
+            profiles[username] = {"error": f"User {username} not found"}
+            continue
+
+        page = user["repositories"]
+        repositories = page["nodes"]
+        if page["pageInfo"]["hasNextPage"]:
+            try:
+                repositories = fetch_repositories(
+                    username, pool, after=page["pageInfo"]["endCursor"], repositories=repositories
+                )
+            except GraphQLError as e:
+                logger.warning(f"⚠️ Could not page repositories for {username}: {e}")
+
+        profiles[username] = {
+            "marker": profile_marker(user),
+            "total_contributions": user["contributionsCollection"]["contributionCalendar"]["totalContributions"],
+            "repositories": repositories,
+        }
+    return profiles
+
+
+def fetch_many(usernames, pool=None, max_workers=FETCH_WORKERS, batch_size=PROFILE_BATCH_SIZE):
+    """
+    Profiles for many users at once: users are grouped into aliased batches
+    and the batches run in parallel. All threads draw from one TokenPool, so
+    load is spread across tokens and they wait together when all run out.
+    """
+    usernames = list(dict.fromkeys(usernames))
+    if not usernames:
+        return {}
+    pool = pool or Token_Pool.get_pool()
+    batches = [usernames[i:i + batch_size] for i in range(0, len(usernames), batch_size)]
+
+    profiles = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+        for result in executor.map(lambda batch: fetch_profiles(batch, pool), batches):
+            profiles.update(result)
+    return profiles
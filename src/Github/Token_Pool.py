@@ -0,0 +1,159 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# GraphQL budget of a fresh token, used until the first response reports it
+DEFAULT_POINTS = 5000
+# Points left untouched on every token
+TOKEN_RESERVE = int(os.getenv("GITHUB_TOKEN_RESERVE", 10))
+# Assumed reset for an exhausted token whose responses never reported one
+UNKNOWN_RESET_SECONDS = 60
+
+
+class TokenState:
+    def __init__(self, token):
+        self.token = token
+        self.remaining = DEFAULT_POINTS
+        self.limit = DEFAULT_POINTS
+        self.reset_at = 0.0
+        self.in_flight = 0
+        self.requests = 0
+
+    def available(self, now):
+        # Once the reset time passes, the budget is full again
+        if self.reset_at and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+        return self.remaining - self.in_flight
+
+
+class TokenPool:
+    """
+    Rotates GraphQL requests across several GitHub tokens.
+
+    Each token's remaining points and reset time are tracked from the
+    X-RateLimit-* response headers and the `rateLimit` query field. acquire()
+    hands out the token with the most points left (minus requests in flight),
+    and blocks until the earliest reset when every token is exhausted instead
+    of letting requests fail.
+    """
+
+    def __init__(self, tokens, reserve=TOKEN_RESERVE):
+        tokens = [token.strip() for token in tokens if token and token.strip()]
+        if not tokens:
+            raise ValueError("TokenPool needs at least one token")
+        self.states = {token: TokenState(token) for token in dict.fromkeys(tokens)}
+        self.reserve = reserve
+        self.condition = threading.Condition()
+        self.waits = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def remaining(self):
+        """Points left across all tokens."""
+        with self.condition:
+            now = time.time()
+            return sum(max(0, state.available(now)) for state in self.states.values())
+
+    def acquire(self, cost=1):
+        with self.condition:
+            while True:
+                now = time.time()
+                best = max(self.states.values(), key=lambda state: state.available(now))
+                if best.available(now) - cost >= self.reserve:
+                    best.in_flight += cost
+                    best.requests += 1
+                    return best.token
+
+                if all(cost + self.reserve > state.limit for state in self.states.values()):
+                    raise ValueError(f"Request cost {cost} exceeds every token's budget")
+                for state in self.states.values():
+                    # Out of points (not just busy) with no reported reset: assume one, or we would wait forever
+                    if not state.reset_at and state.remaining - cost < self.reserve:
+                        state.reset_at = now + UNKNOWN_RESET_SECONDS
+                resets = [state.reset_at for state in self.states.values() if state.reset_at]
+                delay = (min(resets) - now) if resets else 1.0
+                self.waits += 1
+                logger.warning(f"⏳ All {len(self.states)} GitHub tokens exhausted, waiting {max(delay, 0):.0f}s for reset")
+                self.condition.wait(timeout=max(delay, 0) + 0.5)
+
+    def release(self, token, cost=1, headers=None, rate_limit=None):
+        """Return a token after a request and record the budget the response reported."""
+        with self.condition:
+            state = self.states.get(token)
+            if state is None:
+                return
+            state.in_flight = max(0, state.in_flight - cost)
+
+            headers = headers or {}
+            if headers.get("X-RateLimit-Remaining") is not None:
+                state.remaining = int(headers["X-RateLimit-Remaining"])
+            if headers.get("X-RateLimit-Limit") is not None:
+                state.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Reset") is not None:
+                state.reset_at = float(headers["X-RateLimit-Reset"])
+
+            if rate_limit:
+                if rate_limit.get("remaining") is not None:
+                    state.remaining = rate_limit["remaining"]
+                if rate_limit.get("resetAt"):
+                    state.reset_at = _parse_time(rate_limit["resetAt"])
+            self.condition.notify_all()
+
+    def exhaust(self, token, reset_at=None):
+        """Mark a token as rate limited until reset_at (the known reset, or one minute if unknown)."""
+        with self.condition:
+            state = self.states.get(token)
+            if state is not None:
+                now = time.time()
+                state.remaining = 0
+                state.reset_at = reset_at or (state.reset_at if state.reset_at > now else now + 60)
+
+    def report(self):
+        with self.condition:
+            now = time.time()
+            return {
+                "tokens": [
+                    {
+                        "token": f"...{state.token[-4:]}",
+                        "remaining": state.available(now),
+                        "reset_at": state.reset_at or None,
+                        "requests": state.requests,
+                    }
+                    for state in self.states.values()
+                ],
+                "waits": self.waits,
+            }
+
+
+def _parse_time(value):
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+def tokens_from_env():
+    """GITHUB_TOKENS (comma separated), falling back to the single GITHUB_TOKEN."""
+    tokens = [token for token in os.getenv("GITHUB_TOKENS", "").split(",") if token.strip()]
+    if not tokens and os.getenv("GITHUB_TOKEN"):
+        tokens = [os.getenv("GITHUB_TOKEN")]
+    return tokens
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = TokenPool(tokens_from_env())
+        return _pool
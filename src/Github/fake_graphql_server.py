@@ -0,0 +1,214 @@
+"""
+Local stand-in for the GitHub GraphQL API, for exercising Github_Fetcher,
+the token pool and the cache without a real token or network.
+
+It answers the query shapes this package sends (aliased profile/marker
+batches, repository pages, README batches, contributions) with synthetic
+but deterministic data, and enforces a per-token point budget with GitHub's
+X-RateLimit-* headers and RATE_LIMITED errors.
+
+    python -m Github.fake_graphql_server --port 8765 --points 100 --reset-seconds 30
+    GITHUB_GRAPHQL_URL=http://127.0.0.1:8765/graphql GITHUB_TOKENS=a,b python ...
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Java", "C++", "Rust", "HTML", "CSS", "Shell"]
+TOPICS = ["machine-learning", "react", "django", "docker", "kubernetes", "fastapi", "nlp", "web", "cli", "api"]
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _rng(*parts):
+    return random.Random(hashlib.md5("/".join(map(str, parts)).encode()).hexdigest())
+
+
+class FakeGithub:
+    def __init__(self, points=5000, reset_seconds=3600, latency=0.0, repos=None):
+        self.points = points
+        self.reset_seconds = reset_seconds
+        self.latency = latency
+        self.repos = repos
+        self.budgets = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    # -- data ----------------------------------------------------------
+    def repo_count(self, login):
+        return self.repos if self.repos is not None else _rng(login).randint(1, 60)
+
+    def repository(self, login, index):
+        rng = _rng(login, index)
+        name = f"{login}-repo-{index}"
+        created = EPOCH - timedelta(days=rng.randint(30, 2000))
+        updated = EPOCH - timedelta(days=index + rng.randint(0, 5))
+        readme = None
+        if rng.random() < 0.7:
+            skills = ", ".join(rng.sample(LANGUAGES, 3) + rng.sample(TOPICS, 2))
+            badge = "[![build](https://img.shields.io/badge/build-passing-green.svg)](https://ci)\n" if rng.random() < 0.4 else ""
+            readme = f"# {name}\n{badge}\nBuilt with {skills}.\n" + "Lorem ipsum dolor sit amet. " * rng.randint(5, 400)
+        return {
+            "name": name,
+            "nameWithOwner": f"{login}/{name}",
+            "description": f"Synthetic repository {index} of {login}",
+            "url": f"https://github.com/{login}/{name}",
+            "stargazerCount": int(rng.paretovariate(1.2)) - 1,
+            "forkCount": rng.randint(0, 20),
+            "watchers": {"totalCount": rng.randint(0, 30)},
+            "languages": {"nodes": [{"name": n} for n in rng.sample(LANGUAGES, 3)], "totalCount": 3},
+            "createdAt": _iso(created),
+            "updatedAt": _iso(updated),
+            "pushedAt": _iso(updated),
+            "isFork": rng.random() < 0.2,
+            "readme": {"byteSize": len(readme.encode("utf-8"))} if readme else None,
+            "repositoryTopics": {"nodes": [{"topic": {"name": n}} for n in rng.sample(TOPICS, 2)]},
+            "openIssues": {"totalCount": rng.randint(0, 10)},
+            "closedIssues": {"totalCount": rng.randint(0, 50)},
+            "openPullRequests": {"totalCount": rng.randint(0, 5)},
+            "mergedPullRequests": {"totalCount": rng.randint(0, 40)},
+            "_readme": readme,
+        }
+
+    def _public(self, repo):
+        return {k: v for k, v in repo.items() if not k.startswith("_")}
+
+    def repositories_page(self, login, first, after):
+        total = self.repo_count(login)
+        start = int(after or 0)
+        end = min(total, start + first)
+        return {
+            "totalCount": total,
+            "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+            "nodes": [self._public(self.repository(login, i)) for i in range(start, end)],
+        }
+
+    def user(self, login, query, variables):
+        if login.lower().startswith("missing"):
+            return None
+        user = {
+            "login": login,
+            "updatedAt": _iso(EPOCH),
+            "latest": {"totalCount": self.repo_count(login), "nodes": [{"pushedAt": _iso(EPOCH)}]},
+            "contributionsCollection": {
+                "contributionCalendar": {"totalContributions": _rng(login, "contrib").randint(0, 2000)}
+            },
+        }
+        if "...ProfileFields" in query or "$after" in query:
+            user["repositories"] = self.repositories_page(login, variables.get("first", 30), variables.get("after"))
+        return user
+
+    def readme_object(self, owner, name, query):
+        match = re.match(rf"{re.escape(owner)}-repo-(\d+)$", name)
+        readme = self.repository(owner, int(match.group(1)))["_readme"] if match else None
+        if readme is None:
+            return None
+        blob = {}
+        if "byteSize" in query:
+            blob["byteSize"] = len(readme.encode("utf-8"))
+        if re.search(r"\btext\b", query):
+            blob["text"] = readme
+        return blob
+
+    # -- rate limit ----------------------------------------------------
+    def charge(self, token, cost=1):
+        with self.lock:
+            self.requests += 1
+            now = time.time()
+            budget = self.budgets.get(token)
+            if budget is None or now >= budget["reset_at"]:
+                budget = {"remaining": self.points, "reset_at": now + self.reset_seconds}
+                self.budgets[token] = budget
+            allowed = budget["remaining"] >= cost
+            if allowed:
+                budget["remaining"] -= cost
+            return allowed, dict(budget)
+
+    def execute(self, query, variables):
+        data = {}
+        aliases = re.findall(r"(u\d+): user\(login: \$(l\d+)\)", query)
+        if aliases:
+            for alias, var in aliases:
+                data[alias] = self.user(variables[var], query, variables)
+        elif "user(login: $username)" in query:
+            data["user"] = self.user(variables["username"], query, variables)
+        for alias, owner_var, name_var in re.findall(r"(r\d+): repository\(owner: \$(o\d+), name: \$(n\d+)\)", query):
+            blob = self.readme_object(variables[owner_var], variables[name_var], query)
+            data[alias] = {"object": blob}
+        return data
+
+
+class Handler(BaseHTTPRequestHandler):
+    github = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, budget):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-RateLimit-Limit", str(self.github.points))
+        self.send_header("X-RateLimit-Remaining", str(budget["remaining"]))
+        self.send_header("X-RateLimit-Reset", str(int(budget["reset_at"])))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        token = (self.headers.get("Authorization") or "").split(" ")[-1]
+        allowed, budget = self.github.charge(token)
+        if self.github.latency:
+            time.sleep(self.github.latency)
+        if not allowed:
+            self._send(200, {"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}, budget)
+            return
+
+        data = self.github.execute(body.get("query", ""), body.get("variables") or {})
+        if "rateLimit" in body.get("query", ""):
+            data["rateLimit"] = {
+                "cost": 1,
+                "remaining": budget["remaining"],
+                "resetAt": _iso(datetime.fromtimestamp(budget["reset_at"], timezone.utc)),
+            }
+        self._send(200, {"data": data}, budget)
+
+
+def start_server(port=0, **options):
+    """Start the fake API in a daemon thread; returns (server, graphql_url)."""
+    github = FakeGithub(**options)
+    handler = type("FakeGithubHandler", (Handler,), {"github": github})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.github = github
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/graphql"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake GitHub GraphQL API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--points", type=int, default=5000, help="points per token per window")
+    parser.add_argument("--reset-seconds", type=int, default=3600)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--repos", type=int, default=None, help="repositories per user (default: varies)")
+    args = parser.parse_args()
+
+    server, url = start_server(
+        args.port, points=args.points, reset_seconds=args.reset_seconds, latency=args.latency, repos=args.repos
+    )
+    print(f"🚀 Fake GitHub GraphQL API at {url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,167 @@
+"""
+Times each LinkedInScraper extractor over a fixture corpus replayed through
+Replay.ReplayDriver, in "live" (every selector is a driver call) and
+"snapshot" (one page_source per page, parsed locally) extraction modes.
+
+    python -m LinkedIn.Extraction_Benchmark --synthetic 25 --round-trip-ms 2 --output extraction.json
+    python -m LinkedIn.Extraction_Benchmark --fixtures recorded/ --modes snapshot --repeat 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from LinkedIn import LinkedIn_Scraper
+from LinkedIn.LinkedIn_Scraper import LinkedInScraper
+from LinkedIn.Replay import FixtureStore, ReplayDriver, write_synthetic_fixtures
+from LinkedIn.Snapshot import SnapshotDriver
+
+MAIN_STEPS = ["_get_about", "_get_experience", "_get_education", "_collect_details_urls"]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class _Recorder:
+    def __init__(self, driver: ReplayDriver):
+        self.driver = driver
+        self.seconds = defaultdict(list)
+        self.trips = defaultdict(list)
+
+    @contextlib.contextmanager
+    def step(self, name: str):
+        trips = self.driver.round_trips
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name].append(time.perf_counter() - start)
+            self.trips[name].append(self.driver.round_trips - trips)
+
+
+def _page(scraper: LinkedInScraper, recorder: _Recorder, mode: str):
+    if mode != "snapshot":
+        return None
+    with recorder.step("snapshot"):
+        return SnapshotDriver(scraper.driver.page_source, scraper.driver.current_url)
+
+
+def run_profile(store: FixtureStore, url: str, mode: str, round_trip: float, recorder: _Recorder = None) -> _Recorder:
+    driver = ReplayDriver(store, round_trip)
+    recorder = recorder or _Recorder(driver)
+    recorder.driver = driver
+    scraper = LinkedInScraper()
+    # Replayed pages are complete, so selector waits never need to poll
+    scraper.attach_driver(driver, timeout=0)
+
+    driver.get(url)
+    page = _page(scraper, recorder, mode)
+    results = {}
+    for name in MAIN_STEPS:
+        with recorder.step(name), scraper._using(page):
+            results[name] = getattr(scraper, name)()
+
+    sections = scraper._details_sections()
+    for section, details_url in results["_collect_details_urls"].items():
+        driver.get(details_url)
+        details_page = _page(scraper, recorder, mode)
+        extractor = sections[section][1]
+        with recorder.step(extractor), scraper._using(details_page):
+            getattr(scraper, extractor)()
+    for section, (_, _, main_extractor) in sections.items():
+        if section not in results["_collect_details_urls"]:
+            driver.get(url)
+            with recorder.step(main_extractor), scraper._using(page):
+                getattr(scraper, main_extractor)()
+    return recorder
+
+
+@contextlib.contextmanager
+def _no_settle_waits():
+    """Replayed pages never grow or load more, so scroll/settle waits would only time a constant"""
+    names = ("SCROLL_TIMEOUT", "SCROLL_QUIET_SECONDS")
+    saved = {name: getattr(LinkedIn_Scraper, name) for name in names}
+    try:
+        for name in names:
+            setattr(LinkedIn_Scraper, name, 0.0)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(LinkedIn_Scraper, name, value)
+
+
+def benchmark(store: FixtureStore, mode: str = "snapshot", repeat: int = 3, round_trip: float = 0.0) -> Dict:
+    profiles = store.profile_urls()
+    recorder = None
+    started = time.perf_counter()
+    # The extractors print progress for every item; keep it out of the timings
+    with contextlib.redirect_stdout(io.StringIO()), _no_settle_waits():
+        for _ in range(repeat):
+            for url in profiles:
+                recorder = run_profile(store, url, mode, round_trip, recorder)
+    elapsed = time.perf_counter() - started
+
+    steps = {}
+    for name, values in (recorder.seconds.items() if recorder else []):
+        steps[name] = {
+            "calls": len(values),
+            "mean_ms": round(1000 * sum(values) / len(values), 3),
+            "p50_ms": round(1000 * _percentile(values, 0.50), 3),
+            "p95_ms": round(1000 * _percentile(values, 0.95), 3),
+            "max_ms": round(1000 * max(values), 3),
+            "round_trips": round(sum(recorder.trips[name]) / len(values), 1),
+        }
+    runs = max(1, len(profiles) * repeat)
+    return {
+        "mode": mode,
+        "profiles": len(profiles),
+        "repeat": repeat,
+        "round_trip_ms": round_trip * 1000,
+        "seconds_per_profile": round(elapsed / runs, 4),
+        "steps": steps,
+    }
+
+
+def print_report(result: Dict):
+    print(
+        f"\n📊 {result['mode']} extraction: {result['profiles']} profiles x {result['repeat']}, "
+        f"{result['round_trip_ms']:.1f} ms/round trip → {result['seconds_per_profile'] * 1000:.1f} ms per profile"
+    )
+    print(f"{'step':40} {'calls':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'trips':>8}")
+    for name, stats in sorted(result["steps"].items(), key=lambda item: -item[1]["mean_ms"]):
+        print(
+            f"{name:40} {stats['calls']:>6} {stats['mean_ms']:>9.2f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['round_trips']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark LinkedIn extraction over replayed fixtures")
+    parser.add_argument("--fixtures", help="fixture directory (recorded with LINKEDIN_RECORD_DIR or Replay.py)")
+    parser.add_argument("--synthetic", type=int, default=0, help="generate this many synthetic profiles first")
+    parser.add_argument("--modes", nargs="+", default=["live", "snapshot"], choices=["live", "snapshot"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--round-trip-ms", type=float, default=0.0, help="simulated cost of each driver call")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    directory = args.fixtures or tempfile.mkdtemp(prefix="linkedin-fixtures-")
+    if args.synthetic:
+        write_synthetic_fixtures(directory, args.synthetic)
+    store = FixtureStore(directory)
+    if not store.profile_urls():
+        parser.error("no profile fixtures found; pass --fixtures or --synthetic N")
+
+    results = [benchmark(store, mode, args.repeat, args.round_trip_ms / 1000) for mode in args.modes]
+    for result in results:
+        print_report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results written to {args.output}")
@@ -8,18 +8,59 @@ import json
 from typing import Dict, List, Optional
 import re
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from LinkedIn.Snapshot import SnapshotDriver
+from LinkedIn.Replay import RecordingDriver
+
+load_dotenv()
+
+PAGE_TIMEOUT = float(os.getenv("LINKEDIN_PAGE_TIMEOUT", 10))
+# The network counts as idle once no new resource has loaded for this long
+NETWORK_IDLE_SECONDS = float(os.getenv("LINKEDIN_NETWORK_IDLE_SECONDS", 0.5))
+NETWORK_IDLE_TIMEOUT = float(os.getenv("LINKEDIN_NETWORK_IDLE_TIMEOUT", 5))
+# How long a scroll may take to grow the page before it is considered fully loaded
+SCROLL_TIMEOUT = float(os.getenv("LINKEDIN_SCROLL_TIMEOUT", 1.5))
+# A scroll that fetched nothing new for this long (and did not grow the page) ends scrolling early
+SCROLL_QUIET_SECONDS = float(os.getenv("LINKEDIN_SCROLL_QUIET_SECONDS", 0.3))
+
+PROFILE_READY = (By.CSS_SELECTOR, "main h1")
+DETAILS_READY = (By.CSS_SELECTOR, "main .pvs-list__container, main .pvs-list, main section")
+
+# "parallel" collects every details URL from the main profile and loads them
+# together in extra tabs; "sequential" visits them one by one and reloads the profile
+DETAILS_MODE = os.getenv("LINKEDIN_DETAILS_MODE", "parallel").lower()
+# When set, every page visited is saved there as a replay fixture (see LinkedIn/Replay.py)
+RECORD_DIR = os.getenv("LINKEDIN_RECORD_DIR")
+# "snapshot" parses each page's HTML once and extracts from it locally;
+# "live" runs every selector against the browser
+EXTRACTION_MODE = os.getenv("LINKEDIN_EXTRACTION_MODE", "snapshot").lower()
+# section -> (details URL path, dedicated-page extractor, main-page fallback extractor);
+# sections whose extractors the scraper does not define are skipped
+DETAILS_SECTIONS = {
+    "projects": ("/details/projects", "_extract_projects_from_page", "_extract_projects_from_main_page"),
+    "certificates": ("/details/certifications", "_extract_certificates_from_page", "_extract_certificates_from_main_page"),
+    "skills": ("/details/skills", "_extract_skills_from_page", "_extract_skills_from_main_page"),
+}
+
+NETWORK_STATE_JS = (
+    "return [document.readyState, performance.getEntriesByType('resource').length];"
+)
 
 
 class LinkedInScraper:
     def __init__(self):
         self.driver = None
         self.wait = None
+        self.timings = {}
 
-    def setup_driver(self):
+    def setup_driver(self, headless: bool = False):
         """Initialize the Chrome WebDriver with appropriate options"""
         options = webdriver.ChromeOptions()
         options.add_argument("--start-maximized")
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
         # Add performance options
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
@@ -29,10 +70,91 @@ class LinkedInScraper:
         options.add_argument("--disable-notifications")
         options.add_argument("--disable-popup-blocking")
         options.add_argument("--disable-blink-features=AutomationControlled")
-        # Uncomment the line below if you want to run in headless mode
-        # options.add_argument('--headless')
-        self.driver = webdriver.Chrome(options=options)
-        self.wait = WebDriverWait(self.driver, 10)  # Reduced wait time
+        driver = webdriver.Chrome(options=options)
+        if RECORD_DIR:
+            driver = RecordingDriver(driver, RECORD_DIR)
+        self.attach_driver(driver)
+
+    def attach_driver(self, driver, timeout: float = PAGE_TIMEOUT):
+        """Use an existing driver (e.g. a Replay.ReplayDriver) instead of launching Chrome"""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, timeout)
+
+    @contextmanager
+    def _timed(self, step: str):
+        """Accumulate the wall time of a scraping step into self.timings"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[step] = self.timings.get(step, 0.0) + time.perf_counter() - start
+
+    def _wait_for_network_idle(self, quiet: float = NETWORK_IDLE_SECONDS,
+                               timeout: float = NETWORK_IDLE_TIMEOUT) -> bool:
+        """
+        Wait until the document is complete and no new resource has been
+        fetched for `quiet` seconds (LinkedIn keeps loading sections over XHR
+        after readyState is complete). Returns False if it never settles.
+        """
+        state = {"count": -1, "since": time.perf_counter()}
+
+        def settled(driver):
+            ready, count = driver.execute_script(NETWORK_STATE_JS)
+            now = time.perf_counter()
+            if ready != "complete" or count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return now - state["since"] >= quiet
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(settled)
+            return True
+        except TimeoutException:
+            return False
+
+    def _take_snapshot(self) -> Optional[SnapshotDriver]:
+        """Parse the current page once, or None when extracting live"""
+        if EXTRACTION_MODE != "snapshot":
+            return None
+        with self._timed("snapshot"):
+            return SnapshotDriver(self.driver.page_source, self.driver.current_url)
+
+    @contextmanager
+    def _using(self, snapshot: Optional[SnapshotDriver]):
+        """Run extractors against a snapshot instead of the browser (no-op for None)"""
+        if snapshot is None:
+            yield
+            return
+        live_driver, live_wait = self.driver, self.wait
+        # A snapshot never changes, so waits check once instead of polling
+        self.driver, self.wait = snapshot, WebDriverWait(snapshot, 0)
+        try:
+            yield
+        finally:
+            self.driver, self.wait = live_driver, live_wait
+
+    def extract_from_html(self, html: str, profile_url: str = "") -> Dict:
+        """Profile data from saved profile HTML, without a browser"""
+        snapshot = SnapshotDriver(html, profile_url)
+        with self._using(snapshot):
+            profile_data = {
+                "profile_url": profile_url,
+                "about": self._get_about(),
+                "experience": self._get_experience(),
+                "education": self._get_education(),
+            }
+            for section, (_, _, main_extractor) in self._details_sections().items():
+                profile_data[section] = getattr(self, main_extractor)()
+        return profile_data
+
+    def _load(self, url: str, ready=PROFILE_READY):
+        """Navigate to url and wait for its content instead of sleeping a fixed time"""
+        self.driver.get(url)
+        try:
+            self.wait.until(EC.presence_of_element_located(ready))
+        except TimeoutException:
+            print(f"Timed out waiting for {url} to render")
+        self._wait_for_network_idle()
 
     def login(self, email: str, password: str):
         """Login to LinkedIn"""
@@ -55,7 +177,18 @@ class LinkedInScraper:
         login_button.click()
 
         # Wait for login to complete
-        time.sleep(2)  # Reduced wait time
+        try:
+            self.wait.until(lambda driver: "/login" not in driver.current_url)
+        except TimeoutException:
+            print("Timed out waiting for LinkedIn login to complete")
+
+    def is_logged_in(self) -> bool:
+        """True if the current session is authenticated (not bounced to login or a checkpoint)"""
+        self.driver.get("https://www.linkedin.com/feed/")
+        url = self.driver.current_url
+        return "/feed" in url and not any(
+            marker in url for marker in ("/login", "/checkpoint", "/authwall", "/uas/")
+        )
 
     def validate_linkedin_url(self, url: str) -> str:
         """Validate and format LinkedIn profile URL"""
@@ -83,26 +216,45 @@ class LinkedInScraper:
         formatted_url = self.validate_linkedin_url(profile_url)
         print(f"Accessing profile: {formatted_url}")
 
-        self.driver.get(formatted_url)
-        time.sleep(2)  # Reduced wait time
+        self.timings = {}
+        started = time.perf_counter()
+
+        with self._timed("load"):
+            self._load(formatted_url)
 
         # Scroll down to load more content
-        self._scroll_page()
-
-        profile_data = {
-            "profile_url": formatted_url,
-            "about": self._get_about(),
-            "experience": self._get_experience(),
-            "education": self._get_education(),
-            "projects": self._get_projects(formatted_url),
-            "certificates": self._get_certificates(formatted_url),
-        }
+        with self._timed("scroll"):
+            self._scroll_page()
+
+        snapshot = self._take_snapshot()
+
+        profile_data = {"profile_url": formatted_url}
+        with self._using(snapshot):
+            with self._timed("about"):
+                profile_data["about"] = self._get_about()
+            with self._timed("experience"):
+                profile_data["experience"] = self._get_experience()
+            with self._timed("education"):
+                profile_data["education"] = self._get_education()
+        if DETAILS_MODE == "parallel":
+            with self._timed("details"):
+                profile_data.update(self._get_details_parallel(snapshot))
+        else:
+            with self._timed("projects"):
+                profile_data["projects"] = self._get_projects(formatted_url)
+            with self._timed("certificates"):
+                profile_data["certificates"] = self._get_certificates(formatted_url)
+
+        self.timings["total"] = time.perf_counter() - started
+        print("⏱️ Profile timings: " + ", ".join(f"{step} {seconds:.2f}s" for step, seconds in self.timings.items()))
 
         return profile_data
 
     def _scroll_page(self):
         """Scroll down the page to load more content"""
-        SCROLL_PAUSE_TIME = 1  # Reduced pause time
+        if isinstance(self.driver, SnapshotDriver):
+            # Scrolling happened on the live page before the snapshot was taken
+            return
         last_height = self.driver.execute_script("return document.body.scrollHeight")
 
         # Scroll more times to load posts and other content
@@ -111,15 +263,29 @@ class LinkedInScraper:
             self.driver.execute_script(
                 "window.scrollTo(0, document.body.scrollHeight);"
             )
-            time.sleep(SCROLL_PAUSE_TIME)
 
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            # Wait for lazy-loaded content to grow the page; stop once it no longer does,
+            # either because the network went quiet without growth or at SCROLL_TIMEOUT
+            quiet = {"count": None, "since": time.perf_counter()}
+
+            def grown_or_settled(driver):
+                height = driver.execute_script("return document.body.scrollHeight")
+                if height > last_height:
+                    return ("grown", height)
+                ready, count = driver.execute_script(NETWORK_STATE_JS)
+                now = time.perf_counter()
+                if ready != "complete" or count != quiet["count"]:
+                    quiet["count"], quiet["since"] = count, now
+                    return False
+                return ("settled", None) if now - quiet["since"] >= SCROLL_QUIET_SECONDS else False
 
-            # Break if no more content
-            if new_height == last_height:
+            try:
+                outcome, height = WebDriverWait(self.driver, SCROLL_TIMEOUT, poll_frequency=0.1).until(grown_or_settled)
+            except TimeoutException:
                 break
-            last_height = new_height
+            if outcome == "settled":
+                break
+            last_height = height
 
     def _get_about(self) -> Optional[str]:
         """Extract about section"""
@@ -383,6 +549,84 @@ class LinkedInScraper:
 
         return education_list
 
+    def _details_sections(self) -> Dict:
+        return {
+            section: spec for section, spec in DETAILS_SECTIONS.items()
+            if hasattr(self, spec[1]) and hasattr(self, spec[2])
+        }
+
+    def _collect_details_urls(self) -> Dict[str, str]:
+        """Every "Show all" details URL on the loaded main profile, by section"""
+        urls = {}
+        sections = self._details_sections()
+        for link in self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/details/"]'):
+            href = link.get_attribute("href") or ""
+            for section, (path, _, _) in sections.items():
+                if path in href and section not in urls:
+                    urls[section] = href
+        print(f"Found details pages: {', '.join(urls) or 'none'}")
+        return urls
+
+    def _fetch_details_in_tabs(self, urls: Dict[str, str]) -> Dict[str, List]:
+        """
+        Open all details pages at once in new tabs so they load concurrently,
+        then extract each tab in turn and close it. The main profile tab is
+        left as it was.
+        """
+        sections = self._details_sections()
+        main_window = self.driver.current_window_handle
+        tabs = {}
+        for section, url in urls.items():
+            before = set(self.driver.window_handles)
+            self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+            opened = [handle for handle in self.driver.window_handles if handle not in before]
+            if opened:
+                tabs[section] = opened[0]
+
+        results = {}
+        try:
+            for section, handle in tabs.items():
+                with self._timed(f"{section}_page"):
+                    try:
+                        self.driver.switch_to.window(handle)
+                    except Exception as e:
+                        # Still on another window; closing now could close the profile tab
+                        print(f"Could not switch to the {section} tab: {e}")
+                        continue
+                    try:
+                        try:
+                            self.wait.until(EC.presence_of_element_located(DETAILS_READY))
+                        except TimeoutException:
+                            print(f"Timed out waiting for {section} page to render")
+                        self._wait_for_network_idle()
+                        page = None
+                        if EXTRACTION_MODE == "snapshot":
+                            self._scroll_page()
+                            page = self._take_snapshot()
+                        with self._using(page):
+                            results[section] = getattr(self, sections[section][1])()
+                    except Exception as e:
+                        print(f"Error extracting {section} from details page: {e}")
+                    finally:
+                        self.driver.close()
+        finally:
+            self.driver.switch_to.window(main_window)
+        return results
+
+    def _get_details_parallel(self, snapshot: Optional[SnapshotDriver] = None) -> Dict[str, List]:
+        """Projects, certificates (and skills when available) without reloading the main profile"""
+        with self._using(snapshot):
+            urls = self._collect_details_urls()
+        results = self._fetch_details_in_tabs(urls) if urls else {}
+
+        # Sections without a details page (or whose tab failed) are read from the main profile
+        for section, (_, _, main_extractor) in self._details_sections().items():
+            if section not in results:
+                with self._timed(f"{section}_main"), self._using(snapshot):
+                    results[section] = getattr(self, main_extractor)()
+            print(f"Total {section} found: {len(results[section])}")
+        return results
+
     def _get_projects(self, main_profile_url: str) -> List[Dict]:
         """Extract projects data"""
         projects_list = []
@@ -446,16 +690,16 @@ class LinkedInScraper:
                     # Navigate to projects page
                     projects_url = projects_button.get_attribute("href")
                     print(f"Navigating to projects page: {projects_url}")
-                    self.driver.get(projects_url)
-                    time.sleep(3)  # Wait for projects page to load
+                    with self._timed("projects_page_load"):
+                        self._load(projects_url, DETAILS_READY)
 
                     # Extract all projects from the projects page
                     projects_list = self._extract_projects_from_page()
 
                     # Navigate back to main profile
                     print(f"Navigating back to main profile: {main_profile_url}")
-                    self.driver.get(main_profile_url)
-                    time.sleep(2)  # Wait for main page to load
+                    with self._timed("main_page_reload"):
+                        self._load(main_profile_url)
 
                 else:
                     print(
@@ -481,9 +725,6 @@ class LinkedInScraper:
         try:
             print("Extracting projects from projects page...")
 
-            # Wait for the projects page to load
-            time.sleep(2)
-
             # Scroll to load all projects
             self._scroll_page()
 
@@ -767,16 +1008,16 @@ class LinkedInScraper:
                     # Navigate to certificates page
                     certificates_url = certificates_button.get_attribute("href")
                     print(f"Navigating to certificates page: {certificates_url}")
-                    self.driver.get(certificates_url)
-                    time.sleep(3)  # Wait for certificates page to load
+                    with self._timed("certificates_page_load"):
+                        self._load(certificates_url, DETAILS_READY)
 
                     # Extract all certificates from the certificates page
                     certificates_list = self._extract_certificates_from_page()
 
                     # Navigate back to main profile
                     print(f"Navigating back to main profile: {main_profile_url}")
-                    self.driver.get(main_profile_url)
-                    time.sleep(2)  # Wait for main page to load
+                    with self._timed("main_page_reload"):
+                        self._load(main_profile_url)
 
                 else:
                     print(
@@ -802,9 +1043,6 @@ class LinkedInScraper:
         try:
             print("Extracting certificates from certificates page...")
 
-            # Wait for the certificates page to load
-            time.sleep(2)
-
             # Scroll to load all certificates
             self._scroll_page()
 
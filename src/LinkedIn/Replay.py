@@ -0,0 +1,391 @@
+"""
+Record/replay of the pages a LinkedIn scrape visits, so extraction can be run
+and measured without a login, a browser or the network.
+
+Recording: set LINKEDIN_RECORD_DIR and LinkedInScraper.setup_driver wraps
+Chrome in a RecordingDriver, which saves each page's final HTML (before the
+scraper navigates away, switches or closes a tab, or when page_source is read)
+into a fixture directory keyed by URL.
+
+Replay: ReplayDriver answers the WebDriver calls the scraper makes (get, tabs,
+find_element(s), .text, get_attribute, scripts) from a fixture directory, with
+an optional simulated round-trip latency and a round-trip counter.
+
+    python -m LinkedIn.Replay --synthetic 25 --output LinkedIn/fixtures
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from LinkedIn.Snapshot import SnapshotDriver, SnapshotElement
+
+EMPTY_PAGE = "<html><head></head><body></body></html>"
+INDEX_FILE = "index.json"
+
+
+def url_key(url: str) -> str:
+    """Fixture key for a URL: scheme, host and path, without query, fragment or trailing slash"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def is_profile_url(url: str) -> bool:
+    path = urlsplit(url).path.strip("/").split("/")
+    return len(path) == 2 and path[0] == "in"
+
+
+class FixtureStore:
+    """A directory of saved pages plus an index.json mapping URL keys to files."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        index_path = os.path.join(directory, INDEX_FILE)
+        self.index = {}
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def save(self, url: str, html: str):
+        key = url_key(url)
+        filename = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".html"
+        with self.lock:
+            with open(os.path.join(self.directory, filename), "w", encoding="utf-8") as f:
+                f.write(html)
+            self.index[key] = filename
+            with open(os.path.join(self.directory, INDEX_FILE), "w", encoding="utf-8") as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+
+    def load(self, url: str) -> Optional[str]:
+        filename = self.index.get(url_key(url))
+        if filename is None:
+            return None
+        with open(os.path.join(self.directory, filename), encoding="utf-8") as f:
+            return f.read()
+
+    def urls(self) -> List[str]:
+        return sorted(self.index)
+
+    def profile_urls(self) -> List[str]:
+        return [url + "/" for url in self.urls() if is_profile_url(url)]
+
+
+# -- recording -------------------------------------------------------------
+class _RecordingSwitchTo:
+    def __init__(self, recorder: "RecordingDriver"):
+        self.recorder = recorder
+
+    def window(self, handle):
+        self.recorder.record()
+        self.recorder.driver.switch_to.window(handle)
+
+    def __getattr__(self, name):
+        return getattr(self.recorder.driver.switch_to, name)
+
+
+class RecordingDriver:
+    """Wraps a live WebDriver and saves every page it leaves into a FixtureStore."""
+
+    def __init__(self, driver, store):
+        self.driver = driver
+        self.store = store if isinstance(store, FixtureStore) else FixtureStore(store)
+        self.switch_to = _RecordingSwitchTo(self)
+
+    def record(self):
+        try:
+            url = self.driver.current_url
+            if url.startswith("http"):
+                self.store.save(url, self.driver.page_source)
+        except WebDriverException:
+            pass
+
+    @property
+    def page_source(self) -> str:
+        html = self.driver.page_source
+        self.store.save(self.driver.current_url, html)
+        return html
+
+    def get(self, url: str):
+        self.record()
+        self.driver.get(url)
+
+    def close(self):
+        self.record()
+        self.driver.close()
+
+    def quit(self):
+        self.record()
+        self.driver.quit()
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+# -- replay ----------------------------------------------------------------
+class ReplayElement:
+    """SnapshotElement whose every call counts (and optionally costs) a driver round trip."""
+
+    def __init__(self, element: SnapshotElement, driver: "ReplayDriver"):
+        self.element = element
+        self.driver = driver
+
+    def find_element(self, by, value=None):
+        self.driver._trip()
+        return ReplayElement(self.element.find_element(by, value), self.driver)
+
+    def find_elements(self, by, value=None):
+        self.driver._trip()
+        return [ReplayElement(e, self.driver) for e in self.element.find_elements(by, value)]
+
+    @property
+    def text(self) -> str:
+        self.driver._trip()
+        return self.element.text
+
+    @property
+    def tag_name(self) -> str:
+        self.driver._trip()
+        return self.element.tag_name
+
+    def get_attribute(self, name: str):
+        self.driver._trip()
+        return self.element.get_attribute(name)
+
+    def is_displayed(self) -> bool:
+        self.driver._trip()
+        return self.element.is_displayed()
+
+    def click(self):
+        self.driver._trip()
+
+
+class _ReplaySwitchTo:
+    def __init__(self, driver: "ReplayDriver"):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver._trip()
+        if handle not in self.driver.tabs:
+            raise WebDriverException(f"no such window: {handle}")
+        self.driver.current = handle
+
+
+class ReplayDriver:
+    """
+    Browser-free WebDriver over a FixtureStore. Pages missing from the store
+    load as an empty document. `round_trip` seconds are slept on every call
+    to emulate a remote browser; `round_trips` counts the calls.
+    """
+
+    def __init__(self, store, round_trip: float = 0.0):
+        self.store = store if isinstance(store, FixtureStore) else FixtureStore(store)
+        self.round_trip = round_trip
+        self.round_trips = 0
+        self.loads = 0
+        self.tabs = {"tab-0": SnapshotDriver(EMPTY_PAGE, "about:blank")}
+        self.current = "tab-0"
+        self._opened = 0
+        self.switch_to = _ReplaySwitchTo(self)
+
+    def _trip(self):
+        self.round_trips += 1
+        if self.round_trip:
+            time.sleep(self.round_trip)
+
+    def _open(self, url: str) -> SnapshotDriver:
+        self.loads += 1
+        return SnapshotDriver(self.store.load(url) or EMPTY_PAGE, url)
+
+    @property
+    def page(self) -> SnapshotDriver:
+        return self.tabs[self.current]
+
+    def get(self, url: str):
+        self._trip()
+        self.tabs[self.current] = self._open(url)
+
+    @property
+    def current_url(self) -> str:
+        self._trip()
+        return self.page.current_url
+
+    @property
+    def page_source(self) -> str:
+        self._trip()
+        return self.page.page_source
+
+    @property
+    def window_handles(self) -> List[str]:
+        self._trip()
+        return list(self.tabs)
+
+    @property
+    def current_window_handle(self) -> str:
+        self._trip()
+        return self.current
+
+    def find_element(self, by, value=None):
+        self._trip()
+        return ReplayElement(self.page.find_element(by, value), self)
+
+    def find_elements(self, by, value=None):
+        self._trip()
+        return [ReplayElement(e, self) for e in self.page.find_elements(by, value)]
+
+    def execute_script(self, script: str, *args):
+        self._trip()
+        if "window.open" in script:
+            self._opened += 1
+            self.tabs[f"tab-{self._opened}"] = self._open(args[0])
+            return None
+        if "performance.getEntriesByType" in script:
+            return ["complete", 0]
+        if "scrollHeight" in script and script.lstrip().startswith("return"):
+            return 1000
+        return None
+
+    def close(self):
+        self._trip()
+        self.tabs.pop(self.current, None)
+
+    def quit(self):
+        self.tabs.clear()
+
+
+# -- synthetic fixtures ----------------------------------------------------
+SCHOOLS = ["MIT", "Stanford University", "FAST NUCES", "LUMS", "ETH Zurich", "University of Toronto"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+TITLES = ["Software Engineer", "Data Scientist", "ML Engineer", "Backend Developer", "Intern", "DevOps Engineer"]
+SKILLS = ["Python", "Django", "React", "Docker", "Kubernetes", "PyTorch", "SQL", "AWS", "FastAPI", "Go"]
+ISSUERS = ["Coursera", "Google", "Amazon Web Services", "Microsoft", "DeepLearning.AI"]
+
+
+def _visible(text: str) -> str:
+    return f'<span aria-hidden="true">{text}</span><span class="visually-hidden">{text}</span>'
+
+
+def _entity(title: str, subtitle: str, caption: str, extra: str = "") -> str:
+    return (
+        '<li class="artdeco-list__item pvs-list__item--line-separated pvs-list__paged-list-item">'
+        '<div data-view-name="profile-component-entity" class="display-flex flex-row">'
+        '<div class="display-flex flex-column full-width">'
+        f'<div class="display-flex align-items-center mr1 hoverable-link-text t-bold">{_visible(title)}</div>'
+        f'<span class="t-14 t-normal">{_visible(subtitle)}</span>'
+        '<span class="t-14 t-normal t-black--light">'
+        f'<span class="pvs-entity__caption-wrapper" aria-hidden="true">{caption}</span></span>'
+        f"{extra}</div></div></li>"
+    )
+
+
+def _card(anchor: str, heading: str, items: List[str], footer: str = "") -> str:
+    return (
+        f'<section class="artdeco-card pv-profile-card break-words"><div id="{anchor}" class="pv-profile-card__anchor"></div>'
+        f'<div class="pvs-header__container"><h2>{_visible(heading)}</h2></div>'
+        f'<div class="pvs-list__outer-container"><ul class="pvs-list">{"".join(items)}</ul></div>{footer}</section>'
+    )
+
+
+def _page(body: str, title: str) -> str:
+    filler = "".join(
+        f'<div class="scaffold-layout__aside"><ul>{"".join(f"<li><a href=https://www.linkedin.com/in/peer-{i}-{j}/>Peer {j}</a></li>" for j in range(8))}</ul></div>'
+        for i in range(6)
+    )
+    return (
+        f"<html><head><title>{title}</title><script>window.__data = {{}};</script></head>"
+        f'<body><div class="application-outlet"><main class="scaffold-layout__main">{body}</main>{filler}</div></body></html>'
+    )
+
+
+def synthetic_profile(username: str, rng: random.Random) -> Dict[str, str]:
+    """HTML for one made-up profile and its details pages, keyed by URL"""
+    base = f"https://www.linkedin.com/in/{username}/"
+    experience = [
+        _entity(rng.choice(TITLES), f"{rng.choice(COMPANIES)} · {rng.choice(['Full-time', 'Internship'])}",
+                f"{2015 + i} - {2016 + i + rng.randint(0, 3)}")
+        for i in range(rng.randint(1, 6))
+    ]
+    education = [
+        _entity(rng.choice(SCHOOLS), "BSc Computer Science", f"{2010 + i} - {2014 + i}")
+        for i in range(rng.randint(1, 3))
+    ]
+
+    def project(i):
+        skills = ", ".join(rng.sample(SKILLS, 3))
+        extra = (
+            f'<div class="inline-show-more-text">{_visible(f"Project {i} built with {skills}.")}</div>'
+            f'<div class="hoverable-link-text display-flex align-items-center t-14 t-normal t-black"><strong>Skills: {skills}</strong></div>'
+            f'<a href="https://github.com/{username}/project-{i}"><div class="t-14 t-bold break-words">{_visible("Repository")}</div></a>'
+        )
+        return _entity(f"Project {i}", f"Jan {2019 + i} - Present", "", extra)
+
+    def certificate(i):
+        extra = (
+            f'<span class="t-14 t-normal t-black--light">{_visible(f"Credential ID ABC{i:04d}")}</span>'
+            f'<a href="https://www.coursera.org/verify/{username}-{i}"><span>Show credential</span></a>'
+        )
+        return _entity(f"Certificate {i}", rng.choice(ISSUERS), f"Issued Mar {2018 + i}", extra)
+
+    projects = [project(i) for i in range(rng.randint(0, 8))]
+    certificates = [certificate(i) for i in range(rng.randint(0, 8))]
+
+    def show_all(section, path, items):
+        if len(items) <= 2:
+            return ""
+        return (
+            f'<div class="pvs-list__footer-wrapper"><a class="optional-action-target-wrapper" '
+            f'id="navigation-index-see-all-{section}" href="{base}details/{path}/">'
+            f'<span class="pvs-navigation__text">Show all {len(items)} {section}</span></a></div>'
+        )
+
+    about = " ".join(f"I work on {rng.choice(SKILLS)} systems." for _ in range(rng.randint(2, 12)))
+    main = (
+        f'<section class="artdeco-card"><h1 class="text-heading-xlarge">{username.title()}</h1></section>'
+        f'<section class="artdeco-card"><div id="about"></div><div class="display-flex ph5 pv3">'
+        f'<div class="inline-show-more-text">{_visible(about)}</div></div></section>'
+        + _card("experience", "Experience", experience)
+        + _card("education", "Education", education)
+        + (_card("projects", "Projects", projects[:2], show_all("projects", "projects", projects)) if projects else "")
+        + (_card("licenses_and_certifications", "Licenses & certifications", certificates[:2],
+                 show_all("licenses-and-certifications", "certifications", certificates)) if certificates else "")
+    )
+    pages = {base: _page(main, username)}
+    if len(projects) > 2:
+        pages[f"{base}details/projects/"] = _page(_card("projects", "Projects", projects), username)
+    if len(certificates) > 2:
+        pages[f"{base}details/certifications/"] = _page(
+            _card("certifications", "Licenses & certifications", certificates), username
+        )
+    return pages
+
+
+def write_synthetic_fixtures(directory: str, count: int = 20, seed: int = 0) -> List[str]:
+    """Write `count` synthetic profiles (with details pages) to a fixture store; returns the profile URLs"""
+    store = FixtureStore(directory)
+    rng = random.Random(seed)
+    urls = []
+    for i in range(count):
+        pages = synthetic_profile(f"synthetic-user-{i}", rng)
+        for url, html in pages.items():
+            store.save(url, html)
+        urls.append(next(iter(pages)))
+    return urls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic LinkedIn fixtures")
+    parser.add_argument("--output", default=os.path.join("LinkedIn", "fixtures"))
+    parser.add_argument("--synthetic", type=int, default=20, help="number of profiles")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    urls = write_synthetic_fixtures(args.output, args.synthetic, args.seed)
+    print(f"✅ Wrote {len(urls)} synthetic profiles to {args.output}")
@@ -0,0 +1,217 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from queue import Empty, Queue
+from typing import Dict
+
+from dotenv import load_dotenv
+
+from LinkedIn.LinkedIn_Scraper import LinkedInScraper
+
+load_dotenv()
+
+POOL_SIZE = int(os.getenv("LINKEDIN_POOL_SIZE", 2))
+# A browser is quit and replaced after this many profile pages
+MAX_PAGES_PER_SESSION = int(os.getenv("LINKEDIN_MAX_PAGES_PER_SESSION", 40))
+HEADLESS = os.getenv("LINKEDIN_HEADLESS", "1").lower() not in ("0", "false", "no")
+COOKIE_PATH = os.getenv(
+    "LINKEDIN_COOKIE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "linkedin_cookies.json"),
+)
+CHECKOUT_TIMEOUT = int(os.getenv("LINKEDIN_CHECKOUT_TIMEOUT", 300))
+
+
+class PooledSession:
+    def __init__(self, scraper: LinkedInScraper):
+        self.scraper = scraper
+        self.pages = 0
+        self.created_at = time.time()
+
+
+class SessionPool:
+    """
+    Pool of long-lived, logged-in headless browsers.
+
+    Sessions are created lazily up to `size`. A new browser first tries the
+    persisted cookies and only logs in when they no longer work, so the
+    account is not challenged by repeated logins. Checked-out sessions are
+    health-checked, and recycled after `max_pages` profiles or any error.
+    """
+
+    def __init__(self, email: str, password: str, size: int = POOL_SIZE,
+                 max_pages: int = MAX_PAGES_PER_SESSION, cookie_path: str = COOKIE_PATH,
+                 headless: bool = HEADLESS):
+        self.email = email
+        self.password = password
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.cookie_path = cookie_path
+        self.headless = headless
+        self.idle = Queue()
+        self.created = 0
+        self.lock = threading.Lock()
+        self.cookie_lock = threading.Lock()
+        self.stats = {"created": 0, "recycled": 0, "logins": 0, "cookie_logins": 0, "pages": 0}
+
+    def _count(self, stat: str):
+        # Sessions are created, checked in and discarded from many worker threads
+        with self.lock:
+            self.stats[stat] += 1
+
+    # -- cookies ---------------------------------------------------------
+    def _load_cookies(self, scraper: LinkedInScraper) -> bool:
+        with self.cookie_lock:
+            if not os.path.exists(self.cookie_path):
+                return False
+            with open(self.cookie_path, encoding="utf-8") as f:
+                cookies = json.load(f)
+
+        # Cookies can only be set for the domain currently loaded
+        scraper.driver.get("https://www.linkedin.com/")
+        for cookie in cookies:
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            try:
+                scraper.driver.add_cookie(cookie)
+            except Exception:
+                continue
+        return scraper.is_logged_in()
+
+    def _save_cookies(self, scraper: LinkedInScraper):
+        directory = os.path.dirname(self.cookie_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self.cookie_lock:
+            tmp_path = self.cookie_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(scraper.driver.get_cookies(), f)
+            os.replace(tmp_path, self.cookie_path)
+
+    # -- lifecycle -------------------------------------------------------
+    def _create(self) -> PooledSession:
+        scraper = LinkedInScraper()
+        scraper.setup_driver(headless=self.headless)
+        try:
+            if self._load_cookies(scraper):
+                self._count("cookie_logins")
+                print("🍪 LinkedIn session restored from cookies")
+            else:
+                scraper.login(self.email, self.password)
+                self._count("logins")
+                if not scraper.is_logged_in():
+                    raise RuntimeError("LinkedIn login failed or was challenged")
+                self._save_cookies(scraper)
+                print("🔐 LinkedIn session logged in, cookies saved")
+        except Exception:
+            scraper.close()
+            raise
+        self._count("created")
+        return PooledSession(scraper)
+
+    def _healthy(self, session: PooledSession) -> bool:
+        try:
+            session.scraper.driver.execute_script("return 1")
+            url = session.scraper.driver.current_url
+            return not any(marker in url for marker in ("/login", "/checkpoint", "/authwall"))
+        except Exception:
+            return False
+
+    def _discard(self, session: PooledSession):
+        try:
+            session.scraper.close()
+        except Exception:
+            pass
+        with self.lock:
+            self.created -= 1
+        self._count("recycled")
+
+    def checkout(self, timeout: float = CHECKOUT_TIMEOUT) -> PooledSession:
+        deadline = time.time() + timeout
+        while True:
+            try:
+                session = self.idle.get_nowait()
+            except Empty:
+                with self.lock:
+                    can_create = self.created < self.size
+                    if can_create:
+                        self.created += 1
+                if can_create:
+                    try:
+                        return self._create()
+                    except Exception:
+                        with self.lock:
+                            self.created -= 1
+                        raise
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError("No LinkedIn session became available")
+                try:
+                    session = self.idle.get(timeout=remaining)
+                except Empty:
+                    continue
+
+            if self._healthy(session):
+                return session
+            print("♻️ Replacing unhealthy LinkedIn session")
+            self._discard(session)
+
+    def checkin(self, session: PooledSession, broken: bool = False):
+        session.pages += 1
+        self._count("pages")
+        if broken or session.pages >= self.max_pages:
+            self._discard(session)
+        else:
+            self.idle.put(session)
+
+    @contextmanager
+    def session(self):
+        """Check out a logged-in scraper for the duration of the block."""
+        session = self.checkout()
+        broken = False
+        try:
+            yield session.scraper
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.checkin(session, broken=broken)
+
+    def close(self):
+        while True:
+            try:
+                session = self.idle.get_nowait()
+            except Empty:
+                break
+            self._discard(session)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(email: str = None, password: str = None, size: int = None) -> SessionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            email = email or os.getenv("LINKEDIN_EMAIL")
+            password = password or os.getenv("LINKEDIN_PASSWORD")
+            if not email or not password:
+                raise ValueError(
+                    "LinkedIn credentials not found. Please provide email and password or set them in .env file"
+                )
+            _pool = SessionPool(email, password, size=size or POOL_SIZE)
+        return _pool
+
+
+def scrape_linkedin_profile(applicant_id: str, profile_url: str, email: str = None,
+                            password: str = None, pool_size: int = None) -> Dict:
+    """Same result as LinkedIn_Scraper.scrape_linkedin_profile, using a pooled session."""
+    pool = get_pool(email, password, pool_size)
+    try:
+        with pool.session() as scraper:
+            profile_data = scraper.get_profile_info(profile_url)
+        return {"id": applicant_id, "source": "linkedin", "data": profile_data}
+    except Exception as e:
+        raise Exception(f"Error scraping profile: {str(e)}")
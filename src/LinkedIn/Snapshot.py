@@ -0,0 +1,163 @@
+"""
+Offline stand-in for a Selenium WebDriver over one parsed copy of a page.
+
+LinkedInScraper's extractors walk long CSS selector chains with
+find_element/find_elements/.text; against a live browser every call (and
+every NoSuchElementException from a fallback selector) is a WebDriver round
+trip. SnapshotDriver parses driver.page_source once with BeautifulSoup(lxml)
+and answers the same calls locally, so the extractors run unchanged against
+either. It also works on saved HTML files, for testing without a browser.
+"""
+import re
+from functools import lru_cache
+from typing import List
+
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.element import Comment
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+from selenium.webdriver.common.by import By
+
+# Elements that start a new line in the rendered text (as Selenium's .text does)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav",
+    "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+SKIPPED_TAGS = {"script", "style", "template", "noscript", "head"}
+WHITESPACE_RE = re.compile(r"\s+")
+HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+
+# The only XPath form the scraper uses: ./ancestor::tag[contains(@class, "name")]
+ANCESTOR_XPATH_RE = re.compile(
+    r"""^\./ancestor::(?P<tag>[\w*]+)(?:\[contains\(@class,\s*["'](?P<cls>[^"']+)["']\)\])?$"""
+)
+
+
+@lru_cache(maxsize=512)
+def _compile(selector: str):
+    """Each selector string is compiled once per process."""
+    return soupsieve.compile(selector)
+
+
+def _hidden(tag: Tag) -> bool:
+    return tag.name in SKIPPED_TAGS or tag.has_attr("hidden") or bool(
+        HIDDEN_STYLE_RE.search(tag.get("style", ""))
+    )
+
+
+def _rendered_text(tag: Tag) -> str:
+    """Approximation of innerText: block elements on their own lines, whitespace collapsed."""
+    parts = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, Comment):
+                continue
+            if isinstance(child, NavigableString):
+                parts.append(WHITESPACE_RE.sub(" ", str(child)))
+            elif isinstance(child, Tag) and not _hidden(child):
+                block = child.name in BLOCK_TAGS
+                if block:
+                    parts.append("\n")
+                walk(child)
+                if block:
+                    parts.append("\n")
+
+    walk(tag)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _css(by: str, value: str) -> str:
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.TAG_NAME:
+        return value
+    if by == By.NAME:
+        return f'[name="{value}"]'
+    return None
+
+
+class _Searchable:
+    tag: Tag = None
+
+    def _find_all(self, by: str, value: str) -> List["SnapshotElement"]:
+        if by == By.XPATH:
+            return self._xpath(value)
+        css = _css(by, value)
+        if css is None:
+            raise InvalidSelectorException(f"Unsupported locator in snapshot mode: {by}")
+        return [SnapshotElement(tag) for tag in _compile(css).select(self.tag)]
+
+    def _xpath(self, value: str) -> List["SnapshotElement"]:
+        match = ANCESTOR_XPATH_RE.match(value.strip())
+        if not match:
+            raise InvalidSelectorException(f"Unsupported XPath in snapshot mode: {value}")
+        name, cls = match.group("tag"), match.group("cls")
+        return [
+            SnapshotElement(parent) for parent in self.tag.parents
+            if isinstance(parent, Tag) and parent.name != "[document]"
+            and (name == "*" or parent.name == name)
+            and (cls is None or cls in " ".join(parent.get("class", [])))
+        ]
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> List["SnapshotElement"]:
+        return self._find_all(by, value)
+
+    def find_element(self, by: str = By.ID, value: str = None) -> "SnapshotElement":
+        found = self._find_all(by, value)
+        if not found:
+            raise NoSuchElementException(f"No element for {by}={value!r} in snapshot")
+        return found[0]
+
+
+class SnapshotElement(_Searchable):
+    def __init__(self, tag: Tag):
+        self.tag = tag
+
+    @property
+    def text(self) -> str:
+        return _rendered_text(self.tag)
+
+    @property
+    def tag_name(self) -> str:
+        return self.tag.name
+
+    def get_attribute(self, name: str):
+        if name in ("textContent", "innerText"):
+            return self.tag.get_text() if name == "textContent" else self.text
+        if name in ("innerHTML", "outerHTML"):
+            return self.tag.decode_contents() if name == "innerHTML" else str(self.tag)
+        value = self.tag.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+    def is_displayed(self) -> bool:
+        return not any(_hidden(tag) for tag in [self.tag, *self.tag.parents] if isinstance(tag, Tag))
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotElement) and self.tag is other.tag
+
+    def __hash__(self):
+        return id(self.tag)
+
+
+class SnapshotDriver(_Searchable):
+    """Read-only driver over one parsed page; navigation and scripts are not available."""
+
+    def __init__(self, page_source: str, current_url: str = ""):
+        self.page_source = page_source
+        self.current_url = current_url
+        self.tag = BeautifulSoup(page_source, "lxml")
+
+    def execute_script(self, script: str, *args):
+        return None
+
+    def get(self, url: str):
+        raise RuntimeError("SnapshotDriver cannot navigate; take a new snapshot instead")
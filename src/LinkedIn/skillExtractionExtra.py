@@ -39,16 +39,16 @@
                 # Navigate to skills page
                 skills_url = skills_link.get_attribute("href")
                 print(f"Navigating to skills page: {skills_url}")
-                self.driver.get(skills_url)
-                time.sleep(3)  # Wait for skills page to load
+                with self._timed("skills_page_load"):
+                    self._load(skills_url, DETAILS_READY)
 
                 # Extract all skills from the skills page
                 skills_list = self._extract_skills_from_page()
 
                 # Navigate back to main profile
                 print(f"Navigating back to main profile: {main_profile_url}")
-                self.driver.get(main_profile_url)
-                time.sleep(2)  # Wait for main page to load
+                with self._timed("main_page_reload"):
+                    self._load(main_profile_url)
 
             else:
                 print(
@@ -76,9 +76,6 @@
         try:
             print("Extracting skills from skills page...")
 
-            # Wait for the skills page to load
-            time.sleep(2)
-
             # Scroll to load all skills
             self._scroll_page()
 
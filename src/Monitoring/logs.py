@@ -0,0 +1,161 @@
+"""
+Structured logging for the ranking pipeline.
+
+Worker threads only put records on an in-memory queue; one QueueListener
+thread formats them and writes to stdout, so a slow terminal or log shipper
+never blocks applicant processing. Records are queued as logged (message
+and %-args not yet merged), so pass large values as arguments rather than
+in f-strings and do not mutate them after logging. Every record carries the
+job (post) and applicant IDs bound with `bind()`:
+
+    logger = logging.getLogger(__name__)
+    with logs.bind(job_id=post_id, applicant_id=user_id):
+        logger.info("📄 Parsing resume")
+
+Large payloads (LLM prompts, raw outputs, parsed JSON) go through
+`payload()`, which is rendered in the sink thread, and only for records that
+pass the level check, and is cut to LOG_PAYLOAD_CHARS unless the record is
+sampled (LOG_PAYLOAD_SAMPLE_RATE).
+
+LOG_LEVEL (default INFO) and LOG_FORMAT ("json" or "text", default json)
+are read from the environment.
+"""
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_PAYLOAD_CHARS = int(os.getenv("LOG_PAYLOAD_CHARS", 500))
+# Fraction of large payloads logged in full
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", 0))
+
+job_id = contextvars.ContextVar("job_id", default=None)
+applicant_id = contextvars.ContextVar("applicant_id", default=None)
+_CONTEXT = {"job_id": job_id, "applicant_id": applicant_id}
+
+# Attributes every LogRecord has; anything else was passed with extra=
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+@contextlib.contextmanager
+def bind(**ids):
+    """Attach job_id / applicant_id to every record logged inside the block (this thread only)"""
+    tokens = [(_CONTEXT[name], _CONTEXT[name].set(None if value is None else str(value))) for name, value in ids.items()]
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class _Payload:
+    def __init__(self, value, limit):
+        self.value = value
+        self.limit = limit
+        self.full = LOG_PAYLOAD_SAMPLE_RATE > 0 and random.random() < LOG_PAYLOAD_SAMPLE_RATE
+
+    def __str__(self):
+        text = self.value if isinstance(self.value, str) else json.dumps(self.value, default=str)
+        if self.full or len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}… (+{len(text) - self.limit} chars)"
+
+
+def payload(value, limit=None):
+    """Lazily truncated (or sampled in full) rendering of a large string or JSON value"""
+    return _Payload(value, LOG_PAYLOAD_CHARS if limit is None else limit)
+
+
+class ContextFilter(logging.Filter):
+    """Copies the bound IDs onto the record in the logging thread, before it is queued"""
+
+    def filter(self, record):
+        for name, var in _CONTEXT.items():
+            if not hasattr(record, name):
+                setattr(record, name, var.get())
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler whose prepare() leaves formatting to the sink thread. The
+    stock prepare() calls format() in the logging thread so records can be
+    pickled; this queue never leaves the process, so that is not needed.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_FIELDS and value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s%(context)s: %(message)s")
+
+    def format(self, record):
+        ids = [f"{name}={getattr(record, name)}" for name in _CONTEXT if getattr(record, name, None)]
+        record.context = f" [{' '.join(ids)}]" if ids else ""
+        return super().format(record)
+
+
+_listener = None
+
+
+def setup(level=LOG_LEVEL, fmt=LOG_FORMAT, stream=None):
+    """Route the root logger through the queue sink; safe to call more than once"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    sink = logging.StreamHandler(stream or sys.stdout)
+    sink.setFormatter(JSONFormatter() if fmt == "json" else TextFormatter())
+    records = queue.SimpleQueue()
+    handler = DeferredQueueHandler(records)
+    handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+    # Chatty third-party loggers stay at WARNING
+    for name in ("urllib3", "httpx", "pymongo", "filelock"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _listener = logging.handlers.QueueListener(records, sink, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
+    return _listener
+
+
+def shutdown():
+    """Flush queued records and stop the sink thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,316 @@
+"""
+In-process counters, gauges and histograms rendered in the Prometheus text
+exposition format (served at /metrics by app.py, and by worker.py with
+--metrics-port).
+
+Stages are timed with `timed(stage)`, which records the duration in
+ranking_stage_seconds, counts exceptions in ranking_stage_errors_total,
+tracks ranking_in_flight while the block runs and wraps it in a tracing
+span of the same name:
+
+    with metrics.timed("download"):
+        gdown.download(...)
+
+Every update is a dict lookup plus a short lock, so instrumenting the
+(seconds-long) stages costs nothing measurable.
+"""
+import bisect
+import contextlib
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pymongo import monitoring
+
+from Monitoring import tracing
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers cached lookups up to multi-minute LLM calls
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+MONGO_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def _format_value(value):
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **named):
+        if named:
+            values = tuple(named[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _items(self):
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            yield list(zip(self.labelnames, key)), child
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self.lock:
+            self.value -= amount
+
+    def set(self, value):
+        with self.lock:
+            self.value = float(value)
+
+    def set_function(self, function):
+        """Read the value from `function()` at scrape time instead"""
+        self.function = function
+
+    def get(self):
+        if self.function is not None:
+            try:
+                return float(self.function())
+            except Exception:
+                return math.nan
+        return self.value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+    def samples(self):
+        for labels, child in self._items():
+            yield "_total" if not self.name.endswith("_total") else "", labels, child.get()
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value):
+        self.labels().set(value)
+
+    def samples(self):
+        for labels, child in self._items():
+            yield "", labels, child.get()
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=STAGE_BUCKETS, registry=REGISTRY):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def totals(self):
+        """{label values: (count, sum)} for every label set observed so far"""
+        totals = {}
+        for labels, child in self._items():
+            with child.lock:
+                totals[tuple(value for _, value in labels)] = (sum(child.counts), child.sum)
+        return totals
+
+    def samples(self):
+        for labels, child in self._items():
+            with child.lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield "_bucket", labels + [("le", _format_value(bound))], cumulative
+            yield "_count", labels, cumulative
+            yield "_sum", labels, total
+
+
+STAGE_SECONDS = Histogram(
+    "ranking_stage_seconds", "Time spent in each processing stage", ["stage"], buckets=STAGE_BUCKETS
+)
+STAGE_ERRORS = Counter("ranking_stage_errors_total", "Processing stage runs that raised", ["stage"])
+IN_FLIGHT = Gauge("ranking_in_flight", "Work currently running in each stage", ["stage"])
+QUEUE_DEPTH = Gauge("ranking_queue_depth", "Items waiting in each queue", ["queue"])
+MONGO_SECONDS = Histogram(
+    "mongo_command_seconds", "MongoDB command latency", ["operation", "command"], buckets=MONGO_BUCKETS
+)
+MONGO_ERRORS = Counter("mongo_command_errors_total", "MongoDB commands that failed", ["operation", "command"])
+
+
+@contextlib.contextmanager
+def timed(stage):
+    """Time a block (or, as a decorator, a function) as one run of `stage`"""
+    in_flight = IN_FLIGHT.labels(stage)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        with tracing.span(stage):
+            yield
+    except BaseException:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - start)
+        in_flight.dec()
+
+
+READ_COMMANDS = {"find", "getMore", "aggregate", "count", "countDocuments", "distinct"}
+WRITE_COMMANDS = {"insert", "update", "delete", "findAndModify", "bulkWrite", "createIndexes"}
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every read and write command sent by clients created after registration"""
+
+    def __init__(self):
+        self._started = {}
+
+    @staticmethod
+    def _operation(command_name):
+        if command_name in READ_COMMANDS:
+            return "read"
+        if command_name in WRITE_COMMANDS:
+            return "write"
+        return None
+
+    def started(self, event):
+        if self._operation(event.command_name):
+            self._started[(event.connection_id, event.request_id)] = time.perf_counter()
+
+    def _finish(self, event, failed):
+        start = self._started.pop((event.connection_id, event.request_id), None)
+        if start is None:
+            return
+        operation = self._operation(event.command_name)
+        MONGO_SECONDS.labels(operation, event.command_name).observe(time.perf_counter() - start)
+        if failed:
+            MONGO_ERRORS.labels(operation, event.command_name).inc()
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+
+_mongo_listener = None
+
+
+def instrument_mongo():
+    """Register the command listener once; call before creating MongoClients"""
+    global _mongo_listener
+    if _mongo_listener is None:
+        _mongo_listener = MongoCommandMetrics()
+        monitoring.register(_mongo_listener)
+    return _mongo_listener
+
+
+def render():
+    return REGISTRY.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, host="0.0.0.0"):
+    """Expose /metrics on its own port from a daemon thread (for processes without the API)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True).start()
+    return server
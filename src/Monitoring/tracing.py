@@ -0,0 +1,369 @@
+"""
+Lightweight tracing in the OpenTelemetry data model: spans with trace and
+span IDs, parent links, attributes and a status, propagated between
+services with the W3C `traceparent` header.
+
+Disabled unless TRACING_ENABLED=1; while disabled `span()` returns a shared
+no-op and nothing is recorded. Finished spans go to TRACE_EXPORTER:
+"file" appends one JSON object per line to TRACE_FILE, "console" sends them
+through the log sink. Only TRACE_SAMPLE_RATE of new traces are recorded.
+
+    with tracing.span("fetch_user_data", post_id=post_id):
+        ...
+    @tracing.traced("fetch_job_post")     # decorator form
+    headers = tracing.inject({})          # outgoing request
+    with tracing.span("scrape", parent=tracing.extract(request.headers)):
+        ...                               # continues the caller's trace
+
+Turn a trace file into flame-graph input:
+
+    python -m Monitoring.tracing traces.jsonl                  # per-trace tree of wall time
+    python -m Monitoring.tracing traces.jsonl --chrome trace.json --folded trace.folded
+"""
+import argparse
+import contextvars
+import functools
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+
+from pymongo import monitoring
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "0").lower() in ("1", "true", "yes")
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "file").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", 1.0))
+SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "ranking")
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar("current_span", default=None)
+
+
+class SpanContext:
+    def __init__(self, trace_id, span_id, sampled=True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+class Span:
+    def __init__(self, name, parent=None, attributes=None):
+        if parent is None:
+            trace_id, sampled, parent_id = f"{random.getrandbits(128):032x}", random.random() < TRACE_SAMPLE_RATE, None
+        else:
+            trace_id, sampled, parent_id = parent.trace_id, parent.sampled, parent.span_id
+        self.name = name
+        self.context = SpanContext(trace_id, f"{random.getrandbits(64):016x}", sampled)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.status = "ok"
+        self.thread = threading.current_thread().name
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter_ns()
+        self.duration_ns = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_error(self, error):
+        self.status = "error"
+        self.attributes["error"] = f"{type(error).__name__}: {error}"
+
+    def end(self):
+        if self.duration_ns is None:
+            self.duration_ns = time.perf_counter_ns() - self._start
+            if self.context.sampled and _exporter is not None:
+                _exporter.export(self)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "service": SERVICE_NAME,
+            "thread": self.thread,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ns / 1e6, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _Scope:
+    """One use of a span as `with` block; as a decorator, a fresh scope per call"""
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+
+    def __enter__(self):
+        parent = self.parent if self.parent is not None else current_context()
+        self.span = Span(self.name, parent, self.attributes)
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.span.record_error(exc)
+        _current.reset(self.token)
+        self.span.end()
+
+    def __call__(self, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not TRACING_ENABLED:
+                return function(*args, **kwargs)
+            with _Scope(self.name, self.parent, self.attributes):
+                return function(*args, **kwargs)
+        return wrapper
+
+
+class _NoopSpan:
+    def set_attribute(self, key, value):
+        pass
+
+    def record_error(self, error):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __call__(self, function):
+        return function
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name, parent=None, **attributes):
+    """Context manager (or decorator) recording `name` as a child of the current span or `parent`"""
+    if not TRACING_ENABLED:
+        return _NOOP
+    return _Scope(name, parent, attributes)
+
+
+def traced(name, **attributes):
+    """Decorator form of span(); whether tracing is enabled is checked on every call"""
+    return _Scope(name, None, attributes)
+
+
+def current():
+    return _current.get() or _NOOP
+
+
+def current_context():
+    active = _current.get()
+    return active.context if active is not None else None
+
+
+def annotate(**attributes):
+    """Add attributes to the current span"""
+    active = _current.get()
+    if active is not None:
+        active.attributes.update(attributes)
+
+
+def traceparent():
+    context = current_context()
+    return context.traceparent() if context is not None else None
+
+
+def inject(headers):
+    """Add the current span's traceparent to outgoing request headers"""
+    value = traceparent()
+    if value:
+        headers["traceparent"] = value
+    return headers
+
+
+def extract(headers):
+    """SpanContext from an incoming traceparent header, or None to start a new trace"""
+    match = TRACEPARENT_RE.match((headers or {}).get("traceparent") or "")
+    if not match:
+        return None
+    trace_id, span_id, flags = match.groups()
+    return SpanContext(trace_id, span_id, sampled=bool(int(flags, 16) & 1))
+
+
+class FileExporter:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def export(self, finished):
+        line = json.dumps(finished.to_dict(), default=str)
+        with self.lock:
+            self.file.write(line + "\n")
+
+
+class ConsoleExporter:
+    def export(self, finished):
+        logger.info("🧵 span %s", json.dumps(finished.to_dict(), default=str))
+
+
+_exporter = None
+
+
+def configure(enabled=None, exporter=None, path=None, sample_rate=None):
+    """(Re)configure tracing at runtime; arguments left as None keep their current values"""
+    global TRACING_ENABLED, TRACE_EXPORTER, TRACE_FILE, TRACE_SAMPLE_RATE, _exporter
+    TRACING_ENABLED = TRACING_ENABLED if enabled is None else enabled
+    TRACE_EXPORTER = exporter or TRACE_EXPORTER
+    TRACE_FILE = path or TRACE_FILE
+    TRACE_SAMPLE_RATE = TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+    _exporter = None
+    if TRACING_ENABLED:
+        _exporter = ConsoleExporter() if TRACE_EXPORTER == "console" else FileExporter(TRACE_FILE)
+
+
+class MongoCommandTracer(monitoring.CommandListener):
+    """A span per Mongo command, parented to whatever span issued it"""
+
+    def __init__(self):
+        self._spans = {}
+
+    def started(self, event):
+        parent = current_context()
+        if parent is None or not TRACING_ENABLED:
+            return
+        collection = event.command.get(event.command_name)
+        self._spans[(event.connection_id, event.request_id)] = Span(
+            f"mongo.{event.command_name}", parent,
+            {"db": event.database_name, "collection": collection if isinstance(collection, str) else None},
+        )
+
+    def _finish(self, event, error=None):
+        finished = self._spans.pop((event.connection_id, event.request_id), None)
+        if finished is not None:
+            if error is not None:
+                finished.status = "error"
+                finished.attributes["error"] = str(error)
+            finished.end()
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event, event.failure)
+
+
+_mongo_tracer = None
+
+
+def instrument_mongo():
+    """Register the command tracer once; call before creating MongoClients"""
+    global _mongo_tracer
+    if _mongo_tracer is None:
+        _mongo_tracer = MongoCommandTracer()
+        monitoring.register(_mongo_tracer)
+    return _mongo_tracer
+
+
+configure()
+
+
+# --- Reports over an exported trace file ---
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _children(spans):
+    children = defaultdict(list)
+    for item in spans:
+        children[item["parent_id"]].append(item)
+    for items in children.values():
+        items.sort(key=lambda item: item["start_ns"])
+    return children
+
+
+def _roots(spans):
+    ids = {item["span_id"] for item in spans}
+    return sorted((item for item in spans if item["parent_id"] not in ids), key=lambda item: item["start_ns"])
+
+
+def to_chrome(spans):
+    """Chrome trace-event JSON (chrome://tracing, Perfetto, speedscope); one process per trace"""
+    traces = {trace_id: index for index, trace_id in enumerate(dict.fromkeys(item["trace_id"] for item in spans))}
+    return {"traceEvents": [{
+        "name": item["name"],
+        "ph": "X",
+        "ts": item["start_ns"] / 1000,
+        "dur": item["duration_ms"] * 1000,
+        "pid": traces[item["trace_id"]],
+        "tid": f"{item['service']}:{item['thread']}",
+        "args": dict(item["attributes"], status=item["status"]),
+    } for item in spans]}
+
+
+def to_folded(spans):
+    """Folded stacks (flamegraph.pl / speedscope) weighted by each span's self time in microseconds"""
+    children = _children(spans)
+    lines = defaultdict(float)
+
+    def walk(item, stack):
+        path = stack + [item["name"]]
+        nested = sum(child["duration_ms"] for child in children.get(item["span_id"], []))
+        lines[";".join(path)] += max(0.0, item["duration_ms"] - nested) * 1000
+        for child in children.get(item["span_id"], []):
+            walk(child, path)
+
+    for root in _roots(spans):
+        walk(root, [])
+    return [f"{path} {int(value)}" for path, value in lines.items() if value >= 1]
+
+
+def print_tree(spans, max_depth=6):
+    children = _children(spans)
+
+    def walk(item, depth, origin):
+        if depth > max_depth:
+            return
+        offset = (item["start_ns"] - origin) / 1e6
+        mark = " ❌" if item["status"] == "error" else ""
+        print(f"{'  ' * depth}{item['name']:<{40 - 2 * depth}} +{offset:>9.1f} ms {item['duration_ms']:>10.1f} ms{mark}")
+        for child in children.get(item["span_id"], []):
+            walk(child, depth + 1, origin)
+
+    for root in _roots(spans):
+        print(f"\n🧵 trace {root['trace_id']}")
+        walk(root, 0, root["start_ns"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise an exported trace file")
+    parser.add_argument("path", nargs="?", default=TRACE_FILE)
+    parser.add_argument("--trace", help="only this trace ID")
+    parser.add_argument("--chrome", help="write Chrome trace-event JSON here")
+    parser.add_argument("--folded", help="write folded stacks here")
+    parser.add_argument("--depth", type=int, default=6)
+    args = parser.parse_args()
+
+    spans = [item for item in load(args.path) if not args.trace or item["trace_id"] == args.trace]
+    print_tree(spans, args.depth)
+    if args.chrome:
+        with open(args.chrome, "w", encoding="utf-8") as f:
+            json.dump(to_chrome(spans), f)
+        print(f"\n✅ Chrome trace written to {args.chrome}")
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as f:
+            f.write("\n".join(to_folded(spans)) + "\n")
+        print(f"✅ Folded stacks written to {args.folded}")
@@ -0,0 +1,316 @@
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+from filelock import FileLock
+from ollama import Client as OllamaClient
+
+EMBED_MODEL = os.getenv("EMBED_MODEL", "nomic-embed-text")
+STORE_DIR = os.getenv(
+    "EMBEDDING_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "embeddings")
+)
+# Below this many vectors exact search is faster than the IVF index
+IVF_MIN_ROWS = int(os.getenv("IVF_MIN_ROWS", 2000))
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", 8))
+
+llm_client = OllamaClient()
+
+
+def content_hash(text, model=EMBED_MODEL):
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+def _payload(source):
+    if isinstance(source, dict) and "source" in source and "data" in source:
+        return source["data"]
+    return source
+
+
+def applicant_text(record):
+    """Flatten the parsed resume, about text and projects into one document."""
+    parts = []
+    about = record.get("about")
+    if isinstance(about, list):
+        parts.extend(a for a in about if isinstance(a, str))
+    elif isinstance(about, str):
+        parts.append(about)
+
+    skills = record.get("skills")
+    if isinstance(skills, list):
+        parts.append("Skills: " + ", ".join(s for s in skills if isinstance(s, str)))
+    elif isinstance(skills, str):
+        parts.append("Skills: " + skills)
+
+    resume = _payload(record.get("resume_info")) or {}
+    if isinstance(resume, dict):
+        for edu in resume.get("education") or []:
+            if isinstance(edu, dict):
+                parts.append(f"Education: {edu.get('degree', '')} at {edu.get('institute', '')}")
+        for exp in resume.get("experience") or []:
+            if isinstance(exp, dict):
+                parts.append(f"Experience: {exp.get('role', '')} at {exp.get('company', '')}. {exp.get('description', '')}")
+        for project in resume.get("projects") or []:
+            if isinstance(project, dict):
+                parts.append(f"Project: {project.get('title', '')} ({', '.join(project.get('tech') or [])})")
+        if resume.get("skills"):
+            parts.append("Resume skills: " + ", ".join(s for s in resume["skills"] if isinstance(s, str)))
+
+    return "\n".join(p.strip() for p in parts if p and p.strip())
+
+
+def post_text(job_post):
+    """Text of a job post: the human-readable fields, in a stable order."""
+    parts = []
+    for key in ("title", "description", "requirements", "responsibilities", "skills", "qualifications", "type"):
+        value = job_post.get(key)
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        if value:
+            parts.append(f"{key.capitalize()}: {value}")
+    if not parts:
+        parts.append(json.dumps({k: v for k, v in job_post.items() if k != "_id"}, default=str, sort_keys=True))
+    return "\n".join(parts)
+
+
+class IVFIndex:
+    """
+    Inverted-file ANN index: spherical k-means centroids, each owning a list
+    of rows. A query scores the centroids, then only the rows of the
+    `nprobe` closest lists.
+    """
+
+    def __init__(self, vectors, iterations=8, seed=0):
+        count = len(vectors)
+        self.nlist = max(1, int(np.sqrt(count)))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(count, self.nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+            for c in range(self.nlist):
+                members = vectors[assignment == c]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    centroids[c] = centroid / (np.linalg.norm(centroid) or 1.0)
+
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        self.centroids = centroids
+        self.lists = [np.flatnonzero(assignment == c) for c in range(self.nlist)]
+        self.size = count
+
+    def candidates(self, query, nprobe=None):
+        nprobe = IVF_NPROBE if nprobe is None else nprobe
+        probes = np.argsort(-(self.centroids @ query))[:nprobe]
+        return np.concatenate([self.lists[c] for c in probes])
+
+
+class EmbeddingStore:
+    """
+    Memmap-backed vector store. Vectors are L2-normalized float32 rows in
+    vectors.f32; rows are deduplicated by content hash and the row/key
+    mapping is an append-only JSONL log, so every text is embedded once.
+
+    Several processes (the API and worker.py nodes) may share a directory:
+    appends happen under a file lock, and each process replays log entries
+    written by the others before reading or assigning rows.
+    """
+
+    def __init__(self, directory=STORE_DIR, model=EMBED_MODEL):
+        self.directory = directory
+        self.model = model
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.log_path = os.path.join(directory, "rows.jsonl")
+        self.lock = threading.RLock()
+        self.file_lock = FileLock(os.path.join(directory, "store.lock"))
+        self.log_offset = 0
+
+        self.dim = None
+        self.count = 0
+        self.capacity = 0
+        self.vectors = None
+        self.hash_rows = {}
+        self.keys = {}
+        self.post_members = {}
+        self.ivf = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """Apply log entries appended since the last call (by this or another process)."""
+        if not os.path.exists(self.log_path) or os.path.getsize(self.log_path) == self.log_offset:
+            return
+        with open(self.log_path, "rb") as f:
+            f.seek(self.log_offset)
+            data = f.read()
+        # A writer may be mid-line; leave the partial line for the next call
+        data = data[:data.rfind(b"\n") + 1]
+        self.log_offset += len(data)
+        for line in data.decode("utf-8").splitlines():
+            entry = json.loads(line)
+            if entry["type"] == "meta":
+                self.dim = entry["dim"]
+            elif entry["type"] == "row":
+                self.hash_rows[entry["hash"]] = entry["row"]
+                self.count = max(self.count, entry["row"] + 1)
+            elif entry["type"] == "key":
+                self.keys[entry["key"]] = entry["row"]
+                if entry.get("post_id"):
+                    self.post_members.setdefault(entry["post_id"], set()).add(entry["key"])
+        if self.dim:
+            capacity = os.path.getsize(self.vectors_path) // (self.dim * 4)
+            if capacity != self.capacity or self.vectors is None:
+                self.capacity = capacity
+                self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    def _log(self, entry):
+        """Append one entry; the caller holds file_lock and has called _load()."""
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+        self.log_offset += len(line)
+
+    def _ensure_capacity(self, rows):
+        if rows <= self.capacity:
+            return
+        new_capacity = max(rows, self.capacity * 2, 1024)
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(new_capacity * self.dim * 4)
+        self.capacity = new_capacity
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    def _embed(self, text):
+        response = llm_client.embeddings(model=self.model, prompt=text)
+        vector = np.asarray(response["embedding"], dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def put(self, key, text, post_id=None):
+        """Embed text (unless its content hash is already stored) and bind it to key."""
+        digest = content_hash(text, self.model)
+        with self.lock:
+            self._load()
+            row = self.hash_rows.get(digest)
+        if row is None:
+            vector = self._embed(text)
+            with self.lock, self.file_lock:
+                self._load()
+                row = self.hash_rows.get(digest)
+                if row is None:
+                    if self.dim is None:
+                        self.dim = len(vector)
+                        self._log({"type": "meta", "dim": self.dim, "model": self.model})
+                    row = self.count
+                    self._ensure_capacity(row + 1)
+                    self.vectors[row] = vector
+                    self.vectors.flush()
+                    self.count += 1
+                    self.hash_rows[digest] = row
+                    self._log({"type": "row", "row": row, "hash": digest})
+
+        with self.lock:
+            if self.keys.get(key) != row or (post_id and key not in self.post_members.get(post_id, ())):
+                with self.file_lock:
+                    self._load()
+                    self.keys[key] = row
+                    if post_id:
+                        self.post_members.setdefault(post_id, set()).add(key)
+                    self._log({"type": "key", "key": key, "row": row, "post_id": post_id})
+        return row
+
+    def vector(self, key):
+        with self.lock:
+            self._load()
+            row = self.keys.get(key)
+            return None if row is None else np.array(self.vectors[row])
+
+    def _index(self):
+        """
+        IVF index over the rows present at build time, rebuilt when the store
+        has doubled since; rows added after the build are scored exactly.
+        """
+        if self.count < IVF_MIN_ROWS:
+            return None
+        if self.ivf is None or self.count >= 2 * self.ivf.size:
+            self.ivf = IVFIndex(np.asarray(self.vectors[:self.count]))
+        return self.ivf
+
+    def search(self, query, k=10, keys=None, prefix="applicant:", exclude=None):
+        """
+        Top-k keys by cosine similarity. `keys` restricts the search to a set
+        of keys (e.g. the applicants of one post); otherwise every key with
+        the prefix is eligible and the IVF index is used once it is built.
+        """
+        with self.lock:
+            self._load()
+            if keys is None:
+                keys = [key for key in self.keys if key.startswith(prefix)]
+            keys = [key for key in keys if key in self.keys and key != exclude]
+            if not keys:
+                return []
+            rows = np.fromiter((self.keys[key] for key in keys), dtype=np.int64, count=len(keys))
+
+            index = self._index()
+            if index is not None and len(rows) > IVF_MIN_ROWS:
+                candidate_rows = index.candidates(query)
+                keep = np.isin(rows, candidate_rows) | (rows >= index.size)
+                if keep.sum() >= k:
+                    rows, keys = rows[keep], [key for key, kept in zip(keys, keep) if kept]
+
+            scores = np.asarray(self.vectors[rows]) @ query
+
+        top = np.argsort(-scores)[:k]
+        return [{"key": keys[i], "score": float(scores[i])} for i in top]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = EmbeddingStore()
+        return _store
+
+
+def embed_applicant(post_id, applicant_record):
+    user = applicant_record.get("user") or {}
+    text = applicant_text(applicant_record)
+    if not text:
+        return None
+    return get_store().put(f"applicant:{user.get('_id')}", text, post_id=str(post_id))
+
+
+def embed_post(job_post):
+    return get_store().put(f"post:{job_post.get('_id')}", post_text(job_post))
+
+
+def top_applicants_for_post(post_id, k=10):
+    """Applicants of a post ranked by similarity to the post's embedding."""
+    store = get_store()
+    query = store.vector(f"post:{post_id}")
+    if query is None:
+        return []
+    members = store.post_members.get(str(post_id), set())
+    return [
+        {"applicantID": hit["key"].split(":", 1)[1], "score": hit["score"]}
+        for hit in store.search(query, k=k, keys=list(members))
+    ]
+
+
+def similar_applicants(applicant_id, k=10):
+    """Applicants across all posts most similar to this one."""
+    store = get_store()
+    key = f"applicant:{applicant_id}"
+    query = store.vector(key)
+    if query is None:
+        return []
+    return [
+        {"applicantID": hit["key"].split(":", 1)[1], "score": hit["score"]}
+        for hit in store.search(query, k=k, exclude=key)
+    ]
@@ -0,0 +1,258 @@
+"""
+Local stand-ins for Google Drive downloads and the Ollama API, for running
+the ranking pipeline end to end without network access (used by
+Ranking_System.ranking_benchmark together with Github.fake_graphql_server).
+
+Drive serves /uc?id=<file_id> as a one-page PDF resume rendered from the
+file ID: "<tag>-<index>-s" is a clean, sectioned resume the rule-based
+extractor handles alone, "<tag>-<index>-m" a free-form one that goes to the
+LLM. Ollama answers /api/generate (resume parsing and ranking prompts) and
+/api/embeddings with deterministic output after a configurable delay.
+
+    python -m Ranking_System.fake_services --drive-port 8766 --ollama-port 11435 --llm-latency 0.5
+    # then, from the repository root (app.py reads src/.env):
+    RESUME_DOWNLOAD_URL="http://127.0.0.1:8766/uc?id={file_id}" OLLAMA_HOST=http://127.0.0.1:11435 python src/app.py
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIRST_NAMES = ["Ayesha", "Bilal", "Chen", "Diego", "Emma", "Farah", "Hassan", "Ines", "Jonas", "Kiran", "Lina", "Omar"]
+LAST_NAMES = ["Khan", "Garcia", "Nguyen", "Smith", "Malik", "Rossi", "Ahmed", "Novak", "Okafor", "Tanaka"]
+SKILLS = ["Python", "JavaScript", "React", "Node.js", "SQL", "MongoDB", "Docker", "Git", "FastAPI", "Java", "AWS", "Go"]
+COMPANIES = ["Google Inc.", "Systems Ltd", "Careem", "Netsol", "Arbisoft", "Shopify", "Stripe", "Contour Software"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science", "BS Software Engineering"]
+UNIVERSITIES = [
+    "FAST National University", "Lahore University of Management Sciences", "University of California, Berkeley",
+    "National University of Sciences and Technology", "Technical University of Munich",
+]
+ROLES = ["Software Engineer", "Backend Developer", "Data Engineer", "Frontend Developer", "ML Engineer"]
+EMBED_DIM = 64
+
+
+def _rng(*parts):
+    return random.Random(hashlib.sha256("/".join(map(str, parts)).encode()).hexdigest())
+
+
+def synthetic_resume(index, messy=False):
+    """Plain-text resume for applicant `index`; messy ones have no section headings"""
+    rng = _rng("resume", index)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    email = f"{name.lower().replace(' ', '.')}{index}@example.com"
+    skills = rng.sample(SKILLS, 6)
+    company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+    start = 2016 + rng.randint(0, 6)
+    degree, university = rng.choice(DEGREES), rng.choice(UNIVERSITIES)
+    if messy:
+        return [
+            f"{name} - {role}",
+            f"Reach me at {email} or +1 555 {index % 1000:03d} {rng.randint(1000, 9999)}",
+            f"I have been working as a {role.lower()} at {company} since {start}, building services",
+            f"with {skills[0]} and {skills[1]}. Before that I studied {degree.lower()} at {university}.",
+            f"Side projects include a {skills[2]} dashboard and tooling around {skills[3]}.",
+            f"Comfortable with {', '.join(skills[4:])} and shipping to production.",
+        ]
+    return [
+        name,
+        f"{email} | (555) {index % 1000:03d}-{rng.randint(1000, 9999)}",
+        "",
+        "EDUCATION",
+        degree,
+        university,
+        f"GPA: {rng.choice(['3.4', '3.6', '3.8'])}/4.0",
+        f"Aug {start - 4} - May {start}",
+        "",
+        "EXPERIENCE",
+        role,
+        company,
+        f"June {start} - Present",
+        f"- Built services using {skills[0]} and {skills[1]}",
+        "- Collaborated with cross-functional teams",
+        "",
+        "PROJECTS",
+        f"{skills[2]} Dashboard",
+        f"Technologies: {', '.join(skills[2:5])}",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+    ]
+
+
+def render_pdf(lines):
+    """Minimal single-page PDF with one Helvetica text line per entry"""
+    def escape(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    content = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"] + [f"({escape(line)}) Tj T*" for line in lines] + ["ET"]
+    stream = "\n".join(content).encode("latin-1", "replace")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeDrive:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.downloads = 0
+        self.lock = threading.Lock()
+
+    def file(self, file_id):
+        match = re.match(r"^.+-(\d+)-([sm])$", file_id or "")
+        if not match:
+            return None
+        return render_pdf(synthetic_resume(int(match.group(1)), messy=match.group(2) == "m"))
+
+
+class DriveHandler(_Handler):
+    def do_GET(self):
+        drive = self.service
+        if drive.latency:
+            time.sleep(drive.latency)
+        file_id = (parse_qs(urlparse(self.path).query).get("id") or [None])[0]
+        pdf = drive.file(file_id)
+        if pdf is None:
+            self._send(404, {"error": "not found"})
+            return
+        with drive.lock:
+            drive.downloads += 1
+        self._send(200, pdf, "application/pdf")
+
+
+class FakeOllama:
+    def __init__(self, latency=0.0, embed_latency=0.0):
+        self.latency = latency
+        self.embed_latency = embed_latency
+        self.calls = {"resume": 0, "ranking": 0, "embeddings": 0}
+        self.lock = threading.Lock()
+
+    def _count(self, kind):
+        with self.lock:
+            self.calls[kind] += 1
+
+    def generate(self, model, prompt):
+        if "Applicants:" in prompt:
+            self._count("ranking")
+            applicants = re.findall(r'"applicantID":\s*"([^"]+)"', prompt.split("Applicants:", 1)[1])
+            ranked = [{
+                "applicantID": applicant_id,
+                "applicantName": "",
+                "Score": round(_rng("score", applicant_id).uniform(3, 9.5), 1),
+                "Justification/Recommendation Note": "Synthetic evaluation",
+                "Key Strengths": [],
+                "Development Areas": [],
+                "Hiring Recommendation": "Consider",
+            } for applicant_id in applicants]
+            ranked.sort(key=lambda item: -item["Score"])
+            return json.dumps(ranked)
+        self._count("resume")
+        rng = _rng("parse", prompt[-200:])
+        return "```json\n" + json.dumps({
+            "name": "", "email": "", "phone": "",
+            "education": [{"degree": rng.choice(DEGREES), "institute": rng.choice(UNIVERSITIES)}],
+            "experience": [{"company": rng.choice(COMPANIES), "role": rng.choice(ROLES)}],
+            "projects": [{"title": f"{rng.choice(SKILLS)} Dashboard"}],
+            "skills": rng.sample(SKILLS, 5),
+        }) + "\n```"
+
+    def embedding(self, prompt):
+        self._count("embeddings")
+        rng = _rng("embed", prompt)
+        return [rng.uniform(-1, 1) for _ in range(EMBED_DIM)]
+
+
+class OllamaHandler(_Handler):
+    def do_POST(self):
+        ollama = self.service
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path == "/api/generate":
+            if ollama.latency:
+                time.sleep(ollama.latency)
+            self._send(200, {
+                "model": body.get("model", ""),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "response": ollama.generate(body.get("model"), body.get("prompt", "")),
+                "done": True,
+                "done_reason": "stop",
+            })
+        elif self.path == "/api/embeddings":
+            if ollama.embed_latency:
+                time.sleep(ollama.embed_latency)
+            self._send(200, {"embedding": ollama.embedding(body.get("prompt", ""))})
+        else:
+            self._send(404, {"error": f"unsupported endpoint {self.path}"})
+
+
+def _serve(handler, service, port):
+    server = ThreadingHTTPServer(("127.0.0.1", port), type(handler.__name__, (handler,), {"service": service}))
+    server.daemon_threads = True
+    server.service = service
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def start_drive(port=0, **options):
+    """Start the fake Drive in a daemon thread; returns (server, RESUME_DOWNLOAD_URL template)."""
+    server, base = _serve(DriveHandler, FakeDrive(**options), port)
+    return server, base + "/uc?id={file_id}"
+
+
+def start_ollama(port=0, **options):
+    """Start the fake Ollama API in a daemon thread; returns (server, OLLAMA_HOST)."""
+    return _serve(OllamaHandler, FakeOllama(**options), port)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Google Drive and Ollama servers")
+    parser.add_argument("--drive-port", type=int, default=8766)
+    parser.add_argument("--ollama-port", type=int, default=11435)
+    parser.add_argument("--drive-latency", type=float, default=0.0, help="seconds added to every download")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="seconds added to every generate call")
+    parser.add_argument("--embed-latency", type=float, default=0.0, help="seconds added to every embedding call")
+    args = parser.parse_args()
+
+    drive, drive_url = start_drive(args.drive_port, latency=args.drive_latency)
+    ollama, ollama_host = start_ollama(args.ollama_port, latency=args.llm_latency, embed_latency=args.embed_latency)
+    print(f"🚀 Fake Drive at {drive_url}")
+    print(f"🚀 Fake Ollama at {ollama_host}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        drive.shutdown()
+        ollama.shutdown()
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+from pymongo import UpdateOne
+
+# Repository activity halves every ACTIVITY_HALF_LIFE_DAYS since its last update
+ACTIVITY_HALF_LIFE_DAYS = float(os.getenv("GITHUB_ACTIVITY_HALF_LIFE_DAYS", 180))
+TOP_LANGUAGES = 5
+# Weights of the log-scaled features in the per-post github_score
+SCORE_WEIGHTS = {"stars": 0.25, "activity": 0.3, "merged_prs": 0.2, "contributions": 0.25}
+
+DATE_FORMAT = "%B %d, %Y at %I:%M %p"
+
+
+def _payload(source):
+    if isinstance(source, dict) and "source" in source and "data" in source:
+        return source["data"]
+    return source
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    for fmt in (DATE_FORMAT, "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def github_parts(github_data):
+    """(contribution_total, repo list) from a scraper result; errors give (0, [])."""
+    data = _payload(github_data)
+    if not isinstance(data, list) or len(data) < 2:
+        return 0, []
+    contributions = data[0] if isinstance(data[0], dict) else {}
+    repos = data[1] if isinstance(data[1], list) else []
+    return int(contributions.get("total_contributions") or 0), [r for r in repos if isinstance(r, dict)]
+
+
+def compute_features(github_results, now=None):
+    """
+    Feature dicts for a list of scraper results (one per applicant), computed
+    over all applicants at once: every repository becomes one row of flat
+    NumPy arrays and per-applicant totals are np.bincount reductions.
+    """
+    now = now or datetime.utcnow()
+    count = len(github_results)
+
+    owners, stars, forks, merged, is_fork, age_days = [], [], [], [], [], []
+    language_owner, language_index, languages = [], [], {}
+    contributions = np.zeros(count, dtype=np.float64)
+
+    for i, github_data in enumerate(github_results):
+        total, repos = github_parts(github_data)
+        contributions[i] = total
+        for repo in repos:
+            owners.append(i)
+            stars.append(repo.get("stars") or 0)
+            forks.append(repo.get("forks") or 0)
+            merged.append(repo.get("merged_pull_requests") or 0)
+            is_fork.append(bool(repo.get("is_fork")))
+            updated = _parse_date(repo.get("updated_at"))
+            age_days.append((now - updated).days if updated else np.inf)
+            if not repo.get("is_fork"):
+                for language in repo.get("languages") or []:
+                    language_owner.append(i)
+                    language_index.append(languages.setdefault(language, len(languages)))
+
+    owners = np.asarray(owners, dtype=np.int64)
+    is_fork = np.asarray(is_fork, dtype=bool)
+    own = ~is_fork
+
+    repo_count = np.bincount(owners, minlength=count)
+    fork_count = np.bincount(owners, weights=is_fork.astype(np.float64), minlength=count)
+    star_total = np.bincount(owners[own], weights=np.asarray(stars, dtype=np.float64)[own], minlength=count)
+    fork_total = np.bincount(owners[own], weights=np.asarray(forks, dtype=np.float64)[own], minlength=count)
+    merged_total = np.bincount(owners, weights=np.asarray(merged, dtype=np.float64), minlength=count)
+    recency = np.power(0.5, np.asarray(age_days, dtype=np.float64) / ACTIVITY_HALF_LIFE_DAYS)
+    activity = np.bincount(owners[own], weights=recency[own], minlength=count)
+    fork_ratio = np.divide(fork_count, repo_count, out=np.zeros(count), where=repo_count > 0)
+
+    # Language distribution: each language's share of the languages listed on an applicant's own repositories
+    matrix = np.zeros((count, max(1, len(languages))), dtype=np.float64)
+    if language_owner:
+        np.add.at(matrix, (np.asarray(language_owner), np.asarray(language_index)), 1.0)
+    shares = matrix / np.maximum(matrix.sum(axis=1, keepdims=True), 1.0)
+    names = np.array(list(languages) or [""], dtype=object)
+    top = np.argsort(-shares, axis=1)[:, :TOP_LANGUAGES]
+
+    features = []
+    for i in range(count):
+        features.append({
+            "repos": int(repo_count[i]),
+            "stars": int(star_total[i]),
+            "forks": int(fork_total[i]),
+            "merged_prs": int(merged_total[i]),
+            "fork_ratio": round(float(fork_ratio[i]), 3),
+            "activity": round(float(activity[i]), 3),
+            "contributions": int(contributions[i]),
+            "languages": {names[j]: round(float(shares[i, j]), 3) for j in top[i] if shares[i, j] > 0},
+        })
+    return features
+
+
+def github_scores(features):
+    """
+    0-1 score per applicant relative to the other applicants of the post:
+    a weighted sum of log-scaled features, each min-max normalized.
+    """
+    if not features:
+        return []
+    score = np.zeros(len(features))
+    for name, weight in SCORE_WEIGHTS.items():
+        values = np.log1p(np.array([f.get(name, 0) for f in features], dtype=np.float64))
+        spread = values.max() - values.min()
+        if spread > 0:
+            score += weight * (values - values.min()) / spread
+    return [round(float(s), 3) for s in score]
+
+
+def github_digest(github_data):
+    """Content hash of a scraper result; stored features are reused while it is unchanged."""
+    return hashlib.sha256(json.dumps(github_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def ensure_features(db, post_id, records):
+    """
+    Attach `github_features` to every applicant record. Features stored in
+    Resume_Info for the same GitHub data (same digest) are reused; the rest
+    are computed in one batch and persisted with their digest.
+    """
+    missing = [record for record in records if record.get("github_features") is None]
+    if not missing:
+        return records
+
+    digests = [github_digest(record.get("github_data")) for record in missing]
+    stored = {}
+    if db is not None:
+        user_ids = [(record.get("user") or {}).get("_id") for record in missing]
+        for doc in db["Resume_Info"].find(
+            {"postId": str(post_id), "user._id": {"$in": user_ids}, "github_features": {"$ne": None}},
+            {"user._id": 1, "github_features": 1, "github_digest": 1},
+        ):
+            stored[(doc["user"]["_id"], doc.get("github_digest"))] = doc["github_features"]
+
+    compute = []
+    for record, digest in zip(missing, digests):
+        feature = stored.get(((record.get("user") or {}).get("_id"), digest))
+        if feature is not None:
+            record["github_features"] = feature
+        else:
+            compute.append((record, digest))
+    if not compute:
+        return records
+
+    features = compute_features([record.get("github_data") for record, _ in compute])
+    operations = []
+    for (record, digest), feature in zip(compute, features):
+        record["github_features"] = feature
+        user = record.get("user") or {}
+        operations.append(UpdateOne(
+            {"postId": str(post_id), "user._id": user.get("_id")},
+            {"$set": {"github_features": feature, "github_digest": digest}},
+        ))
+    if db is not None and operations:
+        db["Resume_Info"].bulk_write(operations, ordered=False)
+    return records
+
+
+def passes(feature, minimums):
+    """True if every {feature: minimum} constraint holds (a pre-filter for search)."""
+    return all((feature or {}).get(name, 0) >= minimum for name, minimum in (minimums or {}).items())
@@ -0,0 +1,144 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from pymongo import ASCENDING, ReturnDocument
+
+# A ranking job belongs to the worker holding its lease; the lease is renewed
+# every HEARTBEAT_SECONDS and a job whose lease lapses is picked up again.
+LEASE_SECONDS = int(os.getenv("RANKING_LEASE_SECONDS", 120))
+HEARTBEAT_SECONDS = int(os.getenv("RANKING_HEARTBEAT_SECONDS", 30))
+# Jobs claimed this many times without finishing are marked failed
+MAX_ATTEMPTS = int(os.getenv("RANKING_MAX_ATTEMPTS", 3))
+
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+REQUESTS = "ranking_request"
+CHECKPOINTS = "ranking_checkpoints"
+
+# Per-applicant stages, in order: resume parsed, GitHub scraped, record stored
+STAGES = ("parsed", "scraped", "stored")
+
+logger = logging.getLogger(__name__)
+
+_indexed = False
+
+
+def ensure_indexes(db):
+    global _indexed
+    if not _indexed:
+        db[CHECKPOINTS].create_index([("postId", ASCENDING), ("userId", ASCENDING)], unique=True)
+        _indexed = True
+
+
+def claimable_filter(now=None):
+    """Pending requests, and processing ones whose lease expired (or predates leases)"""
+    now = now or datetime.utcnow()
+    return {"$or": [
+        {"status": {"$in": ["pending", None]}},
+        {"status": "processing", "$or": [
+            {"lease_expires_at": {"$lt": now}},
+            {"lease_expires_at": {"$exists": False}},
+            {"lease_expires_at": None},
+        ]},
+    ]}
+
+
+def claim(db, request_id):
+    """
+    Atomically take the lease on a ranking request. Returns the updated
+    document, or None if another worker holds it or it is no longer claimable.
+    """
+    now = datetime.utcnow()
+    query = claimable_filter(now)
+    query["_id"] = request_id
+    doc = db[REQUESTS].find_one_and_update(
+        query,
+        {
+            "$set": {
+                "status": "processing",
+                "lease_owner": WORKER_ID,
+                "lease_expires_at": now + timedelta(seconds=LEASE_SECONDS),
+                "claimed_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is not None and doc.get("attempts", 1) > MAX_ATTEMPTS:
+        db[REQUESTS].update_one(
+            {"_id": request_id, "lease_owner": WORKER_ID},
+            {"$set": {
+                "status": "failed",
+                "lease_expires_at": None,
+                "result": {"error": f"Gave up after {MAX_ATTEMPTS} attempts"},
+                "processed_at": now,
+            }},
+        )
+        return None
+    return doc
+
+
+class Lease:
+    """Background heartbeat that keeps a claimed ranking request's lease alive."""
+
+    def __init__(self, db, request_id):
+        self.db = db
+        self.request_id = request_id
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name="RankingLease", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def renew(self, **fields):
+        result = self.db[REQUESTS].update_one(
+            {"_id": self.request_id, "lease_owner": WORKER_ID},
+            {"$set": dict(fields, lease_expires_at=datetime.utcnow() + timedelta(seconds=LEASE_SECONDS))},
+        )
+        if result.matched_count == 0:
+            self.lost.set()
+        return not self.lost.is_set()
+
+    def _beat(self):
+        while not self._stop.wait(HEARTBEAT_SECONDS):
+            try:
+                if not self.renew():
+                    logger.warning(f"⚠️ Lost the lease on ranking request {self.request_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ Lease heartbeat failed: {e}")
+
+    def release(self):
+        self._stop.set()
+        self.db[REQUESTS].update_one(
+            {"_id": self.request_id, "lease_owner": WORKER_ID},
+            {"$set": {"lease_expires_at": None}},
+        )
+
+
+def load(db, post_id):
+    """{userId: checkpoint} for every applicant of the post that has one"""
+    return {doc["userId"]: doc for doc in db[CHECKPOINTS].find({"postId": str(post_id)})}
+
+
+def reached(checkpoint, stage):
+    return stage in (checkpoint or {}).get("stages", [])
+
+
+def save(db, post_id, user_id, stage, **fields):
+    """Record that an applicant completed `stage`, with the data needed to skip it next time."""
+    fields.update(stage=stage, updated_at=datetime.utcnow(), worker=WORKER_ID)
+    db[CHECKPOINTS].update_one(
+        {"postId": str(post_id), "userId": user_id},
+        {"$set": fields, "$addToSet": {"stages": stage}},
+        upsert=True,
+    )
+
+
+def clear(db, post_id):
+    db[CHECKPOINTS].delete_many({"postId": str(post_id)})
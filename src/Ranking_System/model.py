@@ -1,10 +1,12 @@
 import os
 import re
+import logging
 import json
 from bson import ObjectId
 from pymongo import MongoClient
 from dotenv import dotenv_values
 from ollama import Client as OllamaClient
+from Monitoring import logs, metrics
 
 # Load environment
 config = dotenv_values(".env")
@@ -18,6 +20,8 @@ postID = '68599a8b423958c44a738225'
 llm_client = OllamaClient()
 MAX_APPLICANTS = 50
 
+logger = logging.getLogger(__name__)
+
 # Fetch job description from remote DB
 def fetch_job_post(postID):
     remote_client = MongoClient(config["MONGO_URI"])
@@ -26,7 +30,7 @@ def fetch_job_post(postID):
         try:
             postID = ObjectId(postID)
         except Exception as e:
-            print(f"Invalid postID: {e}")
+            logger.error(f"Invalid postID: {e}")
             return None
     return db['posts'].find_one({'_id': postID})
 
@@ -85,17 +89,18 @@ def get_ranked_list(job_post: dict, applicant_list: list) -> list:
     Input:
 
     Job Post:
-    {json.dumps(job_post, indent=2)}
+    {json.dumps(job_post, indent=2, default=str)}
 
     Applicants:
-    {json.dumps(applicant_list, indent=2)}
+    {json.dumps(applicant_list, indent=2, default=str)}
 
     Begin Evaluation:
     """
 
-    print("📝 Prompt sent to LLM:", prompt)
+    logger.debug("📝 Prompt sent to LLM (%d chars): %s", len(prompt), logs.payload(prompt))
     try:
-        response = llm_client.generate(model="gemma3n:e4b", prompt=prompt)
+        with metrics.timed("ranking"):
+            response = llm_client.generate(model="gemma3n:e4b", prompt=prompt)
         raw_output = response.response
         def clean_llm_output(raw_output):
             # Remove code block markers
@@ -114,12 +119,12 @@ def get_ranked_list(job_post: dict, applicant_list: list) -> list:
             return cleaned
         
         cleaned_output = clean_llm_output(raw_output)
-        print("🔍 Raw LLM output:", raw_output)
-        print("\n\n📝 Parsed JSON:", cleaned_output)
+        logger.debug("🔍 Raw LLM output (%d chars): %s", len(raw_output), logs.payload(raw_output))
+        logger.info("📝 LLM ranked list: %d chars of JSON", len(cleaned_output))
         ranked_list = json.loads(cleaned_output)
         return ranked_list
     except Exception as e:
-        print(f"❌ LLM failed: {e}")
+        logger.error(f"❌ LLM failed: {e}")
         return []
 def store_ranked_applicants(post_id, ranked_list):
     try:
@@ -140,9 +145,9 @@ def store_ranked_applicants(post_id, ranked_list):
             ]
         }
         ranked_collection.insert_one(formatted)
-        print(f"✅ Stored ranked applicants for post {post_id}")
+        logger.info(f"✅ Stored ranked applicants for post {post_id}")
     except Exception as e:
-        print(f"❌ Error storing ranked applicants: {e}")
+        logger.error(f"❌ Error storing ranked applicants: {e}")
         raise
 
 def get_top_candidates_for_post(post_id):
@@ -173,5 +178,5 @@ def get_top_candidates_for_post(post_id):
         store_ranked_applicants(post_id, top_10)
         return top_10
     except Exception as e:
-        print(f"❌ Error getting top candidates: {e}")
+        logger.error(f"❌ Error getting top candidates: {e}")
         return []
\ No newline at end of file
@@ -0,0 +1,350 @@
+"""
+End-to-end benchmark of app.process_ranking_request against local fakes:
+synthetic posts with N applicants in mongomock (or a real mongod with
+--mongo-uri), resumes served as PDFs by a fake Drive, and fake Ollama and
+GitHub GraphQL servers with configurable latency. Nothing leaves the machine.
+
+Each size runs in a fresh subprocess (so peak RSS and module state belong to
+that run alone) and reports throughput, per-applicant latency percentiles,
+peak RSS, Mongo operation counts, fake-service calls and time per stage.
+
+Run from the src directory:
+    python -m Ranking_System.ranking_benchmark --sizes 10 100 1000 --output ranking_bench.json
+    python -m Ranking_System.ranking_benchmark --sizes 5000 --mongo-uri mongodb://localhost:27017 --llm-latency 0.5
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from bson import ObjectId
+from pymongo import monitoring
+
+from Github import fake_graphql_server
+from Ranking_System import fake_services
+
+DEFAULT_SIZES = [10, 50, 100, 500, 1000, 5000]
+# Handshake and session housekeeping, not application work
+IGNORED_COMMANDS = {"hello", "isMaster", "ismaster", "ping", "endSessions", "buildInfo", "saslStart", "saslContinue"}
+MONGOMOCK_METHODS = [
+    "find", "find_one", "insert_one", "insert_many", "update_one", "update_many", "replace_one", "delete_one",
+    "delete_many", "find_one_and_update", "aggregate", "count_documents", "create_index", "bulk_write",
+]
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class _CommandCounter(monitoring.CommandListener):
+    """Counts commands a real mongod receives, by command name"""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def started(self, event):
+        if event.command_name not in IGNORED_COMMANDS:
+            self.counts[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+class _MongomockCounter:
+    """Counts collection method calls on mongomock (which emits no command events); nested calls count once"""
+
+    def __init__(self):
+        import mongomock
+
+        self.counts = Counter()
+        self._depth = threading.local()
+        for name in MONGOMOCK_METHODS:
+            original = getattr(mongomock.collection.Collection, name, None)
+            if original is not None:
+                setattr(mongomock.collection.Collection, name, self._wrap(name, original))
+
+    def _wrap(self, name, original):
+        counter = self
+
+        def method(collection, *args, **kwargs):
+            depth = getattr(counter._depth, "value", 0)
+            if depth == 0:
+                counter.counts[name] += 1
+            counter._depth.value = depth + 1
+            try:
+                return original(collection, *args, **kwargs)
+            finally:
+                counter._depth.value = depth
+        return method
+
+
+def seed(db, size, tag, llm_share):
+    """One post with `size` applicants; llm_share of the resumes are free-form and need the LLM"""
+    post_id = ObjectId()
+    db["posts"].insert_one({
+        "_id": post_id,
+        "title": "Backend Engineer",
+        "description": "Build and scale Python services on MongoDB.",
+        "skills": ["Python", "FastAPI", "MongoDB", "Docker"],
+    })
+    users, registrations, applications = [], [], []
+    messy_every = round(1 / llm_share) if llm_share > 0 else 0
+    for index in range(size):
+        user_id, registration_id = ObjectId(), ObjectId()
+        style = "m" if messy_every and index % messy_every == 0 else "s"
+        users.append({"_id": user_id, "type": "Applicant", "name": f"Applicant {index}"})
+        registrations.append({
+            "_id": registration_id,
+            "owner": user_id,
+            "resume": f"https://drive.google.com/file/d/{tag}-{index}-{style}/view",
+            "github": f"https://github.com/bench-{tag}-{index}",
+            "skills": ["Python", "MongoDB"],
+            "explainYourself": "I like building reliable backends.",
+        })
+        applications.append({
+            "postId": post_id,
+            "userId": user_id,
+            "registrationId": registration_id,
+            "skillMatches": ["Python"],
+            "coverLetter": "Please consider my application.",
+        })
+    db["users"].insert_many(users)
+    db["registrations"].insert_many(registrations)
+    db["applications"].insert_many(applications)
+    db["ranking_request"].insert_one({"postId": str(post_id), "status": "pending", "created_at": datetime.utcnow()})
+    return post_id
+
+
+def run_size(size, args):
+    """Rank one synthetic post of `size` applicants in this process; returns the measurements"""
+    workdir = tempfile.mkdtemp(prefix="ranking-bench-")
+    os.environ.update({
+        "RESUME_CV_DIR": os.path.join(workdir, "cv"),
+        "EMBEDDING_STORE_DIR": os.path.join(workdir, "embeddings"),
+        "GITHUB_CACHE_PATH": os.path.join(workdir, "github_cache.sqlite3"),
+    })
+    tag = uuid.uuid4().hex[:8]
+    db_name = f"ranking_benchmark_{tag}"
+
+    if args.mongo_uri:
+        from pymongo import MongoClient
+
+        counter = _CommandCounter()
+        monitoring.register(counter)
+        import app
+        from Ranking_System import model
+
+        client = MongoClient(args.mongo_uri)
+        app.mongo_uri = args.mongo_uri
+        model.config.update(MONGO_URI=args.mongo_uri, DB_NAME=db_name)
+    else:
+        import mongomock
+
+        import app
+        from Ranking_System import model
+
+        client = mongomock.MongoClient()
+        # Every connection of the pipeline shares the one in-memory database
+        client.close = lambda: None
+        app.startup_db_client = lambda: client
+        model.MongoClient = lambda *a, **k: client
+        model.config.update(MONGO_URI="mongomock", DB_NAME=db_name)
+    app.db_name = db_name
+    app.MAX_WORKERS = args.workers
+    from Monitoring import metrics
+
+    db = client[db_name]
+    post_id = seed(db, size, tag, args.llm_share)
+    if not args.mongo_uri:
+        counter = _MongomockCounter()
+
+    latencies = []
+    process_single_user = app.process_single_user
+
+    def timed_applicant(job_args):
+        start = time.perf_counter()
+        try:
+            return process_single_user(job_args)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    app.process_single_user = timed_applicant
+    stages_before = metrics.STAGE_SECONDS.totals()
+    counter.counts.clear()
+
+    started = time.perf_counter()
+    app.process_ranking_request(db["ranking_request"].find_one({"postId": str(post_id)}))
+    wall = time.perf_counter() - started
+
+    request = db["ranking_request"].find_one({"postId": str(post_id)})
+    stages = {}
+    for (stage,), (count, total) in metrics.STAGE_SECONDS.totals().items():
+        before_count, before_total = stages_before.get((stage,), (0, 0.0))
+        if count > before_count:
+            stages[stage] = {
+                "count": count - before_count,
+                "mean_ms": round(1000 * (total - before_total) / (count - before_count), 3),
+                "total_s": round(total - before_total, 3),
+            }
+
+    if args.mongo_uri:
+        client.drop_database(db_name)
+        client.close()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "applicants": size,
+        "status": request.get("status"),
+        "applicants_processed": (request.get("result") or {}).get("applicants_processed"),
+        "wall_seconds": round(wall, 3),
+        "throughput_per_second": round(size / wall, 3) if wall else None,
+        "applicant_latency_ms": {
+            "p50": ms(percentile(latencies, 0.50)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(max(latencies) if latencies else None),
+        },
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "mongo": "mongod" if args.mongo_uri else "mongomock",
+        "mongo_ops": dict(sorted(counter.counts.items())),
+        "mongo_ops_total": sum(counter.counts.values()),
+        "stages": stages,
+    }
+
+
+def start_fakes(args):
+    """Fake Drive, Ollama and GitHub servers for every run; their URLs go to the runs through the environment"""
+    drive, drive_url = fake_services.start_drive(latency=args.drive_latency)
+    ollama, ollama_host = fake_services.start_ollama(latency=args.llm_latency, embed_latency=args.embed_latency)
+    github, graphql_url = fake_graphql_server.start_server(latency=args.github_latency, repos=args.github_repos)
+    os.environ.update({
+        "RESUME_DOWNLOAD_URL": drive_url,
+        "OLLAMA_HOST": ollama_host,
+        "GITHUB_GRAPHQL_URL": graphql_url,
+        "GITHUB_TOKENS": "bench-token-a,bench-token-b",
+        "GITHUB_SCRAPER_MODE": "local",
+        "LOG_LEVEL": args.log_level,
+    })
+    return drive, ollama, github
+
+
+def fake_calls(drive, ollama, github):
+    return {
+        "drive_downloads": drive.service.downloads,
+        "llm_resume_calls": ollama.service.calls["resume"],
+        "llm_ranking_calls": ollama.service.calls["ranking"],
+        "embedding_calls": ollama.service.calls["embeddings"],
+        "github_requests": github.github.requests,
+    }
+
+
+def run_isolated(size, args):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        result_path = f.name
+    command = [
+        sys.executable, "-m", "Ranking_System.ranking_benchmark", "--child", str(size), "--result", result_path,
+        "--llm-share", str(args.llm_share), "--workers", str(args.workers), "--log-level", args.log_level,
+    ] + (["--mongo-uri", args.mongo_uri] if args.mongo_uri else [])
+    try:
+        completed = subprocess.run(command, stdout=None if args.verbose else subprocess.DEVNULL)
+        if completed.returncode != 0:
+            return {"applicants": size, "status": "crashed", "returncode": completed.returncode}
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.unlink(result_path)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results):
+    print(
+        f"\n{'N':>6} {'status':>10} {'wall s':>9} {'appl/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'RSS MB':>8} {'mongo ops':>10} {'LLM calls':>10}"
+    )
+    for run in results:
+        latency = run.get("applicant_latency_ms") or {}
+        calls = run.get("calls") or {}
+        print(
+            f"{run['applicants']:>6} {run.get('status') or '-':>10} {run.get('wall_seconds', 0):>9.2f} "
+            f"{run.get('throughput_per_second') or 0:>8.1f} {latency.get('p50') or 0:>9.1f} "
+            f"{latency.get('p95') or 0:>9.1f} {latency.get('p99') or 0:>9.1f} {run.get('peak_rss_mb', 0):>8.1f} "
+            f"{run.get('mongo_ops_total', 0):>10} {calls.get('llm_resume_calls', 0) + calls.get('llm_ranking_calls', 0):>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ranking jobs end to end against local fakes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="applicants per post")
+    parser.add_argument("--mongo-uri", help="benchmark against this mongod instead of mongomock")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="seconds per fake Ollama generate call")
+    parser.add_argument("--embed-latency", type=float, default=0.005, help="seconds per fake embedding call")
+    parser.add_argument("--drive-latency", type=float, default=0.02, help="seconds per fake Drive download")
+    parser.add_argument("--github-latency", type=float, default=0.05, help="seconds per fake GraphQL request")
+    parser.add_argument("--github-repos", type=int, default=None, help="repositories per fake GitHub user")
+    parser.add_argument("--llm-share", type=float, default=0.25, help="fraction of free-form resumes sent to the LLM")
+    parser.add_argument("--workers", type=int, default=10, help="applicant threads (app.MAX_WORKERS)")
+    parser.add_argument("--in-process", action="store_true", help="run every size in this process (RSS accumulates)")
+    parser.add_argument("--log-level", default="ERROR", help="log level of the ranking pipeline during runs")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's output")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(args.result, "w", encoding="utf-8") as f:
+            json.dump(run_size(args.child, args), f)
+        sys.exit(0)
+
+    servers = start_fakes(args)
+    results = []
+    for size in args.sizes:
+        print(f"⏱️ Ranking a post with {size} applicants...")
+        before = fake_calls(*servers)
+        result = run_size(size, args) if args.in_process else run_isolated(size, args)
+        after = fake_calls(*servers)
+        result["calls"] = {name: after[name] - before[name] for name in after}
+        results.append(result)
+        print(f"   {result.get('status')} in {result.get('wall_seconds', 0):.2f}s")
+
+    print_report(results)
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {name: value for name, value in vars(args).items() if name not in ("child", "result", "output")},
+            "runs": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results written to {args.output}")
@@ -0,0 +1,230 @@
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from Monitoring import metrics
+from Ranking_System import job_checkpoints
+
+# Per-applicant tasks shared by every worker node. A claimed task is hidden
+# for VISIBILITY_SECONDS (extended while it runs); if its worker dies it
+# becomes visible again and another node retries it.
+TASKS = "applicant_tasks"
+VISIBILITY_SECONDS = int(os.getenv("TASK_VISIBILITY_SECONDS", 300))
+MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", 3))
+BACKOFF_SECONDS = float(os.getenv("TASK_BACKOFF_SECONDS", 10))
+MAX_BACKOFF_SECONDS = float(os.getenv("TASK_MAX_BACKOFF_SECONDS", 300))
+POLL_SECONDS = float(os.getenv("TASK_POLL_SECONDS", 2))
+
+logger = logging.getLogger(__name__)
+
+_indexed = False
+
+
+def ensure_indexes(db):
+    global _indexed
+    if not _indexed:
+        db[TASKS].create_index([("status", ASCENDING), ("visible_at", ASCENDING)])
+        db[TASKS].create_index([("postId", ASCENDING), ("userId", ASCENDING)], unique=True)
+        _indexed = True
+
+
+def backoff(attempts):
+    """Exponential backoff with jitter before retry number `attempts`"""
+    delay = min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * 2 ** max(0, attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def enqueue(db, post_id, user_id, payload, max_attempts=MAX_ATTEMPTS):
+    """Queue one applicant task; a task already queued for the applicant is left as it is."""
+    now = datetime.utcnow()
+    try:
+        db[TASKS].update_one(
+            {"postId": str(post_id), "userId": user_id},
+            {"$setOnInsert": {
+                "payload": payload,
+                "status": "queued",
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "visible_at": now,
+                "created_at": now,
+            }},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        pass
+
+
+def requeue_dead(db, post_id):
+    """Give dead-lettered tasks of a post a fresh set of attempts"""
+    return db[TASKS].update_many(
+        {"postId": str(post_id), "status": "dead"},
+        {"$set": {"status": "queued", "attempts": 0, "visible_at": datetime.utcnow()}},
+    ).modified_count
+
+
+def claim(db, worker_id):
+    """
+    Atomically take the next visible task: a queued one, or a running one
+    whose worker let its visibility timeout lapse. Tasks out of attempts are
+    dead-lettered instead of returned.
+    """
+    while True:
+        now = datetime.utcnow()
+        task = db[TASKS].find_one_and_update(
+            {"status": {"$in": ["queued", "running"]}, "visible_at": {"$lte": now}},
+            {
+                "$set": {
+                    "status": "running",
+                    "worker": worker_id,
+                    "visible_at": now + timedelta(seconds=VISIBILITY_SECONDS),
+                    "started_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("visible_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if task is None:
+            return None
+        if task["attempts"] <= task.get("max_attempts", MAX_ATTEMPTS):
+            return task
+        dead_letter(db, task, task.get("last_error") or "visibility timeout expired on every attempt")
+
+
+def extend(db, task, worker_id):
+    """Push the task's visibility timeout out again; False if the task was taken over"""
+    result = db[TASKS].update_one(
+        {"_id": task["_id"], "worker": worker_id, "status": "running"},
+        {"$set": {"visible_at": datetime.utcnow() + timedelta(seconds=VISIBILITY_SECONDS)}},
+    )
+    return result.matched_count == 1
+
+
+def complete(db, task, worker_id):
+    db[TASKS].update_one(
+        {"_id": task["_id"], "worker": worker_id},
+        {"$set": {"status": "done", "finished_at": datetime.utcnow()}},
+    )
+
+
+def dead_letter(db, task, error):
+    db[TASKS].update_one(
+        {"_id": task["_id"]},
+        {"$set": {"status": "dead", "last_error": error, "finished_at": datetime.utcnow()}},
+    )
+    logger.warning(f"☠️ Task for applicant {task['userId']} dead-lettered: {error}")
+
+
+def fail(db, task, worker_id, error):
+    """Retry the task after a backoff, or dead-letter it once it is out of attempts"""
+    if task["attempts"] >= task.get("max_attempts", MAX_ATTEMPTS):
+        dead_letter(db, task, error)
+        return
+    delay = backoff(task["attempts"])
+    db[TASKS].update_one(
+        {"_id": task["_id"], "worker": worker_id},
+        {"$set": {
+            "status": "queued",
+            "last_error": error,
+            "visible_at": datetime.utcnow() + timedelta(seconds=delay),
+        }},
+    )
+    logger.warning(f"🔁 Task for applicant {task['userId']} failed ({error}), retrying in {delay:.0f}s")
+
+
+def counts(db, post_id):
+    totals = {"queued": 0, "running": 0, "done": 0, "dead": 0}
+    for row in db[TASKS].aggregate([
+        {"$match": {"postId": str(post_id)}},
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+    ]):
+        totals[row["_id"]] = row["count"]
+    return totals
+
+
+def wait_for_post(db, post_id, lease=None, timeout=None, poll=POLL_SECONDS):
+    """
+    Coordinator side: block until no task of the post is queued or running,
+    renewing the ranking lease with progress. Returns the final counts, or
+    None if the lease was lost or the timeout passed.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        totals = counts(db, post_id)
+        for status in ("queued", "running", "dead"):
+            metrics.QUEUE_DEPTH.labels(f"applicant_tasks_{status}").set(totals[status])
+        if lease is not None:
+            lease.renew(stage="distributed", tasks=totals)
+            if lease.lost.is_set():
+                return None
+        if totals["queued"] + totals["running"] == 0:
+            return totals
+        if deadline and time.monotonic() > deadline:
+            return None
+        time.sleep(poll)
+
+
+def clear(db, post_id):
+    db[TASKS].delete_many({"postId": str(post_id)})
+
+
+class _TaskHeartbeat:
+    def __init__(self, db, task, worker_id):
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._beat, args=(db, task, worker_id), daemon=True)
+
+    def _beat(self, db, task, worker_id):
+        while not self.stop.wait(VISIBILITY_SECONDS / 3):
+            try:
+                if not extend(db, task, worker_id):
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ Task heartbeat failed: {e}")
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+
+
+def run_worker(db, handler, worker_id=None, concurrency=1, stop=None):
+    """
+    Worker node loop: `concurrency` threads claim tasks and run
+    handler(task). The handler returns normally on success; an exception
+    retries the task with backoff. Runs until `stop` is set.
+    """
+    worker_id = worker_id or job_checkpoints.WORKER_ID
+    stop = stop or threading.Event()
+    ensure_indexes(db)
+
+    def loop():
+        while not stop.is_set():
+            try:
+                task = claim(db, worker_id)
+            except Exception as e:
+                logger.error(f"❌ Could not claim a task: {e}")
+                stop.wait(POLL_SECONDS)
+                continue
+            if task is None:
+                stop.wait(POLL_SECONDS)
+                continue
+            try:
+                with _TaskHeartbeat(db, task, worker_id):
+                    handler(task)
+                complete(db, task, worker_id)
+            except Exception as e:
+                fail(db, task, worker_id, str(e))
+
+    threads = [threading.Thread(target=loop, name=f"TaskWorker-{i}", daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
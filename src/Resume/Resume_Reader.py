@@ -1,4 +1,5 @@
 import os
+import logging
 import mimetypes
 import gdown
 import json
@@ -7,6 +8,19 @@ from docx import Document
 import ollama
 import re
 from openai import OpenAI
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from Resume import Resume_Sections
+from Resume import Rule_Extractor
+from Monitoring import logs, metrics
+
+# Max parallel LLM calls when a long resume is parsed section by section
+SECTION_WORKERS = int(os.getenv("RESUME_SECTION_WORKERS", 4))
+# Drive files are fetched from this URL template into CV_DIR (overridable for local test servers)
+DRIVE_DOWNLOAD_URL = os.getenv("RESUME_DOWNLOAD_URL", "https://drive.google.com/uc?id={file_id}")
+CV_DIR = os.getenv("RESUME_CV_DIR", os.path.join("Resume", "CV"))
+
+logger = logging.getLogger(__name__)
 
 
 def is_url(path_or_url):
@@ -212,14 +226,16 @@ class resumeParser:
             raise ValueError("❌ The URL is empty")
 
         fileID = URL.split('/d/')[1].split('/')[0]
-        outputPath = f'Resume/CV/{fileID}.pdf'
-        downloadURL = f'https://drive.google.com/uc?id={fileID}'
+        outputPath = os.path.join(CV_DIR, f'{fileID}.pdf')
+        downloadURL = DRIVE_DOWNLOAD_URL.format(file_id=fileID)
 
         if os.path.exists(outputPath):
-            print("✅ File already exists locally.")
+            logger.info("✅ File already exists locally.")
             return fileID, outputPath
 
-        gdown.download(downloadURL, outputPath, quiet=False)
+        os.makedirs(CV_DIR, exist_ok=True)
+        with metrics.timed("download"):
+            gdown.download(downloadURL, outputPath, quiet=True)
         return fileID, outputPath
 
     def checkFileType(self, filePath=None):
@@ -234,6 +250,7 @@ class resumeParser:
         else:
             return "UNSUPPORTED"
 
+    @metrics.timed("extract")
     def extractText(self, filePath):
         fileType = self.checkFileType(filePath)
         if fileType == "PDF":
@@ -251,7 +268,7 @@ class resumeParser:
         try:
             return json.loads(json_string)
         except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error: {e}")
+            logger.error(f"❌ JSON decode error: {e}")
             return {}
 
     def generateInformation_DeepSeekR1(self, text, api_key):
@@ -280,19 +297,20 @@ class resumeParser:
         return response.response
 
     def parseWithLLM(self, text, engine="llama", api_key=None):
-        print("🧠 Extracting Information using", engine.capitalize(), "...")
+        logger.info("🧠 Extracting Information using %s ...", engine.capitalize())
         raw_json = ""
 
-        if engine == "deepseek":
-            raw_json = self.generateInformation_DeepSeekR1(text, api_key)
-        elif engine == "chatgpt":
-            raw_json = self.generateInformation_ChatGPT(text)
-        elif engine == "llama":
-            raw_json = self.generateInformation_LLAMA(text)
-        elif engine == "mystel":
-            raw_json = self.generateInformation_Mystel(text)
-        else:
-            raise ValueError("❌ Invalid engine selected. Choose from deepseek, chatgpt, llama, mystel.")
+        with metrics.timed("llm_parse"):
+            if engine == "deepseek":
+                raw_json = self.generateInformation_DeepSeekR1(text, api_key)
+            elif engine == "chatgpt":
+                raw_json = self.generateInformation_ChatGPT(text)
+            elif engine == "llama":
+                raw_json = self.generateInformation_LLAMA(text)
+            elif engine == "mystel":
+                raw_json = self.generateInformation_Mystel(text)
+            else:
+                raise ValueError("❌ Invalid engine selected. Choose from deepseek, chatgpt, llama, mystel.")
 
         def clean_llm_output(raw_output):
             # Remove code block markers
@@ -304,9 +322,27 @@ class resumeParser:
                 return cleaned[start:end+1]
             return cleaned
         cleaned_json = clean_llm_output(raw_json)
-        print("📝 Parsed JSON:", cleaned_json)
+        logger.debug("📝 Parsed JSON (%d chars): %s", len(cleaned_json), logs.payload(cleaned_json))
         return self.jsonToDict(cleaned_json)
 
+    def parseInSections(self, text, engine="llama", api_key=None, only=None):
+        """
+        Parse a long resume one section at a time so each LLM call fits in the
+        model context, then merge the partial results. `only` limits parsing
+        to the given section names.
+        """
+        chunks = Resume_Sections.buildChunks(text, only=only)
+        logger.info("✂️ Long resume split into %d chunks: %s", len(chunks), [name for name, _ in chunks])
+
+        with ThreadPoolExecutor(max_workers=max(1, min(SECTION_WORKERS, len(chunks)))) as executor:
+            # Each section thread keeps the caller's job/applicant log context
+            parsed_chunks = list(executor.map(
+                lambda context, chunk: context.run(self.parseWithLLM, chunk[1], engine, api_key),
+                [contextvars.copy_context() for _ in chunks], chunks
+            ))
+
+        return Resume_Sections.mergeParsedSections(parsed_chunks)
+
     def resumeToDictionary(self, path_or_url=None, model=None, api_key=None):
         """
         High-level method that handles both URLs and local files.
@@ -325,8 +361,26 @@ class resumeParser:
                 return "❌ Local file does not exist."
 
         raw_text = self.extractText(local_path)
-        parsed_resume = self.parseWithLLM(raw_text, model, api_key)
-        return parsed_resume
+        text = Resume_Sections.preprocessText(raw_text)
+
+        # Deterministic fast path: skip the LLM for clean, well-structured resumes
+        rules = Rule_Extractor.extract(text)
+        if rules["confidence"] >= Rule_Extractor.SKIP_LLM_CONFIDENCE:
+            logger.info(f"⚡ Rule-based extraction confident ({rules['confidence']}), skipping LLM")
+            return rules["data"]
+
+        unresolved = rules["unresolved"]
+        if not unresolved:
+            logger.info(f"⚡ Nothing left for the LLM (confidence {rules['confidence']}), keeping rule-based data")
+            return rules["data"]
+        logger.info("🔎 Rule-based confidence %s, sending %s to LLM", rules['confidence'], unresolved)
+
+        # Short resumes keep the single-call path
+        if len(text) <= Resume_Sections.SINGLE_CALL_MAX_CHARS:
+            parsed = self.parseWithLLM(Resume_Sections.selectSections(text, unresolved), model, api_key)
+        else:
+            parsed = self.parseInSections(text, model, api_key, only=unresolved)
+        return Rule_Extractor.combine(rules, parsed)
 
 
 def parseResume(applicant_id, path_or_url, model=None, api_key=None):
@@ -0,0 +1,230 @@
+import re
+from collections import Counter
+
+# Resumes shorter than this (after cleanup) are sent to the LLM in one call
+SINGLE_CALL_MAX_CHARS = 6000
+# Upper bound for a single section chunk; larger sections are split on paragraphs
+MAX_SECTION_CHARS = 4000
+# Number of lines at the top/bottom of each page checked for headers and footers
+EDGE_LINES = 3
+
+SECTION_HEADINGS = {
+    "education": [
+        "education", "academic background", "academic qualifications", "academics",
+        "qualifications", "educational background", "education and training",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "internships", "internship",
+        "relevant experience", "research experience", "teaching experience",
+        "professional background", "career history",
+    ],
+    "projects": [
+        "projects", "personal projects", "academic projects", "key projects",
+        "selected projects", "project experience", "research projects",
+    ],
+    "skills": [
+        "skills", "technical skills", "core competencies", "competencies",
+        "technologies", "tools", "tools and technologies", "programming languages",
+        "skills and interests", "skills & interests", "technical proficiency",
+        "certifications", "certificates", "languages",
+    ],
+    "other": [
+        "publications", "selected publications", "awards", "honors", "honours",
+        "awards and honors", "achievements", "activities", "extracurricular activities",
+        "references", "interests", "hobbies", "volunteering", "volunteer experience",
+        "research interests", "summary", "profile", "objective", "career objective", "about me",
+        "conferences", "talks", "patents", "grants", "memberships",
+    ],
+}
+
+_HEADING_LOOKUP = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+# "Page 2", "Page 2 of 3", "2 of 3", "2/3" or a bare number of at most 3 digits (not a year)
+_PAGE_NUMBER_RE = re.compile(r"^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|\d+\s*(?:of|/)\s*\d+|\d{1,3})$", re.IGNORECASE)
+
+
+def normalizeWhitespace(text):
+    """Collapse runs of spaces/tabs, strip lines and squeeze blank lines."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\xa0", " ")
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n")]
+    cleaned = []
+    for line in lines:
+        if not line and (not cleaned or not cleaned[-1]):
+            continue
+        cleaned.append(line)
+    return "\n".join(cleaned).strip()
+
+
+def _edgeIndexes(lines):
+    """Positions of the first and last EDGE_LINES non-empty lines of a page."""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    return set(filled[:EDGE_LINES] + filled[-EDGE_LINES:])
+
+
+def _dropPageNumbers(page):
+    """Remove page-number lines, looking only at the top and bottom of the page."""
+    lines = page.split("\n")
+    edges = _edgeIndexes(lines)
+    return [line for i, line in enumerate(lines) if not (i in edges and _PAGE_NUMBER_RE.match(line.strip()))]
+
+
+def removeRepeatedHeadersFooters(text):
+    """
+    Drop lines that repeat at the top or bottom of most pages (names, contact
+    strips, confidentiality notes) along with page numbers at the page edges.
+    pdfminer separates pages with a form feed character.
+    """
+    pages = [page for page in text.split("\f") if page.strip()]
+    if len(pages) < 2:
+        return "\n".join("\n".join(_dropPageNumbers(page)) for page in pages)
+
+    edge_counts = Counter()
+    for page in pages:
+        lines = [line.strip() for line in page.split("\n") if line.strip()]
+        edges = set(lines[:EDGE_LINES] + lines[-EDGE_LINES:])
+        edge_counts.update(edges)
+
+    threshold = max(2, len(pages) // 2 + 1)
+    repeated = {line for line, count in edge_counts.items() if count >= threshold}
+
+    kept_pages = []
+    for index, page in enumerate(pages):
+        kept = []
+        for line in _dropPageNumbers(page):
+            stripped = line.strip()
+            # Keep the first occurrence so the name/contact strip still reaches the parser
+            if stripped in repeated and index > 0:
+                continue
+            kept.append(line)
+        kept_pages.append("\n".join(kept))
+    return "\n".join(kept_pages)
+
+
+def detectHeading(line):
+    """Return the section name if the line looks like a section heading."""
+    candidate = line.strip().strip(":").strip()
+    if not candidate or len(candidate) > 40 or len(candidate.split()) > 5:
+        return None
+    candidate = re.sub(r"^[\W\d_]+|[\W_]+$", "", candidate).lower()
+    return _HEADING_LOOKUP.get(candidate)
+
+
+def splitSections(text):
+    """
+    Split cleaned resume text into sections using heading heuristics.
+    Returns a dict of section name -> text. Text before the first heading is
+    stored under "header" (name and contact details).
+    """
+    sections = {"header": []}
+    current = "header"
+    for line in text.split("\n"):
+        section = detectHeading(line)
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            sections[current].append(line)
+            continue
+        sections[current].append(line)
+    return {
+        name: "\n".join(lines).strip()
+        for name, lines in sections.items()
+        if "\n".join(lines).strip()
+    }
+
+
+def _splitLongText(text, max_chars):
+    """Split text on paragraph (then line) boundaries into pieces below max_chars."""
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks, current = [], ""
+    for block in re.split(r"\n\s*\n|\n", text):
+        if current and len(current) + len(block) + 1 > max_chars:
+            chunks.append(current)
+            current = ""
+        while len(block) > max_chars:
+            chunks.append(block[:max_chars])
+            block = block[max_chars:]
+        current = f"{current}\n{block}" if current else block
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def preprocessText(raw_text):
+    """Cleanup stage applied before any LLM call."""
+    return normalizeWhitespace(removeRepeatedHeadersFooters(raw_text))
+
+
+def selectSections(text, names):
+    """Keep only the named sections of the text (all of it if it has no headings)."""
+    sections = splitSections(text)
+    if len(sections) <= 1:
+        return text
+    return "\n\n".join(body for name, body in sections.items() if name in names)
+
+
+def buildChunks(text, max_chars=MAX_SECTION_CHARS, only=None):
+    """
+    Build the list of (section, chunk_text) pairs to parse separately.
+    The header (contact details) is prepended to the first chunk, within its
+    max_chars budget, so the name/email/phone fields are always resolved; a
+    header too long to share a chunk is sent as its own. `only` restricts
+    the chunks to the given section names.
+    """
+    sections = splitSections(text)
+    header = sections.pop("header", "")
+    if only is not None and sections:
+        if "header" not in only:
+            header = ""
+        sections = {name: body for name, body in sections.items() if name in only}
+
+    chunks = []
+    for section, body in sections.items():
+        for piece in _splitLongText(body, max_chars):
+            chunks.append((section, piece))
+
+    if not chunks:
+        return [("header", piece) for piece in _splitLongText(header, max_chars)] if header else []
+    if header:
+        section, first = chunks[0]
+        budget = max_chars - len(header) - 2
+        if budget < max_chars // 4:
+            chunks[:0] = [("header", piece) for piece in _splitLongText(header, max_chars)]
+        else:
+            head, *rest = _splitLongText(first, budget)
+            chunks[:1] = [(section, f"{header}\n\n{head}")] + [(section, piece) for piece in rest]
+    return chunks
+
+
+def mergeParsedSections(parsed_list):
+    """Merge several partial parse results into a single resume dictionary."""
+    merged = {
+        "name": "",
+        "email": "",
+        "phone": "",
+        "education": [],
+        "experience": [],
+        "projects": [],
+        "skills": [],
+    }
+    seen = {key: set() for key in ("education", "experience", "projects", "skills")}
+
+    for parsed in parsed_list:
+        if not isinstance(parsed, dict):
+            continue
+        for key in ("name", "email", "phone"):
+            if not merged[key] and parsed.get(key):
+                merged[key] = parsed[key]
+        for key in seen:
+            for item in parsed.get(key) or []:
+                fingerprint = repr(item).lower() if not isinstance(item, str) else item.strip().lower()
+                if fingerprint in seen[key]:
+                    continue
+                seen[key].add(fingerprint)
+                merged[key].append(item)
+    return merged
@@ -0,0 +1,388 @@
+import os
+import re
+from Resume import Resume_Sections
+from Skills import Skill_Normalizer
+
+# Overall confidence at or above which the LLM is skipped entirely
+SKIP_LLM_CONFIDENCE = float(os.getenv("RULES_SKIP_LLM_CONFIDENCE", 0.9))
+# Per-field confidence at or above which a field is trusted and not re-parsed
+FIELD_RESOLVED_CONFIDENCE = 0.8
+
+FIELD_WEIGHTS = {
+    "name": 0.10,
+    "email": 0.15,
+    "phone": 0.05,
+    "education": 0.20,
+    "experience": 0.20,
+    "projects": 0.10,
+    "skills": 0.20,
+}
+FIELD_SECTIONS = {
+    "name": "header",
+    "email": "header",
+    "phone": "header",
+    "education": "education",
+    "experience": "experience",
+    "projects": "projects",
+    "skills": "skills",
+}
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"(?<![\w/])\+?\(?\d[\d\s().-]{8,18}\d(?![\w/])")
+_MONTHS = {
+    "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
+    "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12",
+}
+_DATE = r"(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?,?\s+\d{4}|\d{1,2}/\d{4}|\d{4})"
+DATE_RANGE_RE = re.compile(
+    rf"(?<![\w/])(?P<start>{_DATE})\s*(?:-|–|—|to|till|until)\s*(?P<end>{_DATE}|present|current|now|ongoing)(?![\w/])",
+    re.IGNORECASE,
+)
+DEGREE_RE = re.compile(
+    r"\b(?:bachelor(?:'s)?|master(?:'s)?|doctor(?:ate)?|ph\.?\s?d|b\.?\s?sc?|m\.?\s?sc?|b\.?\s?e|m\.?\s?e|"
+    r"b\.?\s?tech|m\.?\s?tech|bba|mba|bcs|mcs|bscs|mscs|bsse|bsee|f\.?\s?sc|intermediate|matric(?:ulation)?|"
+    r"a[\s-]levels?|o[\s-]levels?|hssc|ssc|associate(?:'s)? degree)\b",
+    re.IGNORECASE,
+)
+INSTITUTE_RE = re.compile(r"\b(?:university|institute|college|school|academy|polytechnic)\b", re.IGNORECASE)
+MARKS_RE = re.compile(
+    r"(?:c?gpa|marks|percentage|grade)\s*[:\-]?\s*(\d+(?:\.\d+)?\s*(?:/\s*\d+(?:\.\d+)?|%)?)"
+    r"|(\d{2,3}(?:\.\d+)?\s*%)",
+    re.IGNORECASE,
+)
+COMPANY_HINT_RE = re.compile(
+    r"\b(?:inc|ltd|llc|pvt|corp|corporation|company|co\.|technologies|solutions|labs|systems|"
+    r"software|group|limited|gmbh|studio|studios|consulting|university|institute|college|bank)\b",
+    re.IGNORECASE,
+)
+ROLE_HINT_RE = re.compile(
+    r"\b(?:engineer|developer|intern|manager|analyst|scientist|designer|lead|consultant|assistant|"
+    r"researcher|architect|administrator|specialist|officer|associate|programmer|trainee|head|"
+    r"director|founder|co-founder|teacher|lecturer|tutor|fellow|professor|instructor)\b",
+    re.IGNORECASE,
+)
+TECH_LINE_RE = re.compile(r"^(?:tech(?:nologies)?|tech stack|stack|tools|built with|skills)\s*[:\-]\s*(.+)$", re.IGNORECASE)
+BULLET_RE = re.compile(r"^[\-•*●▪◦·–]\s*")
+NAME_TITLE_RE = re.compile(r"^(?:dr|mr|mrs|ms|miss|engr|prof)\.?\s+", re.IGNORECASE)
+
+
+def normalizeDate(value):
+    """Normalise a date to YYYY-MM, matching the LLM prompt's date rules."""
+    if not value:
+        return ""
+    value = value.strip().lower().rstrip(".,")
+    if value in ("present", "current", "now", "ongoing"):
+        return "Present"
+    match = re.match(r"(\d{1,2})/(\d{4})", value)
+    if match:
+        return f"{match.group(2)}-{int(match.group(1)):02d}"
+    match = re.match(r"([a-z]+)\.?,?\s+(\d{4})", value)
+    if match and match.group(1)[:3] in _MONTHS:
+        return f"{match.group(2)}-{_MONTHS[match.group(1)[:3]]}"
+    match = re.match(r"(\d{4})", value)
+    if match:
+        return f"{match.group(1)}-01"
+    return ""
+
+
+def canonicalSkill(token):
+    """Display name of a known skill from the shared taxonomy, or None."""
+    skill_id = Skill_Normalizer.normalize(token)
+    return Skill_Normalizer.get_normalizer().display_name(skill_id) if skill_id else None
+
+
+def _lines(text):
+    return [line.strip() for line in text.split("\n") if line.strip()]
+
+
+def _splitItems(text):
+    items = []
+    for line in _lines(text):
+        line = BULLET_RE.sub("", line)
+        if ":" in line:
+            line = line.split(":", 1)[1]
+        for token in re.split(r"[,|;•·]|\s{2,}|\s/\s", line):
+            token = token.strip(" .()")
+            if token:
+                items.append(token)
+    return items
+
+
+def extractContact(header, full_text):
+    email_match = EMAIL_RE.search(header) or EMAIL_RE.search(full_text)
+    email = email_match.group(0) if email_match else ""
+
+    phone = ""
+    for match in PHONE_RE.finditer(header or full_text):
+        candidate = match.group(0).strip()
+        digits = re.sub(r"\D", "", candidate)
+        if 10 <= len(digits) <= 15 and not DATE_RANGE_RE.search(candidate):
+            phone = re.sub(r"[^\d+\-\s()]", "", candidate).strip()
+            break
+
+    name = ""
+    for line in _lines(header)[:5]:
+        words = NAME_TITLE_RE.sub("", line).split()
+        if (
+            2 <= len(words) <= 4
+            and all(re.fullmatch(r"[A-Za-z][A-Za-z.'\-]*", word) for word in words)
+            and not re.search(r"resume|curriculum|vitae|\bcv\b", line, re.IGNORECASE)
+        ):
+            name = " ".join(word.capitalize() if word.isupper() else word for word in words)
+            break
+
+    return {"name": name, "email": email, "phone": phone}
+
+
+def extractEducation(text):
+    entries, pending, current = [], {}, None
+
+    def newEntry():
+        return {"degree": "", "institute": "", "marks_or_cgpa": "", "start": "", "end": "", "courses": []}
+
+    for line in _lines(text)[1:]:
+        line = BULLET_RE.sub("", line)
+        degree_match = DEGREE_RE.search(line)
+        is_institute = bool(INSTITUTE_RE.search(line))
+
+        # "Degree, Institute, 2015 - 2019" style lines carry several fields
+        parts = [DATE_RANGE_RE.sub("", part).strip(" ,-|") for part in re.split(r",\s+|\s[|@]\s|\s{2,}", line)]
+        parts = [part for part in parts if part]
+        degree_part = next((part for part in parts if DEGREE_RE.match(part)), None)
+        if degree_match and degree_part is None and not is_institute:
+            degree_part = parts[0] if parts else ""
+
+        if degree_part:
+            if current and current["degree"]:
+                entries.append(current)
+            current = newEntry()
+            current.update(pending)
+            pending = {}
+            current["degree"] = degree_part
+
+        target = current if current is not None else pending
+        if is_institute:
+            if degree_part:
+                institute = ", ".join(part for part in parts if INSTITUTE_RE.search(part) and part != degree_part)
+            else:
+                institute = re.split(r"\s[|]\s|\s{2,}", DATE_RANGE_RE.sub("", line))[0].strip(" ,-|")
+            if not institute:
+                pass
+            elif target.get("institute"):
+                pending["institute"] = institute
+            else:
+                target["institute"] = institute
+
+        date_match = DATE_RANGE_RE.search(line)
+        if date_match:
+            if target.get("start"):
+                pending.update(start=normalizeDate(date_match.group("start")), end=normalizeDate(date_match.group("end")))
+            else:
+                target["start"] = normalizeDate(date_match.group("start"))
+                target["end"] = normalizeDate(date_match.group("end"))
+
+        marks_match = MARKS_RE.search(line)
+        if marks_match and not target.get("marks_or_cgpa"):
+            target["marks_or_cgpa"] = (marks_match.group(1) or marks_match.group(2)).replace(" ", "")
+
+        if re.match(r"(relevant\s+)?course(work|s)\s*:", line, re.IGNORECASE) and current is not None:
+            current["courses"] = [c.strip(" .") for c in line.split(":", 1)[1].split(",") if c.strip(" .")]
+
+    if current and current["degree"]:
+        entries.append(current)
+
+    complete = sum(1 for e in entries if e["degree"] and e["institute"] and (e["start"] or e["end"]))
+    confidence = complete / len(entries) if entries else 0.0
+    return entries, confidence
+
+
+def _splitRoleCompany(lines):
+    role, company = "", ""
+    for line in lines:
+        parts = re.split(r"\s+(?:at|@)\s+|\s*,\s+|\s[|–—-]\s", line, maxsplit=1)
+        if len(parts) == 2:
+            first, second = parts
+            first_is_company = COMPANY_HINT_RE.search(first) and not ROLE_HINT_RE.search(first)
+            second_is_role = ROLE_HINT_RE.search(second) and not ROLE_HINT_RE.search(first)
+            if first_is_company or second_is_role:
+                first, second = second, first
+            role, company = role or first.strip(), company or second.strip()
+            continue
+        if ROLE_HINT_RE.search(line) and not role:
+            role = line
+        elif not company:
+            company = line
+        elif not role:
+            role = line
+    return role, company
+
+
+def _joinDescription(lines):
+    return ". ".join(line.rstrip(".") for line in lines if line) + ("." if lines and lines[-1].endswith(".") else "")
+
+
+def extractExperience(text):
+    raw_lines = _lines(text)[1:]
+    bullets = [bool(BULLET_RE.match(line)) for line in raw_lines]
+    lines = [BULLET_RE.sub("", line) for line in raw_lines]
+    anchors = [i for i, line in enumerate(lines) if DATE_RANGE_RE.search(line)]
+    entries = []
+
+    for index, anchor in enumerate(anchors):
+        date_match = DATE_RANGE_RE.search(lines[anchor])
+        previous_end = anchors[index - 1] if index else -1
+        next_anchor = anchors[index + 1] if index + 1 < len(anchors) else len(lines)
+
+        remainder = DATE_RANGE_RE.sub("", lines[anchor]).strip(" ,-|()")
+        title_lines = [remainder] if remainder else []
+        # Up to two heading lines directly above the date line belong to this entry
+        above = []
+        for i in range(anchor - 1, max(previous_end, anchor - 3), -1):
+            if bullets[i] or len(lines[i].split()) > 10:
+                break
+            above.insert(0, lines[i])
+        title_lines = above + title_lines
+
+        # Description runs until the (non-bullet) heading lines of the next entry
+        description_end = next_anchor
+        while (
+            description_end < len(lines)
+            and description_end > anchor + 1
+            and next_anchor - description_end < 2
+            and not bullets[description_end - 1]
+            and len(lines[description_end - 1].split()) <= 10
+        ):
+            description_end -= 1
+        description = _joinDescription(lines[anchor + 1:description_end])
+
+        role, company = _splitRoleCompany(title_lines[-2:])
+        entries.append({
+            "company": company,
+            "role": role,
+            "description": description,
+            "start": normalizeDate(date_match.group("start")),
+            "end": normalizeDate(date_match.group("end")),
+        })
+
+    complete = sum(1 for e in entries if e["company"] and e["role"])
+    confidence = complete / len(entries) if entries else 0.0
+    return entries, confidence
+
+
+def extractProjects(text):
+    projects, current = [], None
+    for line in _lines(text)[1:]:
+        tech_match = TECH_LINE_RE.match(BULLET_RE.sub("", line))
+        if tech_match and current is not None:
+            current["tech"].extend(
+                canonicalSkill(t) or t for t in _splitItems(tech_match.group(1)) if t not in current["tech"]
+            )
+            continue
+        if not BULLET_RE.match(line) and len(line.split()) <= 8 and not line.endswith("."):
+            title = DATE_RANGE_RE.sub("", line)
+            title = re.split(r"\s[|]\s|\s[–—-]\s", title)[0].strip(" ,-|")
+            if title:
+                current = {"title": title, "tech": []}
+                projects.append(current)
+                continue
+        if current is not None:
+            # Pick up technologies mentioned inline in bullet descriptions
+            for token in re.findall(r"[A-Za-z][\w.+#/-]*(?:\s[A-Z][\w.+#-]*)?", line):
+                skill = canonicalSkill(token)
+                if skill and skill not in current["tech"]:
+                    current["tech"].append(skill)
+
+    complete = sum(1 for p in projects if p["title"] and p["tech"])
+    confidence = complete / len(projects) if projects else 0.0
+    return projects, confidence
+
+
+def extractSkills(text):
+    skills, known = [], 0
+    for token in _splitItems("\n".join(_lines(text)[1:])):
+        if len(token.split()) > 4:
+            continue
+        skill = canonicalSkill(token)
+        if skill:
+            known += 1
+        skill = skill or token
+        if skill not in skills:
+            skills.append(skill)
+    confidence = known / len(skills) if skills else 0.0
+    # Most skills sections mix in a few niche tools; a majority of known skills is a clean section
+    return skills, min(1.0, confidence / 0.6)
+
+
+def scanSkills(text):
+    """Dictionary scan over free text, used when there is no skills section."""
+    found = []
+    for token in re.findall(r"[A-Za-z.][\w.+#/-]*(?:\s[A-Z][\w.+#-]*)?", text):
+        skill = canonicalSkill(token) or next(filter(None, map(canonicalSkill, token.split())), None)
+        if skill and skill not in found:
+            found.append(skill)
+    return found
+
+
+def extract(text):
+    """
+    Fill resume fields with regexes and dictionaries.
+    Returns the parsed data (same schema as the LLM output), an overall
+    confidence score, per-field confidences and the sections that still need
+    the LLM.
+    """
+    sections = Resume_Sections.splitSections(text)
+    header = sections.get("header", "")
+
+    data = extractContact(header, text)
+    fields = {
+        "name": 1.0 if data["name"] else 0.0,
+        "email": 1.0 if data["email"] else 0.0,
+        # A missing phone number is common and not something the LLM would find either
+        "phone": 1.0 if data["phone"] or not re.search(r"\d{7,}", re.sub(r"\D", "", header)) else 0.0,
+    }
+
+    structured = len(sections) > 1
+    for field, extractor in (
+        ("education", extractEducation),
+        ("experience", extractExperience),
+        ("projects", extractProjects),
+        ("skills", extractSkills),
+    ):
+        if field in sections:
+            data[field], fields[field] = extractor(sections[field])
+        else:
+            data[field] = scanSkills(text) if field == "skills" else []
+            # An absent section in a well-sectioned resume is a confident "empty"
+            fields[field] = 1.0 if structured and field != "skills" else 0.0
+
+    confidence = sum(FIELD_WEIGHTS[f] * score for f, score in fields.items()) if structured else 0.0
+    # In a sectioned resume only sections that are present are worth sending to the LLM
+    unresolved = sorted({
+        FIELD_SECTIONS[f] for f, score in fields.items()
+        if score < FIELD_RESOLVED_CONFIDENCE and (not structured or FIELD_SECTIONS[f] in sections)
+    })
+    return {
+        "data": data,
+        "confidence": round(confidence, 3),
+        "fields": fields,
+        "unresolved": unresolved,
+    }
+
+
+def combine(rule_result, llm_data):
+    """
+    Merge LLM output into the rule-based result: trusted fields keep the rule
+    values, fields of the sections sent to the LLM take its non-empty values
+    (falling back to rules).
+    """
+    data = dict(rule_result["data"])
+    if not isinstance(llm_data, dict):
+        return data
+    for field, score in rule_result["fields"].items():
+        if score >= FIELD_RESOLVED_CONFIDENCE and data.get(field):
+            continue
+        if FIELD_SECTIONS[field] not in rule_result["unresolved"]:
+            continue
+        if llm_data.get(field):
+            data[field] = llm_data[field]
+    return data
@@ -0,0 +1,148 @@
+"""
+Compare the rule-based resume extractor against the LLM path on the fixture
+corpus in Resume/fixtures (<name>.txt resume text + <name>.json expected output).
+
+Run from the src directory:
+    python -m Resume.benchmark_extractor            # rules only
+    python -m Resume.benchmark_extractor --llm      # rules vs llama (needs Ollama)
+    python -m Resume.benchmark_extractor --output bench.json
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import time
+
+from Resume import Resume_Sections
+from Resume import Rule_Extractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIELDS = ["name", "email", "phone", "education", "experience", "projects", "skills"]
+
+
+def _norm(value):
+    return re.sub(r"\s+", " ", str(value or "")).strip().lower()
+
+
+def _itemKey(field, item):
+    if isinstance(item, str):
+        return _norm(item)
+    if field == "education":
+        return _norm(item.get("degree"))
+    if field == "experience":
+        return (_norm(item.get("company")), _norm(item.get("role")))
+    if field == "projects":
+        return _norm(item.get("title"))
+    return _norm(item)
+
+
+def fieldScore(field, expected, actual):
+    """1/0 for scalar fields, F1 over item keys for list fields."""
+    if field == "phone":
+        return float(re.sub(r"\D", "", expected or "") == re.sub(r"\D", "", actual or ""))
+    if field in ("name", "email"):
+        return float(_norm(expected) == _norm(actual))
+
+    expected_keys = {_itemKey(field, item) for item in expected or []}
+    actual_keys = {_itemKey(field, item) for item in actual or [] if isinstance(item, (str, dict))}
+    if not expected_keys and not actual_keys:
+        return 1.0
+    matched = len(expected_keys & actual_keys)
+    if not matched:
+        return 0.0
+    precision = matched / len(actual_keys)
+    recall = matched / len(expected_keys)
+    return 2 * precision * recall / (precision + recall)
+
+
+def loadCorpus(directory=FIXTURES_DIR):
+    corpus = []
+    for text_path in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+        expected_path = text_path[:-4] + ".json"
+        if not os.path.exists(expected_path):
+            continue
+        with open(text_path, encoding="utf-8") as f:
+            text = f.read()
+        with open(expected_path, encoding="utf-8") as f:
+            expected = json.load(f)
+        corpus.append((os.path.basename(text_path), text, expected))
+    return corpus
+
+
+def runRules(text):
+    result = Rule_Extractor.extract(Resume_Sections.preprocessText(text))
+    return result["data"], result["confidence"]
+
+
+def runLLM(parser, text, engine):
+    return parser.parseWithLLM(Resume_Sections.preprocessText(text), engine), None
+
+
+def benchmark(name, runner, corpus):
+    per_field = {field: [] for field in FIELDS}
+    timings, rows = [], []
+    for fixture, text, expected in corpus:
+        start = time.perf_counter()
+        data, confidence = runner(text)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+
+        scores = {field: fieldScore(field, expected.get(field), (data or {}).get(field)) for field in FIELDS}
+        for field, score in scores.items():
+            per_field[field].append(score)
+        rows.append({"fixture": fixture, "seconds": elapsed, "confidence": confidence, "scores": scores})
+
+    accuracy = {field: sum(scores) / len(scores) for field, scores in per_field.items() if scores}
+    return {
+        "path": name,
+        "resumes": len(corpus),
+        "mean_seconds": sum(timings) / len(timings) if timings else 0.0,
+        "max_seconds": max(timings) if timings else 0.0,
+        "field_accuracy": accuracy,
+        "overall_accuracy": sum(accuracy.values()) / len(accuracy) if accuracy else 0.0,
+        "fixtures": rows,
+    }
+
+
+def printReport(report):
+    print(f"\n=== {report['path']} ({report['resumes']} resumes) ===")
+    print(f"Time per resume: mean {report['mean_seconds'] * 1000:.2f} ms, max {report['max_seconds'] * 1000:.2f} ms")
+    for field, score in report["field_accuracy"].items():
+        print(f"  {field:<12} {score:.2f}")
+    print(f"  {'overall':<12} {report['overall_accuracy']:.2f}")
+    for row in report["fixtures"]:
+        confidence = "" if row["confidence"] is None else f" confidence={row['confidence']}"
+        print(f"  - {row['fixture']}: {row['seconds'] * 1000:.2f} ms{confidence}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Rule-based vs LLM resume extraction benchmark")
+    arg_parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    arg_parser.add_argument("--llm", action="store_true", help="Also run the LLM path (requires Ollama)")
+    arg_parser.add_argument("--engine", default="llama")
+    arg_parser.add_argument("--output", help="Write the machine-readable report to this JSON file")
+    args = arg_parser.parse_args()
+
+    corpus = loadCorpus(args.fixtures)
+    if not corpus:
+        print(f"❌ No fixtures found in {args.fixtures}")
+        return
+
+    reports = [benchmark("rules", runRules, corpus)]
+    if args.llm:
+        from Resume import Resume_Reader
+        parser = Resume_Reader.resumeParser()
+        reports.append(benchmark(args.engine, lambda text: runLLM(parser, text, args.engine), corpus))
+
+    for report in reports:
+        printReport(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        print(f"\n📝 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import re
+import threading
+from datetime import datetime
+
+import numpy as np
+from pymongo import ASCENDING, DESCENDING
+from Skills import Skill_Normalizer
+
+INDEX_COLLECTION = "Skill_Index"
+
+# Fields a plain (unprefixed) query term is matched against
+SKILL_FIELDS = ("skill", "tech", "lang")
+
+DEGREE_LEVELS = [
+    ("phd", re.compile(r"\b(?:ph\.?\s?d|doctor(?:ate)?)\b", re.IGNORECASE)),
+    ("master", re.compile(r"\b(?:master|m\.?\s?sc?|mba|mcs|mscs|m\.?\s?phil|m\.?\s?tech|m\.?\s?e)\b", re.IGNORECASE)),
+    ("bachelor", re.compile(r"\b(?:bachelor|b\.?\s?sc?|bba|bcs|bscs|bsse|bsee|b\.?\s?tech|b\.?\s?e)\b", re.IGNORECASE)),
+    ("intermediate", re.compile(r"\b(?:intermediate|f\.?\s?sc|a[\s-]levels?|hssc)\b", re.IGNORECASE)),
+]
+DEGREE_FIELD_RE = re.compile(r"\b(?:in|of)\s+([A-Za-z &]+)$|^(?:[A-Za-z.]+)\s+([A-Za-z &]+)$")
+
+
+def _token(text):
+    return re.sub(r"[^a-z0-9+#]+", "_", str(text).strip().lower()).strip("_")
+
+
+def _payload(source):
+    if isinstance(source, dict) and "source" in source and "data" in source:
+        return source["data"]
+    return source
+
+
+def degree_terms(degree):
+    terms = []
+    for level, pattern in DEGREE_LEVELS:
+        if pattern.search(degree or ""):
+            terms.append(f"degree:{level}")
+            break
+    match = DEGREE_FIELD_RE.search((degree or "").split(",")[0].strip())
+    field = match and (match.group(1) or match.group(2))
+    if field and len(field.split()) <= 5:
+        terms.append(f"degree:{_token(field)}")
+    return terms
+
+
+def applicant_terms(record):
+    """
+    Index terms for an applicant record:
+      skill:<id>   normalized skills from every source
+      tech:<id>    technologies listed on resume projects
+      lang:<id>    GitHub repository languages
+      degree:<x>   degree level (bachelor/master/phd/...) and field of study
+    """
+    normalizer = Skill_Normalizer.get_normalizer()
+    terms = set()
+
+    skill_ids = record.get("skill_ids")
+    if skill_ids is None:
+        skill_ids = Skill_Normalizer.applicant_skill_ids(record)
+    terms.update(f"skill:{skill_id}" for skill_id in skill_ids)
+
+    resume = _payload(record.get("resume_info")) or {}
+    if isinstance(resume, dict):
+        for project in resume.get("projects") or []:
+            for tech in (project.get("tech") or []) if isinstance(project, dict) else []:
+                if isinstance(tech, str) and tech.strip():
+                    terms.add(f"tech:{normalizer.normalize(tech) or _token(tech)}")
+        for education in resume.get("education") or []:
+            if isinstance(education, dict):
+                terms.update(degree_terms(education.get("degree")))
+
+    github = _payload(record.get("github_data") or record.get("github_info"))
+    for part in github if isinstance(github, list) else []:
+        for repo in part if isinstance(part, list) else []:
+            for language in (repo.get("languages") or []) if isinstance(repo, dict) else []:
+                terms.add(f"lang:{normalizer.normalize(language) or _token(language)}")
+
+    return sorted(terms)
+
+
+class SkillIndex:
+    """
+    Inverted index from terms to applicants for one post. Postings are
+    Python ints used as bitsets (bit i = applicant at position i), so boolean
+    queries are a handful of big-int AND/OR/NOT operations.
+    """
+
+    def __init__(self):
+        self.applicants = []
+        self.names = []
+        self.positions = {}
+        self.postings = {}
+        self.terms = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.applicants)
+
+    def add(self, applicant_id, terms, name=""):
+        applicant_id = str(applicant_id)
+        with self.lock:
+            position = self.positions.get(applicant_id)
+            if position is None:
+                position = len(self.applicants)
+                self.positions[applicant_id] = position
+                self.applicants.append(applicant_id)
+                self.names.append(name)
+            else:
+                # Re-indexing an applicant: clear the old postings first
+                mask = ~(1 << position)
+                for term in self.terms.get(applicant_id, []):
+                    self.postings[term] &= mask
+                self.names[position] = name or self.names[position]
+
+            bit = 1 << position
+            for term in terms:
+                self.postings[term] = self.postings.get(term, 0) | bit
+            self.terms[applicant_id] = list(terms)
+
+    def all_bits(self):
+        return (1 << len(self.applicants)) - 1
+
+    def term_bits(self, term):
+        """Bitset for a query term. Unprefixed skills match skills, project tech and GitHub languages."""
+        if ":" in term:
+            field, value = term.split(":", 1)
+            value = Skill_Normalizer.normalize(value) or _token(value)
+            return self.postings.get(f"{field}:{value}", 0)
+
+        value = Skill_Normalizer.normalize(term) or _token(term)
+        bits = 0
+        for field in SKILL_FIELDS:
+            bits |= self.postings.get(f"{field}:{value}", 0)
+        return bits
+
+    def to_array(self, bits):
+        """Unpack a bitset into a boolean NumPy array of length len(self)."""
+        count = len(self.applicants)
+        if not count:
+            return np.zeros(0, dtype=bool)
+        raw = np.frombuffer(bits.to_bytes((count + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(raw, bitorder="little")[:count].astype(bool)
+
+    def search(self, all_terms=None, any_terms=None, none_terms=None, weights=None, limit=50):
+        """
+        Boolean + weighted search.
+          all_terms:  applicants must match every term (AND)
+          any_terms:  applicants must match at least one term (OR)
+          none_terms: applicants must match none of these (NOT)
+          weights:    {term: weight} scored over the filtered applicants
+        """
+        with self.lock:
+            bits = self.all_bits()
+            for term in all_terms or []:
+                bits &= self.term_bits(term)
+            if any_terms:
+                any_bits = 0
+                for term in any_terms:
+                    any_bits |= self.term_bits(term)
+                bits &= any_bits
+            for term in none_terms or []:
+                bits &= ~self.term_bits(term)
+
+            mask = self.to_array(bits)
+            scored_terms = dict(weights or {})
+            for term in list(all_terms or []) + list(any_terms or []):
+                scored_terms.setdefault(term, 1.0)
+
+            scores = np.zeros(len(self.applicants), dtype=np.float32)
+            matched = {}
+            for term, weight in scored_terms.items():
+                hits = self.to_array(self.term_bits(term)) & mask
+                scores += hits * np.float32(weight)
+                matched[term] = hits
+
+            candidates = np.flatnonzero(mask)
+            order = candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
+            return [
+                {
+                    "applicantID": self.applicants[i],
+                    "applicantName": self.names[i],
+                    "score": float(scores[i]),
+                    "matched": [term for term, hits in matched.items() if hits[i]],
+                }
+                for i in order
+            ]
+
+
+# post_id -> (version, SkillIndex). Any process (API replica or worker.py node)
+# may write Skill_Index, so a cached index is reused only while the post's
+# version (document count, latest updated_at) is unchanged.
+_indexes = {}
+_indexes_lock = threading.Lock()
+_indexed = False
+
+
+def ensure_indexes(db):
+    global _indexed
+    if not _indexed:
+        db[INDEX_COLLECTION].create_index([("postId", ASCENDING), ("updated_at", DESCENDING)])
+        _indexed = True
+
+
+def _save(db, post_id, applicant_id, name, terms):
+    db[INDEX_COLLECTION].update_one(
+        {"postId": str(post_id), "applicantId": str(applicant_id)},
+        {"$set": {"name": name, "terms": terms, "updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+
+
+def index_version(db, post_id):
+    """Cheap change marker for a post's persisted index."""
+    query = {"postId": str(post_id)}
+    latest = db[INDEX_COLLECTION].find_one(query, {"updated_at": 1}, sort=[("updated_at", DESCENDING)])
+    return db[INDEX_COLLECTION].count_documents(query), (latest or {}).get("updated_at")
+
+
+def index_applicant(db, post_id, applicant_record):
+    """Persist the applicant's terms for this post; cached indexes pick them up on their next get_index."""
+    user = applicant_record.get("user") or {}
+    terms = applicant_terms(applicant_record)
+    _save(db, post_id, user.get("_id"), user.get("name", ""), terms)
+    return terms
+
+
+def _cache(db, post_id, index):
+    # An empty index is never cached, so applicants stored later are found
+    if len(index):
+        with _indexes_lock:
+            _indexes[str(post_id)] = (index_version(db, post_id), index)
+    return index
+
+
+def rebuild_from_resume_info(db, post_id):
+    """Recompute the persisted index for a post from its Resume_Info records."""
+    index = SkillIndex()
+    for record in db["Resume_Info"].find({"postId": str(post_id)}):
+        user = record.get("user") or {}
+        terms = applicant_terms(record)
+        index.add(user.get("_id"), terms, user.get("name", ""))
+        _save(db, post_id, user.get("_id"), user.get("name", ""), terms)
+    return _cache(db, post_id, index)
+
+
+def get_index(db, post_id):
+    """Index for a post, cached while Skill_Index is unchanged (else reloaded, or rebuilt from Resume_Info)."""
+    ensure_indexes(db)
+    with _indexes_lock:
+        cached = _indexes.get(str(post_id))
+    if cached is not None and cached[0] == index_version(db, post_id):
+        return cached[1]
+
+    index = SkillIndex()
+    for doc in db[INDEX_COLLECTION].find({"postId": str(post_id)}):
+        index.add(doc["applicantId"], doc.get("terms", []), doc.get("name", ""))
+    if not len(index):
+        return rebuild_from_resume_info(db, post_id)
+    return _cache(db, post_id, index)
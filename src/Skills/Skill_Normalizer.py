@@ -0,0 +1,227 @@
+import json
+import os
+import re
+from collections import deque
+
+TAXONOMY_PATH = os.getenv(
+    "SKILL_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json"),
+)
+
+_COMPACT_RE = re.compile(r"[\s._\-]+")
+
+
+def _key(text):
+    """Lowercase and collapse whitespace: used for free-text patterns."""
+    return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+
+def _compactKey(text):
+    """Whitespace/punctuation-insensitive key so ReactJS, React.js and react-js collide."""
+    return _COMPACT_RE.sub("", _key(text))
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over lowercase strings. Matching is O(len(text) +
+    matches) regardless of the number of patterns.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        self.built = False
+
+    def add(self, pattern, value):
+        node = 0
+        for char in pattern:
+            nxt = self.goto[node].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = nxt
+        self.output[node].append((len(pattern), value))
+        self.built = False
+
+    def build(self):
+        queue = deque(self.goto[0].values())
+        for node in queue:
+            self.fail[node] = 0
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[child] = self.goto[state].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+        self.built = True
+
+    def iter(self, text):
+        """Yield (start, end, value) for every pattern occurrence in text."""
+        if not self.built:
+            self.build()
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            for length, value in self.output[node]:
+                yield index - length + 1, index + 1, value
+
+
+def _isBoundary(text, start, end):
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    # "react.js" must not also match "js"
+    return not (before.isalnum() or before == ".") and not (after.isalnum() or after in "+#")
+
+
+class SkillNormalizer:
+    def __init__(self, taxonomy_path=TAXONOMY_PATH):
+        with open(taxonomy_path, encoding="utf-8") as f:
+            taxonomy = json.load(f)
+
+        self.skills = {skill["id"]: skill for skill in taxonomy["skills"]}
+        self.lookup = {}
+        self.matcher = AhoCorasick()
+
+        for skill in taxonomy["skills"]:
+            ambiguous = {_key(alias) for alias in skill.get("ambiguous", [])}
+            for alias in [skill["name"], skill["id"]] + skill.get("aliases", []):
+                self.lookup.setdefault(_key(alias), skill["id"])
+                self.lookup.setdefault(_compactKey(alias), skill["id"])
+                # Short/common words ("go", "node", "excel") only count as exact matches
+                if _key(alias) not in ambiguous and alias != skill["id"]:
+                    self.matcher.add(_key(alias), skill["id"])
+        self.matcher.build()
+
+    def normalize(self, skill):
+        """Map a free-form skill string to its canonical skill ID, or None."""
+        if not isinstance(skill, str) or not skill.strip():
+            return None
+        return self.lookup.get(_key(skill)) or self.lookup.get(_compactKey(skill))
+
+    def normalize_many(self, skills):
+        """Canonical IDs for a list of skill strings; unknown skills are dropped."""
+        ids = []
+        for skill in skills or []:
+            skill_id = self.normalize(skill)
+            if skill_id and skill_id not in ids:
+                ids.append(skill_id)
+        return ids
+
+    def display_name(self, skill_id):
+        skill = self.skills.get(skill_id)
+        return skill["name"] if skill else skill_id
+
+    def find_in_text(self, text):
+        """Canonical IDs of all skills mentioned in free text (README, job description...)."""
+        if not text:
+            return []
+        lowered = _key(text)
+        found = []
+        for start, end, skill_id in self.matcher.iter(lowered):
+            if skill_id not in found and _isBoundary(lowered, start, end):
+                found.append(skill_id)
+        return found
+
+
+_normalizer = None
+
+
+def get_normalizer():
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = SkillNormalizer()
+    return _normalizer
+
+
+def normalize(skill):
+    return get_normalizer().normalize(skill)
+
+
+def normalize_many(skills):
+    return get_normalizer().normalize_many(skills)
+
+
+def find_in_text(text):
+    return get_normalizer().find_in_text(text)
+
+
+def _as_list(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [part for part in re.split(r"[,;|\n]", value) if part.strip()]
+    if isinstance(value, (list, tuple, set)):
+        return [item for item in value if isinstance(item, str)]
+    return []
+
+
+def _payload(source):
+    """Unwrap the {"id", "source", "data"} envelope the scrapers/parsers return."""
+    if isinstance(source, dict) and "source" in source and "data" in source:
+        return source["data"]
+    return source
+
+
+def github_skill_ids(github_data):
+    """Skill IDs from GitHub repo languages, topics and README text."""
+    normalizer = get_normalizer()
+    data = _payload(github_data)
+    repos = []
+    if isinstance(data, list):
+        for part in data:
+            if isinstance(part, list):
+                repos.extend(repo for repo in part if isinstance(repo, dict))
+    ids = []
+    for repo in repos:
+        for value in (repo.get("languages") or []) + (repo.get("topics") or []):
+            skill_id = normalizer.normalize(value)
+            if skill_id and skill_id not in ids:
+                ids.append(skill_id)
+        readme_skills = repo.get("readme_skills") or normalizer.find_in_text(repo.get("readme_content"))
+        for skill_id in readme_skills:
+            if skill_id in normalizer.skills and skill_id not in ids:
+                ids.append(skill_id)
+    return ids
+
+
+def applicant_skill_ids(record):
+    """
+    Canonical skill IDs for an applicant record, merged from registration
+    skills, application skill matches, the parsed resume, LinkedIn and GitHub.
+    """
+    normalizer = get_normalizer()
+    ids = []
+
+    def add(values):
+        for skill_id in values:
+            if skill_id and skill_id not in ids:
+                ids.append(skill_id)
+
+    add(normalizer.normalize_many(_as_list(record.get("skills"))))
+    add(normalizer.normalize_many(_as_list(record.get("skill_matched"))))
+
+    resume = _payload(record.get("resume_info")) or {}
+    if isinstance(resume, dict):
+        add(normalizer.normalize_many(_as_list(resume.get("skills"))))
+        for project in resume.get("projects") or []:
+            if isinstance(project, dict):
+                add(normalizer.normalize_many(_as_list(project.get("tech"))))
+
+    linkedin = _payload(record.get("linkedin_info")) or {}
+    if isinstance(linkedin, dict):
+        add(normalizer.normalize_many(_as_list(linkedin.get("skills"))))
+        for project in linkedin.get("projects") or []:
+            if isinstance(project, dict):
+                add(normalizer.normalize_many(_as_list(project.get("skills"))))
+
+    add(github_skill_ids(record.get("github_data") or record.get("github_info")))
+    return ids
@@ -1,19 +1,40 @@
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+import logging
 from dotenv import dotenv_values
 from pymongo import MongoClient
 from bson.objectid import ObjectId
 from Resume import Resume_Reader
 from Ranking_System import model
+from Ranking_System import embedding_store
+from Ranking_System import github_features
+from Ranking_System import job_checkpoints
+from Ranking_System import task_queue
+from Skills import Skill_Normalizer
+from Skills import Skill_Index
+from Github import Github_Client
+from routes import github_routes
+from routes import metrics_routes
+from Monitoring import logs, metrics, tracing
 import threading
+import contextvars
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import uvicorn
 import requests
 import time
 import asyncio
 from datetime import datetime
 
-GITHUB_SCRAPER_URL = "http://ec2-16-170-253-54.eu-north-1.compute.amazonaws.com:8000/github/scrape"
+# Leveled JSON logs through a background queue sink (LOG_LEVEL, LOG_FORMAT)
+logs.setup()
+logger = logging.getLogger("app")
+
 app = FastAPI()
+# Serves /github/scrape and /github/scrape_batch for remote scraper mode
+app.include_router(github_routes.router, prefix="/github")
+# Prometheus scrape endpoint: /metrics
+app.include_router(metrics_routes.router)
 
 @app.get("/")
 def read_root():
@@ -21,6 +42,7 @@ def read_root():
 
 MAX_WORKERS = 10
 POLLING_INTERVAL = 5  # seconds between database polls
+GITHUB_RESULT_TIMEOUT = 120  # seconds to wait for a prefetched GitHub scrape
 
 # Config
 import os
@@ -28,6 +50,10 @@ config = dotenv_values(os.path.join("src", ".env"))
 
 mongo_uri = config.get("MONGO_URI")
 db_name = config.get("DB_NAME")
+# "local" processes applicants on this process's thread pool; "distributed" queues
+# them in Mongo for worker.py nodes and only coordinates and ranks here
+RANKING_EXECUTION = config.get("RANKING_EXECUTION", "local").lower()
+DISTRIBUTED_TIMEOUT = float(config.get("DISTRIBUTED_TIMEOUT", 0)) or None  # seconds, unset waits indefinitely
 
 # Thread-safe dict
 applicants = {}
@@ -37,20 +63,25 @@ applicants_lock = threading.Lock()
 listener_running = False
 listener_thread = None
 
+# Time Mongo reads/writes from every client created below (and trace them when TRACING_ENABLED)
+metrics.instrument_mongo()
+tracing.instrument_mongo()
+
 # DB Client
 def startup_db_client():
     return MongoClient(mongo_uri)
 
 # Get Job Description
+@tracing.traced("fetch_job_post")
 def fetch_job_post(postID):
-    print(f"🔍 Fetching job post with ID: {postID}")
+    logger.info(f"🔍 Fetching job post with ID: {postID}")
     client = startup_db_client()
     db = client[db_name]
     post = db['posts'].find_one({'_id': ObjectId(postID)})
     if post:
-        print("✅ Job post found.")
+        logger.info("✅ Job post found.")
     else:
-        print("❌ Job post not found.")
+        logger.error("❌ Job post not found.")
     client.close()
     return post
 
@@ -61,7 +92,7 @@ def update_application_status(db, post_id, user_id, status):
         {"$set": {"status": status}}
     )
 
-# Update ranking request status
+# Update ranking request status (only while this worker still holds the lease)
 def update_ranking_request_status(post_id, status, result=None):
     client = startup_db_client()
     db = client[db_name]
@@ -72,20 +103,23 @@ def update_ranking_request_status(post_id, status, result=None):
     if result:
         update_data["result"] = result
     
-    db['ranking_request'].update_one(
-        {"postId": post_id},
+    updated = db['ranking_request'].update_one(
+        {"postId": post_id, "lease_owner": job_checkpoints.WORKER_ID},
         {"$set": update_data}
     )
+    if updated.matched_count == 0:
+        logger.warning(f"⚠️ Lease on post {post_id} is held by another worker, not marking it {status}")
     client.close()
 
 # Get Applications, Users, Registrations
+@tracing.traced("fetch_user_data")
 def fetch_user_data(postID):
-    print("📦 Fetching applications, users, and registrations from DB...")
+    logger.info("📦 Fetching applications, users, and registrations from DB...")
     client = startup_db_client()
     db = client[db_name]
     
     applications = list(db['applications'].find({'postId': ObjectId(postID)}))
-    print(f"📄 Applications found: {len(applications)}")
+    logger.info(f"📄 Applications found: {len(applications)}")
 
     registrations = []
     users = []
@@ -99,29 +133,43 @@ def fetch_user_data(postID):
             if user:
                 users.append(user)
             else:
-                print(f"⚠️ No user found for userId: {uid}")
+                logger.warning(f"⚠️ No user found for userId: {uid}")
 
         if reg_id:
             reg = db['registrations'].find_one({'_id': reg_id})
             if reg:
                 registrations.append(reg)
             else:
-                print(f"⚠️ No registration found for ID: {reg_id}")
+                logger.warning(f"⚠️ No registration found for ID: {reg_id}")
 
-    print(f"👥 Users found: {len(users)}")
-    print(f"📋 Registrations found: {len(registrations)}")
+    logger.info(f"👥 Users found: {len(users)}")
+    logger.info(f"📋 Registrations found: {len(registrations)}")
     client.close()
     return {"applications": applications, "users": users, "registrations": registrations}
 
+def github_url_for(user, reg_info):
+    github_url = None
+    for reg in reg_info:
+        if reg.get("owner") == user["_id"]:
+            github_url = reg.get("github")
+    return github_url
+
 # Process single applicant
+@metrics.timed("applicant")
 def process_single_user(args):
-    user, apps, reg_info, post_id = args
+    user, post_id = args[0], args[3]
+    with logs.bind(job_id=post_id, applicant_id=user["_id"]):
+        tracing.annotate(post_id=str(post_id), applicant_id=str(user["_id"]))
+        _process_single_user(args)
+
+def _process_single_user(args):
+    user, apps, reg_info, post_id, github_future, checkpoint = args
     client = startup_db_client()
     db = client[db_name]
 
     # Set status to Under Review
     update_application_status(db, post_id, user['_id'], "Under Review")
-    print(f"🧑‍💻 Processing applicant: {user.get('name', 'Unknown')} ({user['_id']})")
+    logger.info(f"🧑‍💻 Processing applicant: {user.get('name', 'Unknown')} ({user['_id']})")
     
     resume_url, skills, skill_matched = None, None, None
     about_applicant, cover_letter, work_experience = [], None, None
@@ -151,37 +199,41 @@ def process_single_user(args):
 
     # Resume Parsing
     resume_info = None
-    if resume_url:
-        print(f"📄 Parsing resume for {user['_id']}")
+    if job_checkpoints.reached(checkpoint, "parsed"):
+        resume_info = checkpoint.get("resume_info")
+        logger.info(f"⏩ Resume already parsed for {user['_id']}")
+    elif resume_url:
+        logger.info(f"📄 Parsing resume for {user['_id']}")
         try:
             resume_info = Resume_Reader.parseResume(user['_id'], resume_url, model='llama')
-            print(f"✅ Resume parsed for {user['_id']}")
+            logger.info(f"✅ Resume parsed for {user['_id']}")
+            job_checkpoints.save(db, post_id, user['_id'], "parsed", resume_info=resume_info)
         except Exception as e:
-            print(f"❌ Resume parsing error for {user['_id']}: {e}")
-
-    # GitHub Scraping
-    if github_url:
-        print(f"🌐 Scraping GitHub for {user['_id']} - {github_url}")
+            logger.error(f"❌ Resume parsing error for {user['_id']}: {e}")
+
+    # GitHub Scraping (prefetched in batches while the resume was parsed)
+    if job_checkpoints.reached(checkpoint, "scraped"):
+        github_data = checkpoint.get("github_data")
+        logger.info(f"⏩ GitHub already scraped for {user['_id']}")
+    elif github_url:
+        logger.info(f"🌐 Scraping GitHub for {user['_id']} - {github_url} ({Github_Client.GITHUB_SCRAPER_MODE})")
         try:
-            payload = {
-                "applicant_id": str(user["_id"]),
-                "github_url": github_url
-            }
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(GITHUB_SCRAPER_URL, json=payload, headers=headers, timeout=20)
-
-            if response.ok:
-                github_data = response.json()
-                print(f"✅ GitHub data fetched for {user['_id']}")
-            else:
-                print(f"❌ GitHub scrape failed for {user['_id']} with status {response.status_code}: {response.text}")
-        except requests.exceptions.Timeout:
-            print(f"⏱️ GitHub scraping timed out for {user['_id']}")
+            if github_future is None:
+                github_future = Github_Client.submit(user["_id"], github_url)
+            with tracing.span("github_wait"):
+                github_data = github_future.result(timeout=GITHUB_RESULT_TIMEOUT)
+            logger.info(f"✅ GitHub data fetched for {user['_id']}")
+            job_checkpoints.save(db, post_id, user['_id'], "scraped", github_data=github_data)
+        except FuturesTimeoutError:
+            logger.warning(f"⏱️ GitHub scraping timed out for {user['_id']}")
         except requests.exceptions.RequestException as e:
-            print(f"🚨 GitHub scraping error for {user['_id']}: {e}")
+            logger.warning(f"🚨 GitHub scraping error for {user['_id']}: {e}")
+        except Exception as e:
+            logger.error(f"❌ GitHub scrape failed for {user['_id']}: {e}")
 
     # Prepare final data
     applicant_record = {
+        "postId": str(post_id),
         "user": user,
         "skills": skills,
         "skill_matched": skill_matched,
@@ -191,6 +243,8 @@ def process_single_user(args):
         "resume_info": resume_info,
         "github_data": github_data
     }
+    # Canonical skill IDs for fast set-based matching
+    applicant_record["skill_ids"] = Skill_Normalizer.applicant_skill_ids(applicant_record)
 
     # Save in thread-safe dict
     with applicants_lock:
@@ -199,72 +253,212 @@ def process_single_user(args):
     # Store in MongoDB collection: Resume_Info
     try:
         resume_info_collection = db["Resume_Info"]
-        resume_info_collection.insert_one(applicant_record)
-        print(f"📝 Stored applicant {user['_id']} data into Resume_Info")
+        # Upsert so a resumed job never stores an applicant twice; $set keeps the
+        # stored github_features/github_digest for ensure_features to reuse
+        resume_info_collection.update_one(
+            {"postId": str(post_id), "user._id": user['_id']}, {"$set": applicant_record}, upsert=True
+        )
+        logger.info(f"📝 Stored applicant {user['_id']} data into Resume_Info")
+        Skill_Index.index_applicant(db, post_id, applicant_record)
         update_application_status(db, post_id, user['_id'], "Done")
+        job_checkpoints.save(db, post_id, user['_id'], "stored")
+    except Exception as e:
+        logger.error(f"❌ Failed to store Resume_Info for {user['_id']}: {e}")
+
+    # Embed for similarity search (cached per content hash)
+    try:
+        with metrics.timed("embedding"):
+            embedding_store.embed_applicant(post_id, applicant_record)
     except Exception as e:
-        print(f"❌ Failed to store Resume_Info for {user['_id']}: {e}")
+        logger.warning(f"⚠️ Embedding failed for {user['_id']}: {e}")
 
     client.close()
-    print(f"🏁 Finished processing {user['_id']}")
+    logger.info(f"🏁 Finished processing {user['_id']}")
+
+# Worker-node handler for one queued applicant task (see worker.py)
+def process_applicant_task(task):
+    payload = task["payload"]
+    post_id = task["postId"]
+    # Continue the coordinator's trace on this worker node
+    with tracing.span("applicant_task", parent=tracing.extract(payload), attempt=task.get("attempts")):
+        _process_applicant_task(task, payload, post_id)
+
+def _process_applicant_task(task, payload, post_id):
+    client = startup_db_client()
+    db = client[db_name]
+    try:
+        checkpoint = db[job_checkpoints.CHECKPOINTS].find_one({"postId": post_id, "userId": task["userId"]})
+    finally:
+        client.close()
+
+    process_single_user((payload["user"], payload["applications"], payload["registrations"], post_id, None, checkpoint))
+
+    # process_single_user reports failures by logging; the checkpoint says whether the applicant made it
+    client = startup_db_client()
+    db = client[db_name]
+    try:
+        checkpoint = db[job_checkpoints.CHECKPOINTS].find_one({"postId": post_id, "userId": task["userId"]})
+    finally:
+        client.close()
+    if not job_checkpoints.reached(checkpoint, "stored"):
+        raise RuntimeError("applicant record was not stored")
+
+@tracing.traced("distribute_applicants")
+def distribute_applicants(db, post_id, users, apps, regs, lease):
+    """Queue one task per applicant and wait for the worker nodes; False if the job must stop here."""
+    task_queue.ensure_indexes(db)
+    # A retried job gives applicants dead-lettered by an earlier attempt another chance
+    revived = task_queue.requeue_dead(db, post_id)
+    if revived:
+        logger.info(f"🔁 Requeued {revived} dead-lettered applicant tasks")
+    for u in users:
+        task_queue.enqueue(db, post_id, u["_id"], {
+            "user": u,
+            "applications": [a for a in apps if a.get("userId") == u["_id"]],
+            "registrations": [r for r in regs if r.get("owner") == u["_id"]],
+            "traceparent": tracing.traceparent(),
+        })
+    logger.info(f"📤 Queued {len(users)} applicant tasks for worker nodes")
+
+    totals = task_queue.wait_for_post(db, post_id, lease=lease, timeout=DISTRIBUTED_TIMEOUT)
+    if totals is None:
+        logger.warning("⚠️ Stopped waiting for worker nodes (lease lost or timeout)")
+        return False
+    if totals["dead"]:
+        logger.warning(f"☠️ {totals['dead']} applicant tasks were dead-lettered and are left out of the ranking")
+
+    # Every applicant a worker finished is now in Resume_Info
+    stored_ids = [uid for uid, cp in job_checkpoints.load(db, post_id).items() if job_checkpoints.reached(cp, "stored")]
+    with applicants_lock:
+        for record in db["Resume_Info"].find({"postId": str(post_id), "user._id": {"$in": stored_ids}}):
+            record.pop("_id", None)
+            applicants[record["user"]["_id"]] = record
+    return True
 
 # Process a ranking request
 def process_ranking_request(request_doc):
+    client = startup_db_client()
+    db = client[db_name]
+    job_checkpoints.ensure_indexes(db)
+
+    # Take the lease; another worker may already own this request
+    request_doc = job_checkpoints.claim(db, request_doc["_id"])
+    if request_doc is None:
+        logger.info("⏭️ Ranking request is leased by another worker or gave up")
+        client.close()
+        return
+    lease = job_checkpoints.Lease(db, request_doc["_id"]).start()
+
     try:
         post_id = request_doc.get("postId")
-        print(f"🚀 Processing ranking request for post ID: {post_id}")
-        
-        # Update status to processing
-        update_ranking_request_status(post_id, "processing")
+        logger.info(f"🚀 Processing ranking request for post ID: {post_id} (attempt {request_doc.get('attempts', 1)})")
         
         job_post = fetch_job_post(post_id)
         if not job_post:
-            print(f"❌ Job post not found for ID: {post_id}")
+            logger.error(f"❌ Job post not found for ID: {post_id}")
             update_ranking_request_status(post_id, "failed", {"error": "Job post not found"})
             return
 
+        try:
+            embedding_store.embed_post(job_post)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding failed for job post {post_id}: {e}")
+
         info = fetch_user_data(post_id)
         users = info['users']
         apps = info['applications']
         regs = info['registrations']
 
         if not users or not regs:
-            print("⚠️ No applicants or registration data found.")
+            logger.warning("⚠️ No applicants or registration data found.")
             update_ranking_request_status(post_id, "completed", {"message": "No applicants found"})
             return
 
-        print("🚦 Starting applicant processing...")
+        logger.info("🚦 Starting applicant processing...")
         
         # Clear previous applicants data for this post
         with applicants_lock:
             applicants.clear()
+
+        # Resume from checkpoints: stored applicants are reloaded, the rest skip finished stages
+        checkpoints = job_checkpoints.load(db, post_id)
+        stored_ids = [uid for uid, cp in checkpoints.items() if job_checkpoints.reached(cp, "stored")]
+        if stored_ids:
+            with applicants_lock:
+                for record in db["Resume_Info"].find({"postId": str(post_id), "user._id": {"$in": stored_ids}}):
+                    record.pop("_id", None)
+                    applicants[record["user"]["_id"]] = record
+        with applicants_lock:
+            remaining = [u for u in users if u["_id"] not in applicants]
+        logger.info(f"♻️ {len(users) - len(remaining)} applicants restored from checkpoints, {len(remaining)} to process")
+        lease.renew(stage="applicants", applicants_total=len(users), applicants_restored=len(users) - len(remaining))
         
-        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(users))) as executor:
-            executor.map(process_single_user, [(u, apps, regs, post_id) for u in users])
+        if remaining and RANKING_EXECUTION == "distributed":
+            if not distribute_applicants(db, post_id, remaining, apps, regs, lease):
+                return
+            remaining = []
+
+        # Queue every GitHub profile up front so they are scraped in batches
+        github_futures = {}
+        for u in remaining:
+            github_url = github_url_for(u, regs)
+            if github_url and not job_checkpoints.reached(checkpoints.get(u["_id"]), "scraped"):
+                github_futures[u["_id"]] = Github_Client.submit(u["_id"], github_url)
+
+        if remaining:
+            def run_applicant(context, args):
+                # Once the lease is lost the new owner resumes these applicants from their checkpoints
+                if not lease.lost.is_set():
+                    context.run(process_single_user, args)
+
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(remaining))) as executor:
+                # Each applicant thread keeps the job's log context and trace
+                executor.map(run_applicant, [
+                    contextvars.copy_context() for _ in remaining
+                ], [
+                    (u, apps, regs, post_id, github_futures.get(u["_id"]), checkpoints.get(u["_id"]))
+                    for u in remaining
+                ])
+
+        logger.info("✅ All applicants processed.")
+        if lease.lost.is_set():
+            logger.warning("⚠️ Lease lost while processing applicants; leaving ranking to the new owner")
+            return
+        lease.renew(stage="ranking")
+
+        with applicants_lock:
+            records = list(applicants.values())
 
-        print("✅ All applicants processed.")
+        # GitHub feature vectors for all applicants at once, persisted to Resume_Info
+        try:
+            with tracing.span("github_features", applicants=len(records)):
+                github_features.ensure_features(db, post_id, records)
+        except Exception as e:
+            logger.warning(f"⚠️ GitHub feature computation failed: {e}")
+        features = [data.get("github_features") or {} for data in records]
+        scores = github_features.github_scores(features)
 
         minimal_applicants = []
-        with applicants_lock:
-            for user_id, data in applicants.items():
-                user = data.get("user", {})
-                minimal_applicants.append({
-                    "applicantID": str(user.get("_id")),
-                    "applicantName": user.get("name", ""),
-                    "skills": data.get("skills", []),
-                    "matched_skills": data.get("skill_matched", []),
-                    "about": data.get("about", ""),
-                    "education": data.get("resume_info", {}).get("education", []),
-                    "experience": data.get("resume_info", {}).get("experience", []),
-                    "projects": data.get("resume_info", {}).get("projects", []),
-                })
+        for data, feature, score in zip(records, features, scores):
+            user = data.get("user", {})
+            minimal_applicants.append({
+                "applicantID": str(user.get("_id")),
+                "applicantName": user.get("name", ""),
+                "skills": data.get("skills", []),
+                "matched_skills": data.get("skill_matched", []),
+                "about": data.get("about", ""),
+                "education": (data.get("resume_info") or {}).get("education", []),
+                "experience": (data.get("resume_info") or {}).get("experience", []),
+                "projects": (data.get("resume_info") or {}).get("projects", []),
+                "github": dict(feature, score=score) if feature.get("repos") else None,
+            })
 
         ranked_list = model.get_ranked_list(job_post, minimal_applicants)
         top_10 = ranked_list[:10] if len(ranked_list) >= 10 else ranked_list
 
         try:
             model.store_ranked_applicants(post_id, top_10)
-            print(f"✅ Stored ranked applicants for post {post_id}")
+            logger.info(f"✅ Stored ranked applicants for post {post_id}")
             
             # Update request status to completed
             result = {
@@ -274,19 +468,24 @@ def process_ranking_request(request_doc):
                 "ranking_completed_at": datetime.utcnow().isoformat()
             }
             update_ranking_request_status(post_id, "completed", result)
+            job_checkpoints.clear(db, post_id)
+            task_queue.clear(db, post_id)
             
         except Exception as e:
-            print(f"❌ Failed to store ranked applicants: {e}")
+            logger.error(f"❌ Failed to store ranked applicants: {e}")
             update_ranking_request_status(post_id, "failed", {"error": str(e)})
 
     except Exception as e:
-        print(f"❌ Error processing ranking request: {e}")
+        logger.exception(f"❌ Error processing ranking request: {e}")
         if 'post_id' in locals():
             update_ranking_request_status(post_id, "failed", {"error": str(e)})
+    finally:
+        lease.release()
+        client.close()
 
 # Continuous listener function
 def ranking_request_listener():
-    print("🎧 Starting ranking request listener...")
+    logger.info("🎧 Starting ranking request listener...")
     global listener_running
     listener_running = True
     
@@ -296,31 +495,35 @@ def ranking_request_listener():
             db = client[db_name]
             
             # Find pending ranking requests
-            pending_requests = list(db['ranking_request'].find({
-                "status": {"$in": ["pending", None]}
-            }).sort("created_at", 1))  # Process oldest first
+            # Pending requests, plus interrupted ones whose lease expired (resumed from checkpoints)
+            pending_requests = list(db['ranking_request'].find(
+                job_checkpoints.claimable_filter()
+            ).sort("created_at", 1))  # Process oldest first
+            metrics.QUEUE_DEPTH.labels("ranking_requests").set(len(pending_requests))
             
             if pending_requests:
-                print(f"📋 Found {len(pending_requests)} pending ranking requests")
+                logger.info(f"📋 Found {len(pending_requests)} pending ranking requests")
                 
                 for request_doc in pending_requests:
                     if not listener_running:  # Check if we should stop
                         break
                     
-                    print(f"📝 Processing request: {request_doc.get('_id')}")
-                    process_ranking_request(request_doc)
+                    logger.info(f"📝 Processing request: {request_doc.get('_id')}")
+                    with logs.bind(job_id=request_doc.get("postId")), \
+                            tracing.span("ranking_request", post_id=request_doc.get("postId")):
+                        process_ranking_request(request_doc)
                     
             else:
-                print("💤 No pending requests found, waiting...")
+                logger.debug("💤 No pending requests found, waiting...")
             
             client.close()
             time.sleep(POLLING_INTERVAL)
             
         except Exception as e:
-            print(f"❌ Error in ranking request listener: {e}")
+            logger.error(f"❌ Error in ranking request listener: {e}")
             time.sleep(POLLING_INTERVAL)  # Wait before retrying
     
-    print("🛑 Ranking request listener stopped")
+    logger.info("🛑 Ranking request listener stopped")
 
 # API endpoints for manual control (optional)
 @app.post("/start_listener")
@@ -351,6 +554,59 @@ async def get_listener_status():
         "polling_interval": POLLING_INTERVAL
     }
 
+# Skill search over a post's applicants, served from the inverted index
+@app.post("/posts/{post_id}/search")
+async def search_applicants(post_id: str, request: Request):
+    try:
+        data = await request.json()
+        client = startup_db_client()
+        db = client[db_name]
+        index = Skill_Index.get_index(db, post_id)
+
+        limit = int(data.get("limit", 50))
+        github_min = data.get("github_min")
+
+        start = time.perf_counter()
+        results = index.search(
+            all_terms=data.get("all"),
+            any_terms=data.get("any"),
+            none_terms=data.get("none"),
+            weights=data.get("weights"),
+            limit=len(index) if github_min else limit,
+        )
+        if github_min:
+            # e.g. {"stars": 10, "merged_prs": 5}: filter on the persisted GitHub features
+            stored = {
+                str(doc["user"]["_id"]): doc.get("github_features")
+                for doc in db["Resume_Info"].find(
+                    {"postId": post_id}, {"user._id": 1, "github_features": 1}
+                )
+            }
+            results = [r for r in results if github_features.passes(stored.get(r["applicantID"]), github_min)][:limit]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        client.close()
+
+        return {
+            "postId": post_id,
+            "indexed_applicants": len(index),
+            "matches": results,
+            "took_ms": round(elapsed_ms, 3)
+        }
+    except Exception as e:
+        logger.error(f"❌ Error searching applicants for post {post_id}: {e}")
+        return {"error": "Internal server error"}, 500
+
+# Embedding-based pre-scoring, no LLM call (searches lock files and scan memmaps, so off the event loop)
+@app.get("/posts/{post_id}/top_applicants")
+async def top_applicants(post_id: str, k: int = 10):
+    applicants = await run_in_threadpool(embedding_store.top_applicants_for_post, post_id, k)
+    return {"postId": post_id, "applicants": applicants}
+
+@app.get("/applicants/{applicant_id}/similar")
+async def similar_applicants(applicant_id: str, k: int = 10):
+    similar = await run_in_threadpool(embedding_store.similar_applicants, applicant_id, k)
+    return {"applicantID": applicant_id, "similar": similar}
+
 # Legacy endpoint (keeping for backward compatibility)
 @app.post("/process_post")
 async def process_post(request: Request):
@@ -389,7 +645,7 @@ async def process_post(request: Request):
         }
         
     except Exception as e:
-        print(f"❌ Error creating ranking request: {e}")
+        logger.error(f"❌ Error creating ranking request: {e}")
         return {"error": "Internal server error"}, 500
 
 @app.on_event("startup")
@@ -398,8 +654,8 @@ async def startup_event():
     global listener_thread
     listener_thread = threading.Thread(target=ranking_request_listener, daemon=True)
     listener_thread.start()
-    print("🚀 Ranking request listener started automatically")
+    logger.info("🚀 Ranking request listener started automatically")
 
 if __name__ == "__main__":
-    print("🚀 Starting local API server on http://localhost:8000")
+    logger.info("🚀 Starting local API server on http://localhost:8000")
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
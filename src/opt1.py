@@ -1,16 +1,27 @@
 from dotenv import dotenv_values
 from pymongo import MongoClient
-from LinkedIn import LinkedIn_Scraper
+from LinkedIn import Session_Pool
 from Github import Github_Scraper
 from Resume import Resume_Reader
 from Ranking_System import model
+from Skills import Skill_Normalizer
 from bson.objectid import ObjectId
 import threading, time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 config = dotenv_values(".env")
 
 MAX_WORKERS = int(config.get("MAX_WORKERS", 10))
+LINKEDIN_POOL_SIZE = int(config.get("LINKEDIN_POOL_SIZE", Session_Pool.POOL_SIZE))
+
+# Seconds each source may take per applicant, and for the whole job; sources
+# still running at their deadline are flagged and merged in when they finish
+SOURCE_DEADLINES = {
+    "linkedin": float(config.get("LINKEDIN_DEADLINE", 120)),
+    "github": float(config.get("GITHUB_DEADLINE", 60)),
+    "resume": float(config.get("RESUME_DEADLINE", 180)),
+}
+JOB_DEADLINE = float(config.get("JOB_DEADLINE", 300))
 
 applicants_lock = threading.Lock()
 applicants = {}
@@ -89,7 +100,7 @@ def fetch_user_data(postID):
     }
 
 def process_single_user(args):
-    user, apps, reg_info = args
+    user, apps, reg_info, job_deadline, on_late_result = args
 
     resume_url = None
     linkedin_url = None
@@ -126,58 +137,46 @@ def process_single_user(args):
                 cover_letter = app.get('coverLetter')
                 work_experience = app.get('workExperience')
 
-    LINKEDIN_INDEX = 0
-    GITHUB_INDEX = 1
-    RESUME_INDEX = 2
-    threads = [None] * 3
-    results = [None] * 3
-
-    def run_linkedin():
-        if linkedin_url:
-            print(f"[{user['_id']}] Scraping LinkedIn")
-            try:
-                results[LINKEDIN_INDEX] = LinkedIn_Scraper.scrape_linkedin_profile(
-                    user['_id'], linkedin_url, config['LINKEDIN_EMAIL'], config['LINKEDIN_PASSWORD']
-                )   
-            except Exception as e:
-                print(f"LinkedIn scraping error for {user['id']}: {e}")
-
-    def run_github():
-        if github_url:
-            print(f"[{user['_id']}] Scraping GitHub")
-            try:
-                results[GITHUB_INDEX] = Github_Scraper.scrape_github_profile(
-                    user['_id'], github_url
-                )
-            except Exception as e:
-                print(f"Github scraping error for {user['id']}: {e}")
-
-
-    def run_resume():
-        if resume_url:
-            print(f"[{user['_id']}] Parsing Resume")
-            try:
-                results[RESUME_INDEX] = Resume_Reader.parseResume(
-                    user['_id'], resume_url, model='llama'
-                )
-            except Exception as e:
-                print(f"[{user['_id']}] Scraping GitHub")
-            
-
-    threads[0] = threading.Thread(target=run_linkedin)
-    threads[1] = threading.Thread(target=run_github)
-    threads[2] = threading.Thread(target=run_resume)
-
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-
-    linkedIn_info = results[LINKEDIN_INDEX]
-    github_info = results[GITHUB_INDEX]
-    resume_info = results[RESUME_INDEX]
+    user_id = user['_id']
+    sources = {}
+    if linkedin_url:
+        sources["linkedin"] = (
+            Session_Pool.scrape_linkedin_profile,
+            (user_id, linkedin_url, config.get('LINKEDIN_EMAIL'), config.get('LINKEDIN_PASSWORD')),
+            {"pool_size": LINKEDIN_POOL_SIZE},
+        )
+    if github_url:
+        sources["github"] = (Github_Scraper.scrape_github_profile, (user_id, github_url), {})
+    if resume_url:
+        sources["resume"] = (Resume_Reader.parseResume, (user_id, resume_url), {"model": 'llama'})
+
+    calls = {}
+    missing_sources = {}
+    if time.monotonic() >= job_deadline:
+        # Queued behind MAX_WORKERS until after the job deadline: launching now
+        # would only start calls that are abandoned straight away
+        print(f"[{user_id}] Job deadline passed before start, skipping {list(sources)}")
+        missing_sources = {source: "skipped" for source in sources}
+    else:
+        labels = {"linkedin": "Scraping LinkedIn", "github": "Scraping GitHub", "resume": "Parsing Resume"}
+        for source, (fn, args, kwargs) in sources.items():
+            print(f"[{user_id}] {labels[source]}")
+            calls[source] = run_in_background(fn, *args, **kwargs)
+
+    results = {}
+    started = time.monotonic()
+    for source, future in calls.items():
+        deadline = min(started + SOURCE_DEADLINES[source], job_deadline)
+        try:
+            results[source] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FuturesTimeoutError:
+            print(f"[{user_id}] {source} missed its deadline, continuing without it")
+            missing_sources[source] = "timeout"
+        except Exception as e:
+            print(f"{source} error for {user_id}: {e}")
+            missing_sources[source] = "error"
 
-    print(f"Finished {user['_id']}")
+    print(f"Finished {user_id}")
 
     applicant_data = {
         "user": user,
@@ -186,15 +185,79 @@ def process_single_user(args):
         "about": [item for item in about_applicant if item],  
         "cover_letter": cover_letter,
         "work_experience": work_experience,
-        "linkedin_info": linkedIn_info,
-        "github_info": github_info,
-        "resume_info": resume_info
+        "linkedin_info": results.get("linkedin"),
+        "github_info": results.get("github"),
+        "resume_info": results.get("resume"),
+        "missing_sources": missing_sources
     }
+    applicant_data["skill_ids"] = Skill_Normalizer.applicant_skill_ids(applicant_data)
+
+    with applicants_lock:
+        applicants[user_id] = applicant_data
+
+    for source, reason in missing_sources.items():
+        if reason == "timeout":
+            calls[source].add_done_callback(
+                lambda future, source=source: merge_late_result(user_id, source, future, on_late_result)
+            )
+
+def run_in_background(fn, *args, **kwargs):
+    """Future for fn(*args) on a daemon thread, so a hung call can be abandoned at its deadline"""
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+def merge_late_result(user_id, source, future, on_late_result=None):
+    """
+    Fold a source that finished after its deadline into the applicant's record,
+    then hand the updated record (a copy) to on_late_result(user_id, source, record)
+    """
+    try:
+        result = future.result()
+    except Exception as e:
+        print(f"Late {source} error for {user_id}: {e}")
+        with applicants_lock:
+            if user_id in applicants:
+                applicants[user_id]["missing_sources"][source] = "error"
+        return
 
     with applicants_lock:
-        applicants[user['_id']] = applicant_data
+        applicant_data = applicants.get(user_id)
+        if applicant_data is None:
+            return
+        applicant_data[f"{source}_info"] = result
+        applicant_data["missing_sources"].pop(source, None)
+        applicant_data["skill_ids"] = Skill_Normalizer.applicant_skill_ids(applicant_data)
+        record = dict(applicant_data, missing_sources=dict(applicant_data["missing_sources"]))
+    print(f"[{user_id}] Late {source} result merged")
+    if on_late_result is not None:
+        try:
+            on_late_result(user_id, source, record)
+        except Exception as e:
+            print(f"on_late_result failed for {user_id}: {e}")
 
-def process_user_info(postID):
+def get_applicants():
+    """Current applicant records, including sources merged in after their deadline"""
+    with applicants_lock:
+        return {user_id: dict(data, missing_sources=dict(data["missing_sources"]))
+                for user_id, data in applicants.items()}
+
+def process_user_info(postID, on_late_result=None):
+    """
+    Applicant records for a post as of the job deadline. Sources that miss it
+    are merged into the module's records when they finish, which the returned
+    snapshot does not see: pass on_late_result(user_id, source, record) to
+    forward them (e.g. to store or re-rank), or poll get_applicants().
+    """
     print('Getting applicants list')
     info_dict = fetch_user_data(postID)
     if not info_dict:
@@ -212,15 +275,16 @@ def process_user_info(postID):
     print('Processing info in parallel...')
 
     num_threads = min(MAX_WORKERS, len(users))
+    job_deadline = time.monotonic() + JOB_DEADLINE
     
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        user_ids = list(executor.map(
+        # Consumed only to surface exceptions; results land in `applicants`
+        list(executor.map(
             process_single_user,
-            [(u, apps, reg_info) for u in users]
+            [(u, apps, reg_info, job_deadline, on_late_result) for u in users]
         ))
 
-    with applicants_lock:
-        return dict(applicants)
+    return get_applicants()
 
 if __name__ == "__main__":
     # start_time = time.time()
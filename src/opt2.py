@@ -1,26 +1,29 @@
 from dotenv import dotenv_values
 from pymongo import MongoClient
-from LinkedIn import LinkedIn_Scraper
+from LinkedIn import Session_Pool
 from Github import Github_Scraper
 from Resume import Resume_Reader
+from Skills import Skill_Normalizer
 from bson import ObjectId
-import os, threading
+import os, threading, uuid
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
-from queue import Queue, Empty
+from queue import Queue
 import time
 
 config = dotenv_values(".env")
 
 MAX_WORKERS = int(config.get("MAX_WORKERS", 10))
 SCRAPER_TIMEOUT = int(config.get("SCRAPER_TIMEOUT", 30))
-QUEUE_TIMEOUT = int(config.get("QUEUE_TIMEOUT", 5))
+LINKEDIN_POOL_SIZE = int(config.get("LINKEDIN_POOL_SIZE", Session_Pool.POOL_SIZE))
+# Producers block once a source has this many tasks waiting
+QUEUE_MAXSIZE = int(config.get("QUEUE_MAXSIZE", 1000))
+# Finished jobs kept for get_job_result/get_processing_status
+JOB_HISTORY = int(config.get("JOB_HISTORY", 50))
+# Task latencies kept per source for the status percentiles
+LATENCY_WINDOW = int(config.get("LATENCY_WINDOW", 1000))
 
-linkedin_queue = Queue()
-github_queue = Queue()
-resume_queue = Queue()
-
-applicants_lock = threading.Lock()
-applicants = {}
+SOURCES = ("linkedin", "github", "resume")
 
 def startup_db_client():
     try:
@@ -82,8 +85,213 @@ def fetch_user_data(postID):
     finally:
         client.close()
 
+def scrape_linkedin(task):
+    return Session_Pool.scrape_linkedin_profile(
+        task['id'], task['url'], task['email'], task['password'], pool_size=LINKEDIN_POOL_SIZE
+    )
+
+def scrape_github(task):
+    return Github_Scraper.scrape_github_profile(task['id'], task['url'])
+
+def parse_resume(task):
+    return Resume_Reader.parseResume(task['id'], task['url'], model='llama')
+
+SCRAPERS = {
+    "linkedin": scrape_linkedin,
+    "github": scrape_github,
+    "resume": parse_resume,
+}
+
+def source_concurrency():
+    return {
+        # More LinkedIn workers than pooled browsers would only wait on checkout
+        "linkedin": min(int(config.get("LINKEDIN_WORKERS", 3)), LINKEDIN_POOL_SIZE),
+        "github": int(config.get("GITHUB_WORKERS", 3)),
+        "resume": int(config.get("RESUME_WORKERS", 3)),
+    }
+
+def percentiles(values, points=(50, 95, 99)):
+    if not values:
+        return {f"p{p}": None for p in points}
+    ordered = sorted(values)
+    return {f"p{p}": round(ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))], 3) for p in points}
+
+class Job:
+    """One process_user_info run: its applicants and per-source task progress."""
+
+    def __init__(self, post_id):
+        self.id = uuid.uuid4().hex
+        self.post_id = str(post_id)
+        self.applicants = {}
+        self.progress = {source: {"queued": 0, "done": 0, "failed": 0} for source in SOURCES}
+        self.latencies = []
+        self.created_at = time.time()
+        self.finished_at = None
+        self.sealed = False
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def _check_done(self):
+        outstanding = sum(p["queued"] - p["done"] - p["failed"] for p in self.progress.values())
+        if self.sealed and outstanding == 0 and not self.done.is_set():
+            self.finished_at = time.time()
+            self.done.set()
+
+    def add_applicant(self, user_id, applicant_data):
+        with self.lock:
+            self.applicants[user_id] = applicant_data
+
+    def task_queued(self, source):
+        with self.lock:
+            self.progress[source]["queued"] += 1
+
+    def task_finished(self, source, user_id, result, seconds, failed=False):
+        with self.lock:
+            self.progress[source]["failed" if failed else "done"] += 1
+            self.latencies.append(seconds)
+            if not failed and user_id in self.applicants:
+                self.applicants[user_id][f"{source}_info"] = result
+            self._check_done()
+
+    def seal(self):
+        """No more tasks will be queued; the job is done once the queued ones finish."""
+        with self.lock:
+            self.sealed = True
+            self._check_done()
+
+    def status(self):
+        with self.lock:
+            finished = sum(p["done"] + p["failed"] for p in self.progress.values())
+            queued = sum(p["queued"] for p in self.progress.values())
+            elapsed = (self.finished_at or time.time()) - self.created_at
+            return {
+                "job_id": self.id,
+                "post_id": self.post_id,
+                "state": "done" if self.done.is_set() else "running",
+                "applicants": len(self.applicants),
+                "tasks_total": queued,
+                "tasks_finished": finished,
+                "percent": round(100 * finished / queued, 1) if queued else (100.0 if self.sealed else 0.0),
+                "sources": {source: dict(p) for source, p in self.progress.items()},
+                "elapsed_seconds": round(elapsed, 3),
+                "tasks_per_second": round(finished / elapsed, 3) if elapsed > 0 else 0.0,
+                "latency_seconds": percentiles(self.latencies),
+            }
+
+_STOP = object()
+
+class WorkerService:
+    """
+    Long-lived per-source worker threads fed by bounded queues. Workers block
+    on their queue until a task or the shutdown sentinel arrives, so tasks
+    queued at any time are processed; each task reports back to its Job.
+    """
+
+    def __init__(self, concurrency=None, maxsize=QUEUE_MAXSIZE):
+        self.concurrency = concurrency or source_concurrency()
+        self.queues = {source: Queue(maxsize=maxsize) for source in SOURCES}
+        self.threads = {source: [] for source in SOURCES}
+        self.latencies = {source: deque(maxlen=LATENCY_WINDOW) for source in SOURCES}
+        self.completed = {source: 0 for source in SOURCES}
+        self.failed = {source: 0 for source in SOURCES}
+        self.started_at = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.started_at is not None:
+                return
+            self.started_at = time.time()
+            for source in SOURCES:
+                for i in range(max(1, self.concurrency[source])):
+                    thread = threading.Thread(
+                        target=self._work, args=(source,), name=f"{source.title()}Worker-{i}", daemon=True
+                    )
+                    thread.start()
+                    self.threads[source].append(thread)
+
+    def submit(self, job, source, task):
+        job.task_queued(source)
+        self.queues[source].put((job, task))
+
+    def _work(self, source):
+        queue = self.queues[source]
+        scraper = SCRAPERS[source]
+        while True:
+            item = queue.get()
+            try:
+                if item is _STOP:
+                    return
+                job, task = item
+                user_id = task['id']
+                print(f"[{user_id}] {source} started")
+                started = time.perf_counter()
+                result, failed = None, False
+                try:
+                    result = scraper(task)
+                    print(f"[{user_id}] {source} completed")
+                except Exception as e:
+                    failed = True
+                    print(f"{source} error for {user_id}: {e}")
+                seconds = time.perf_counter() - started
+                with self.lock:
+                    self.latencies[source].append(seconds)
+                    if failed:
+                        self.failed[source] += 1
+                    else:
+                        self.completed[source] += 1
+                job.task_finished(source, user_id, result, seconds, failed)
+            finally:
+                queue.task_done()
+
+    def shutdown(self, wait=True):
+        """Let queued tasks finish, then stop every worker with a sentinel."""
+        with self.lock:
+            if self.started_at is None:
+                return
+            for source, threads in self.threads.items():
+                for _ in threads:
+                    self.queues[source].put(_STOP)
+        if wait:
+            for threads in self.threads.values():
+                for thread in threads:
+                    thread.join()
+        with self.lock:
+            self.threads = {source: [] for source in SOURCES}
+            self.started_at = None
+
+    def status(self):
+        with self.lock:
+            uptime = time.time() - self.started_at if self.started_at else 0.0
+            return {
+                "running": self.started_at is not None,
+                "uptime_seconds": round(uptime, 3),
+                "sources": {
+                    source: {
+                        "workers": sum(thread.is_alive() for thread in self.threads[source]),
+                        "queue_size": self.queues[source].qsize(),
+                        "completed": self.completed[source],
+                        "failed": self.failed[source],
+                        "tasks_per_second": round(self.completed[source] / uptime, 3) if uptime else 0.0,
+                        "latency_seconds": percentiles(list(self.latencies[source])),
+                    }
+                    for source in SOURCES
+                },
+            }
+
+service = WorkerService()
+jobs = OrderedDict()
+jobs_lock = threading.Lock()
+
+def register_job(job):
+    with jobs_lock:
+        jobs[job.id] = job
+        finished = [job_id for job_id, j in jobs.items() if j.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - JOB_HISTORY)]:
+            del jobs[job_id]
+
 def process_single_user(args):
-    user, apps, reg_info = args
+    job, user, apps, reg_info = args
 
     resume_url = None
     linkedin_url = None
@@ -121,20 +329,6 @@ def process_single_user(args):
                 work_experience = app.get('workExperience')
 
     user_id = user['_id']
-    
-    if linkedin_url:
-        linkedin_queue.put({
-            'id': user_id, 
-            'url': linkedin_url,
-            'email': config.get('LINKEDIN_EMAIL'),
-            'password': config.get('LINKEDIN_PASSWORD')
-        })
-    
-    if github_url:
-        github_queue.put({'id': user_id, 'url': github_url})
-    
-    if resume_url:
-        resume_queue.put({'id': user_id, 'url': resume_url})
 
     applicant_data = {
         "user": user,
@@ -148,143 +342,33 @@ def process_single_user(args):
         "resume_info": None
     }
 
-    with applicants_lock:
-        applicants[user_id] = applicant_data
-
-    print(f"Finished processing user data for {user_id}")
-    return user_id
+    # Registered before queueing so a fast worker always finds the applicant
+    job.add_applicant(user_id, applicant_data)
 
-def linkedin_worker():
-    while True:
-        try:
-            task = linkedin_queue.get(timeout=QUEUE_TIMEOUT)
-            user_id = task['id']
-            
-            print(f"[{user_id}] Scraping LinkedIn")
-            try:
-                result = LinkedIn_Scraper.scrape_linkedin_profile(
-                    user_id, task['url'], task['email'], task['password']
-                )
-                
-                with applicants_lock:
-                    if user_id in applicants:
-                        applicants[user_id]['linkedin_info'] = result
-                        print(f"[{user_id}] LinkedIn scraping completed")
-                    
-            except Exception as e:
-                print(f"LinkedIn scraping error for {user_id}: {e}")
-            finally:
-                linkedin_queue.task_done()
-                
-        except Empty:
-            print("LinkedIn worker: No more tasks, exiting")
-            break
-        except Exception as e:
-            print(f"LinkedIn worker error: {e}")
-
-def github_worker():
-    while True:
-        try:
-            task = github_queue.get(timeout=QUEUE_TIMEOUT)
-            user_id = task['id']
-            
-            print(f"[{user_id}] Scraping GitHub")
-            try:
-                result = Github_Scraper.scrape_github_profile(user_id, task['url'])
-                
-                with applicants_lock:
-                    if user_id in applicants:
-                        applicants[user_id]['github_info'] = result
-                        print(f"[{user_id}] GitHub scraping completed")
-                        
-            except Exception as e:
-                print(f"GitHub scraping error for {user_id}: {e}")
-            finally:
-                github_queue.task_done()
-                
-        except Empty:
-            print("GitHub worker: No more tasks, exiting")
-            break
-        except Exception as e:
-            print(f"GitHub worker error: {e}")
-
-def resume_worker():
-    while True:
-        try:
-            task = resume_queue.get(timeout=QUEUE_TIMEOUT)
-            user_id = task['id']
-            
-            print(f"[{user_id}] Parsing Resume")
-            try:
-                result = Resume_Reader.parseResume(user_id, task['url'], model='llama')
-                
-                with applicants_lock:
-                    if user_id in applicants:
-                        applicants[user_id]['resume_info'] = result
-                        print(f"[{user_id}] Resume parsing completed")
-                        
-            except Exception as e:
-                print(f"Resume parsing error for {user_id}: {e}")
-            finally:
-                resume_queue.task_done()
-                
-        except Empty:
-            print("Resume worker: No more tasks, exiting")
-            break
-        except Exception as e:
-            print(f"Resume worker error: {e}")
-
-def start_scraper_workers():
-    workers = []
-    
-    linkedin_workers = int(config.get("LINKEDIN_WORKERS", 3))
-    github_workers = int(config.get("GITHUB_WORKERS", 3))
-    resume_workers = int(config.get("RESUME_WORKERS", 3))
-    
-    for i in range(linkedin_workers):
-        worker_thread = threading.Thread(target=linkedin_worker, name=f"LinkedInWorker-{i}")
-        worker_thread.daemon = True
-        worker_thread.start()
-        workers.append(worker_thread)
-    
-    for i in range(github_workers):
-        worker_thread = threading.Thread(target=github_worker, name=f"GitHubWorker-{i}")
-        worker_thread.daemon = True
-        worker_thread.start()
-        workers.append(worker_thread)
+    if linkedin_url:
+        service.submit(job, "linkedin", {
+            'id': user_id, 
+            'url': linkedin_url,
+            'email': config.get('LINKEDIN_EMAIL'),
+            'password': config.get('LINKEDIN_PASSWORD')
+        })
     
-    for i in range(resume_workers):
-        worker_thread = threading.Thread(target=resume_worker, name=f"ResumeWorker-{i}")
-        worker_thread.daemon = True
-        worker_thread.start()
-        workers.append(worker_thread)
+    if github_url:
+        service.submit(job, "github", {'id': user_id, 'url': github_url})
     
-    return workers
+    if resume_url:
+        service.submit(job, "resume", {'id': user_id, 'url': resume_url})
 
-def wait_for_scrapers_completion():
-    print("Waiting for LinkedIn scraping to complete...")
-    linkedin_queue.join()
-    print("LinkedIn scraping completed")
-    
-    print("Waiting for GitHub scraping to complete...")
-    github_queue.join()
-    print("GitHub scraping completed")
-    
-    print("Waiting for Resume parsing to complete...")
-    resume_queue.join()
-    print("Resume parsing completed")
+    print(f"Finished processing user data for {user_id}")
+    return user_id
 
-def process_user_info(postID):
-    global applicants
-    
-    with applicants_lock:
-        applicants.clear()
-    
+def start_job(postID):
+    """Queue every applicant of a post on the worker service; returns the job ID without waiting."""
     print('Getting applicants list...')
     info_dict = fetch_user_data(postID)
     if not info_dict:
         print("Failed to fetch user data")
-        return {}
+        return None
     
     users = info_dict['users']
     apps = info_dict['applications']
@@ -292,38 +376,59 @@ def process_user_info(postID):
     
     if not users:
         print("No users found for the given post ID")
-        return {}
+        return None
     
     print(f'Processing {len(users)} users in parallel...')
     
-    workers = start_scraper_workers()
+    service.start()
+    job = Job(postID)
+    register_job(job)
     
     num_threads = min(MAX_WORKERS, len(users))
     
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        user_ids = list(executor.map(
-            process_single_user,
-            [(u, apps, reg_info) for u in users]
-        ))
-    
-    print("User data processing completed. Waiting for external scraping...")
-    
-    wait_for_scrapers_completion()
+    try:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(
+                process_single_user,
+                [(job, u, apps, reg_info) for u in users]
+            ))
+    finally:
+        # Seal even if an applicant failed, so get_job_result does not wait for sources never queued
+        job.seal()
+    print("User data processing completed. External scraping continues on the worker service.")
+    return job.id
+
+def get_job_result(job_id, timeout=None):
+    """Applicants of a job once every source has reported back (None if unknown or still running)."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+    if job is None or not job.done.wait(timeout):
+        return None
     
-    time.sleep(1)
+    with job.lock:
+        # Canonical skill IDs once every source has reported back
+        for applicant_data in job.applicants.values():
+            if "skill_ids" not in applicant_data:
+                applicant_data["skill_ids"] = Skill_Normalizer.applicant_skill_ids(applicant_data)
+        return dict(job.applicants)
+
+def process_user_info(postID):
+    job_id = start_job(postID)
+    if job_id is None:
+        return {}
     
+    print("Waiting for external scraping...")
+    results = get_job_result(job_id)
     print("All processing completed!")
-    
-    with applicants_lock:
-        return dict(applicants)
+    return results
 
-def get_processing_status():
-    """Get current processing status"""
+def get_processing_status(job_id=None):
+    """Worker service status plus per-job progress (one job, or every tracked job)"""
+    with jobs_lock:
+        tracked = [jobs[job_id]] if job_id in jobs else ([] if job_id else list(jobs.values()))
     return {
-        "linkedin_queue_size": linkedin_queue.qsize(),
-        "github_queue_size": github_queue.qsize(),
-        "resume_queue_size": resume_queue.qsize(),
-        "total_applicants": len(applicants)
+        "service": service.status(),
+        "jobs": [job.status() for job in tracked],
     }
 
 if __name__ == "__main__":
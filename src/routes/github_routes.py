@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Body, Request
+from fastapi.concurrency import run_in_threadpool
+
+from Github import Github_Scraper
+from Monitoring import tracing
+
+router = APIRouter()
+
+
+@router.post("/scrape", response_description="Scrape one GitHub profile")
+async def scrape(request: Request, payload: dict = Body(...)):
+    # Joins the caller's trace when it sent a traceparent header
+    with tracing.span("github_remote_scrape", parent=tracing.extract(request.headers), size=1):
+        results = await run_in_threadpool(
+            Github_Scraper.scrape_github_profiles, [(payload["applicant_id"], payload["github_url"])]
+        )
+    return results[0]
+
+
+@router.post("/scrape_batch", response_description="Scrape several GitHub profiles in one request")
+async def scrape_batch(request: Request, payload: dict = Body(...)):
+    applicants = [(item["applicant_id"], item["github_url"]) for item in payload.get("applicants", [])]
+    with tracing.span("github_remote_scrape", parent=tracing.extract(request.headers), size=len(applicants)):
+        results = await run_in_threadpool(Github_Scraper.scrape_github_profiles, applicants)
+    return {"results": results}
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from Monitoring import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_description="Stage latencies, Mongo latencies and queue depths in Prometheus text format")
+def get_metrics():
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from Ranking_System import embedding_store
+
+
+def _store(tmp_path, monkeypatch, dim=16):
+    store = embedding_store.EmbeddingStore(directory=str(tmp_path))
+
+    def embed(text):
+        rng = np.random.default_rng(int(embedding_store.content_hash(text)[:8], 16))
+        vector = rng.standard_normal(dim).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    monkeypatch.setattr(store, "_embed", embed)
+    return store
+
+
+def test_rows_added_after_ivf_build_are_searchable(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_store, "IVF_MIN_ROWS", 100)
+    monkeypatch.setattr(embedding_store, "IVF_NPROBE", 1)
+    store = _store(tmp_path, monkeypatch)
+
+    for i in range(400):
+        store.put(f"applicant:{i}", f"resume {i}")
+    store.search(store.vector("applicant:0"), k=1)
+    index = store.ivf
+    assert index is not None and index.size == 400 and index.nlist == 20
+    # One probed list out of twenty: the search really is approximate
+    assert len(index.candidates(store.vector("applicant:0"))) < index.size // 4
+    for i in range(0, 400, 7):
+        key = f"applicant:{i}"
+        assert store.search(store.vector(key), k=1)[0]["key"] == key
+
+    for i in range(400, 500):
+        store.put(f"applicant:{i}", f"resume {i}")
+    for i in range(400, 500):
+        key = f"applicant:{i}"
+        assert store.search(store.vector(key), k=1)[0]["key"] == key
+    assert store.ivf is index
+
+
+def test_processes_sharing_a_directory_see_each_others_rows(tmp_path, monkeypatch):
+    first = _store(tmp_path, monkeypatch)
+    second = _store(tmp_path, monkeypatch)
+
+    first.put("applicant:a", "resume a", post_id="p1")
+    second.put("applicant:b", "resume b", post_id="p1")
+    first.put("applicant:c", "resume c", post_id="p1")
+
+    assert sorted(first.keys.values()) == [0, 1, 2]
+    assert second.vector("applicant:c") is not None
+    assert second.keys["applicant:c"] == 2
+    assert first.post_members["p1"] == {"applicant:a", "applicant:b", "applicant:c"}
+    assert np.allclose(first.vector("applicant:b"), second.vector("applicant:b"))
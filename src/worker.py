@@ -0,0 +1,52 @@
+"""
+Applicant worker node for distributed ranking (RANKING_EXECUTION=distributed).
+
+Claims per-applicant tasks that process_ranking_request queues in Mongo and
+runs them; start it on as many machines as needed, all pointing at the same
+database. Run it from the repository root, like app.py (which reads
+src/.env relative to the working directory):
+
+    python src/worker.py --concurrency 4
+"""
+import argparse
+import logging
+import signal
+import threading
+
+import app
+from Monitoring import metrics
+from Ranking_System import job_checkpoints, task_queue
+
+logger = logging.getLogger("worker")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process queued applicant tasks")
+    parser.add_argument("--concurrency", type=int, default=app.MAX_WORKERS, help="tasks processed in parallel")
+    parser.add_argument("--worker-id", default=job_checkpoints.WORKER_ID)
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this port")
+    args = parser.parse_args()
+
+    if args.metrics_port:
+        metrics.serve(args.metrics_port)
+        logger.info(f"📈 Metrics on http://localhost:{args.metrics_port}/metrics")
+
+    stop = threading.Event()
+
+    def shutdown(signum, frame):
+        # In-flight tasks finish; anything left becomes visible to other nodes again
+        logger.info("🛑 Worker stopping after current tasks...")
+        stop.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    client = app.startup_db_client()
+    logger.info(f"👷 Worker {args.worker_id} started with {args.concurrency} slots")
+    try:
+        task_queue.run_worker(
+            client[app.db_name], app.process_applicant_task,
+            worker_id=args.worker_id, concurrency=args.concurrency, stop=stop,
+        )
+    finally:
+        client.close()
+    logger.info("👋 Worker stopped")